@@ -9,5 +9,9 @@ setup(
         # "mimetypes",
         # "xml",
         # "http"
-    ]
+    ],
+    extras_require={
+        "async": ["aiohttp"],
+        "table": ["numpy", "pandas"],
+    }
 )
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Asynchronous interface to the ELisA logbook database.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : asyncElisa.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : AsyncElisa
+# Description   : asyncio interface to the ELisA logbook database.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: add timeouts.
+# 18/Oct/2026: add getTransferStats().
+# 18/Oct/2026: add pluggable wire codec.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+from elisa_client_api.core.asyncRestServer import AsyncRestServer
+from elisa_client_api.core.authentication import Authentication
+from elisa_client_api.core.transport import DEFAULT_TIMEOUT
+
+
+class AsyncElisa(object):
+    """ asyncio interface to the ELisA logbook database.
+
+    Provides the same methods as Elisa, as coroutines running on a
+    non-blocking transport, so that many logbook calls can be in flight
+    from a single event loop. The responses are decoded in worker threads. It requires the aiohttp package.
+
+    Usage:
+        async with AsyncElisa(connection, ssocookie=path) as elisa:
+            messages = await asyncio.gather(*[elisa.getMessage(i) for i in ids])
+    """
+    def __init__(self, connection, username=None, password=None, ssocookie=None, poolSize=100,
+                 timeout=DEFAULT_TIMEOUT, codec=None):
+        """ Constructor
+
+        connection: connection to the logbook database back-end.
+        username: user name to be used by ldap.
+        password: password to be used with ldap.
+        ssocookie: file with the sso-cookie created by auth-get-sso-cookie
+        poolSize: maximum number of simultaneous connections to the server.
+        timeout: seconds to wait for the server on each request, either a
+                 number or a (connect, read) tuple. None waits forever.
+        codec: object of type Codec with the wire format, e.g. JsonCodec()
+               for servers offering JSON. If None, XML is used (XmlCodec).
+        """
+        authentication = Authentication(username, password, ssocookie)
+        self._server = AsyncRestServer(connection, authentication, poolSize, timeout, codec)
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await self.close()
+
+    # -----------------------------
+    # - Public methods: Interface -
+    # -----------------------------
+    async def getMessage(self, msgId):
+        """ Retrieves the logbook message with the given ID.
+
+        msgId: the message ID.
+        Returns: an object of type MessageRead encapsulating the message
+                 with the given ID.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return await self._server.getMessage(msgId)
+
+
+    async def getAttachment(self, msgId, attachmentId):
+        """ Retrieves the attachment with the given ID for the given message ID.
+
+        msgId: message ID of the attachment to retrieve.
+        attachmentId: the attachment ID
+        Returns: the attachment.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return await self._server.getAttachment(msgId, attachmentId)
+
+
+    async def getAttachments(self, message):
+        """ Retrieves all the attachments for a logbook message.
+
+        message: object of type MessageRead with the attachment to retrieve.
+        Returns: a list of tuples with the id, name and content of the attachments.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return await self._server.getAttachments(message)
+
+
+    async def searchMessages(self, criteria, showAttributes=False):
+        """ Retrieves the logbook messages that match the given search criteria.
+
+        criteria: object of type SearchCriteria specifying the search
+                  filter.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        Returns: a list of objects of type MessageRead encapsulating
+                 the messages that meet the search criteria.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return await self._server.searchMessages(criteria, showAttributes)
+
+
+    async def insertMessage(self, message):
+        """ Inserts a logbook message into the ELisA back-end database.
+
+        message: object of type MessageInsert to be inserted into the database.
+        Returns: an object of type MessageRead encapsulating the message
+                 inserted into the database.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return await self._server.insertMessage(message)
+
+
+    async def updateMessage(self, message):
+        """ Updates a logbook message.
+
+        message: object of type MessageUpdate to be inserted into the database.
+        Returns: an object of type MessageRead encapsulating the message
+                 updated into the database.
+        Throws: ElisaError if updating the message fails.
+        """
+        return await self._server.updateMessage(message)
+
+
+    async def replyToMessage(self, message):
+        """ Replies to a logbook message.
+
+        message: object of type MessageReply to be inserted into the
+                 database.
+        Returns: an object of type MessageRead encapsulating the message
+                 inserted into the database.
+        Throws: ElisaError if the reply message could not be inserted.
+        """
+        return await self._server.replyToMessage(message)
+
+
+    async def getMessageType(self, msgType=None):
+        """ Retrieves the possible message types or the options for
+        a message type is specified in the argument.
+
+        msgType: a message type.
+        Returns: a list of message types or a dictionary with the options
+                 associated to a specific type.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        if msgType == None:
+            return await self._server.getMessageTypes()
+        else:
+            return await self._server.getTypeOptions(msgType)
+
+
+    async def getSystemsAffected(self, msgType=None):
+        """ Retrieves the possible systems affected or the predefined
+        systems affected for a given message type if that type is
+        specified in the argument.
+
+        msgType: a message type.
+        Returns: a list of possible systems affected or a list of
+                 predefined systems affected for a given message type.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        if msgType == None:
+            return await self._server.getSystemsAffected()
+        else:
+            return await self._server.getPredefinedSystemsAffected(msgType)
+
+
+    def getTransferStats(self):
+        """ Retrieves the transfer counters since this object was created.
+
+        Responses are requested compressed (gzip or deflate) and decoded
+        transparently, as with Elisa.
+
+        Returns: a dictionary with the number of responses received
+                 ('responses'), the size of their bodies as received over
+                 the wire ('wireBytes') and after decompression
+                 ('decodedBytes').
+        """
+        return self._server.getTransferStats()
+
+
+    async def close(self):
+        """ Closes the connections to the ELisA logbook.
+        """
+        await self._server.close()
+
+
+    # ---------------------------
+    # - Private data attributes -
+    # ---------------------------
+    _server = None  # ELisA server.
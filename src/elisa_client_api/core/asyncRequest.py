@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Asynchronous HTTP request
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : asyncRequest.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : AsyncRequest
+# Description   : Encapsulates the functionality to perform HTTP requests without
+#                 blocking the asyncio event loop.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: detect the SSO sign-in page without decoding the responses.
+# 18/Oct/2026: map the attachments that cannot be opened and the timeouts.
+# 18/Oct/2026: decode compressed responses and count the bytes transferred.
+# 18/Oct/2026: add the media type of the codec.
+#--------------------------------------------------------------------------------------
+
+from builtins import str
+from builtins import object
+import os
+import asyncio
+import mimetypes
+import urllib.parse
+import zlib
+import aiohttp
+
+from .request import isSsoSignInPage
+from elisa_client_api.exception import RestServerError, FileError
+
+
+# Content encodings the responses may be compressed with. The session does
+# not decompress them itself (auto_decompress=False), so that the bytes
+# received over the wire can be counted.
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+def decodeContent(content, contentEncoding):
+    """ Returns the body of a response decompressed.
+
+    content: body as received (bytes).
+    contentEncoding: value of the Content-Encoding header, or None.
+    Throws: RestServerError if the body cannot be decompressed.
+    """
+    encoding = (contentEncoding or 'identity').strip().lower()
+    try:
+        if encoding == 'identity':
+            return content
+        if encoding in ('gzip', 'x-gzip'):
+            return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        if encoding == 'deflate':
+            # Some servers send raw deflate data, without zlib header.
+            try:
+                return zlib.decompress(content)
+            except zlib.error:
+                return zlib.decompress(content, -zlib.MAX_WBITS)
+    except zlib.error as ex:
+        raise RestServerError("the response could not be decompressed: " + str(ex))
+    raise RestServerError("unsupported content encoding: " + str(contentEncoding))
+
+
+class AsyncRequest(object):
+    """ Encapsulates the functionality to perform HTTP requests as coroutines.
+    """
+    def __init__(self, url, authentication, session, mediaType='application/xml', record=None):
+        """ Constructor
+
+        url: URL to make the request to.
+        authentication: object of type Authentication.
+        session: object of type aiohttp.ClientSession whose pooled
+                 connections are used. It must not decompress the
+                 responses (auto_decompress=False).
+        mediaType: media type of the messages sent and accepted.
+        record: function called with the size of the body received over
+                the wire and after decompression, or None.
+        """
+        self.__url = url
+        self.__authentication = authentication
+        self.__session = session
+        self.__mediaType = mediaType
+        self.__record = record
+
+    # -----------------------------
+    # - Public methods: Interface -
+    # -----------------------------
+    async def get(self):
+        """ Makes a get request.
+
+        Returns: the data returned by the server.
+        Throws: RestServerError if the request fails.
+        """
+        headers = {'Accept': self.__mediaType}
+        return await self._send('GET', headers)
+
+
+    async def post(self, message):
+        """ Makes a post request to insert a message.
+
+        message: message to insert/post.
+        Returns: the data returned by the server.
+        Throws: RestServerError if the request fails.
+        """
+        headers = {'Content-Type': self.__mediaType, 'Accept': self.__mediaType}
+        return await self._send('POST', headers, message)
+
+
+    async def put(self, message):
+        """ Makes a put request to update a message.
+
+        message: message to update/post.
+        Returns: the data returned by the server.
+        Throws: RestServerError if the request fails.
+        """
+        headers = {'Content-Type': self.__mediaType, 'Accept': self.__mediaType}
+        return await self._send('PUT', headers, message)
+
+
+    async def multipart(self, message=None, attachments=None):
+        """ Makes a multipart request to insert a message and/or attachments.
+
+        message: a tuple containing the message to insert/post and the
+                 content disposition name.
+        attachments: attachments to insert.
+        Returns: the data returned by the server.
+        Throws: RestServerError if the request fails.
+                FileError if any of the attachment cannot be opened.
+        """
+        form = aiohttp.FormData()
+        if message != None:
+            # Passed as text: aiohttp sends bytes as a file, unlike the
+            # synchronous Request.
+            form.add_field(message[1], message[0].decode('utf-8'), content_type=self.__mediaType)
+        files = list()
+        try:
+            for count, attachment in enumerate(attachments or []):
+                try:
+                    files.append(open(attachment, 'rb'))
+                except OSError as ex:
+                    raise FileError("The attachment could not be opened: " + str(ex))
+                form.add_field('file' + str(count), files[-1],
+                               filename=os.path.basename(attachment),
+                               content_type=mimetypes.guess_type(attachment)[0] or 'application/octet-stream')
+            return await self._send('POST', {}, form, ssl=False)
+        finally:
+            for f in files:
+                f.close()
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    async def _send(self, method, headers, data=None, ssl=True):
+        """ Sends a request through the session and checks the HTTP status.
+
+        Returns: the data returned by the server.
+        Throws: RestServerError if the request fails.
+        """
+        headers.update(self.__authentication.getHeaders())
+        headers['Accept-Encoding'] = ACCEPT_ENCODING
+        try:
+            async with self.__session.request(method, self.__url, headers=headers, data=data, ssl=ssl) as response:
+                raw = await response.read()
+                contentEncoding = response.headers.get('Content-Encoding')
+                status = response.status
+                reason = response.reason
+                contentType = response.headers.get('Content-Type')
+                redirected = (len(response.history) > 0 and urllib.parse.urlsplit(str(response.url)).netloc !=
+                              urllib.parse.urlsplit(self.__url).netloc)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            raise RestServerError(str(ex) or type(ex).__name__)
+
+        content = decodeContent(raw, contentEncoding)
+        if self.__record != None:
+            self.__record(len(raw), len(content))
+        if status >= 400:
+            raise RestServerError("HTTP Error " + str(status) + ": " + str(reason) +
+                                  ". REST server error: " + content.decode(errors='replace'))
+        # Same detection as the synchronous Request.
+        if isSsoSignInPage(contentType, content, redirected):
+            raise RestServerError("SSO authentication failed")
+        return content
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Asynchronous ELisA REST server
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : asyncRestServer.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : AsyncRestServer
+# Description   : Accesses the ELisA logbook backend database through the REST server
+#                 using coroutines.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: apply the timeouts of the synchronous transport.
+# 18/Oct/2026: count the bytes transferred.
+# 18/Oct/2026: pluggable wire codec, decode the responses in worker threads.
+#--------------------------------------------------------------------------------------
+
+from builtins import str
+from builtins import object
+import asyncio
+import functools
+import urllib.parse
+import aiohttp
+
+from .asyncRequest import AsyncRequest
+from .restServer import buildReply
+from .codec import XmlCodec
+from .transport import DEFAULT_TIMEOUT
+from elisa_client_api.exception import RestServerError
+
+
+class AsyncRestServer(object):
+    """ Accesses the ELisA logbook backend database through the REST server
+    without blocking the event loop.
+
+    The methods follow those of RestServer but are coroutines. The
+    responses are decoded in the default executor of the event loop, so
+    that parsing large results does not block the other coroutines.
+    """
+
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, url, authentication, poolSize=100, timeout=DEFAULT_TIMEOUT, codec=None):
+        """ Constructor
+
+        url: URL of the REST server.
+        authentication: object of type Authentication.
+        poolSize: maximum number of simultaneous connections to the server.
+        timeout: seconds to wait for the server, either a number or a
+                 (connect, read) tuple, as for Transport. The read timeout
+                 applies to each read from the connection. None waits
+                 forever.
+        codec: object of type Codec with the wire format. If None, XML is
+               used (XmlCodec).
+        """
+        self.__url = url
+        self.__authentication = authentication
+        self.__poolSize = poolSize
+        self.__timeout = timeout
+        self.__codec = codec if codec != None else XmlCodec()
+        self.__responses = 0
+        self.__wireBytes = 0
+        self.__decodedBytes = 0
+        # The session must be created from within the event loop, so it is
+        # created on first use.
+        self.__session = None
+
+
+    async def close(self):
+        """ Closes the connections kept alive by the session.
+        """
+        if self.__session != None:
+            await self.__session.close()
+            self.__session = None
+
+
+    def record(self, wireBytes, decodedBytes):
+        """ Accounts for a response received.
+
+        wireBytes: size of the body as received over the wire.
+        decodedBytes: size of the body after decompression.
+        """
+        # All the coroutines run in the thread of the event loop.
+        self.__responses += 1
+        self.__wireBytes += wireBytes
+        self.__decodedBytes += decodedBytes
+
+
+    def getTransferStats(self):
+        """ Returns the transfer counters.
+
+        Returns: a dictionary with the number of responses and their size
+                 over the wire and after decompression.
+        """
+        return {'responses': self.__responses,
+                'wireBytes': self.__wireBytes,
+                'decodedBytes': self.__decodedBytes}
+
+
+    async def getMessage(self, msgId):
+        """ Queries the REST server to retrieve the logbook message with
+        the given ID.
+
+        msgId: the message ID.
+        Returns: an object of type MessageRead.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + "messages/" + str(msgId) + "/"
+        msgXml = await self._request(url).get()
+        return await self._decode(self.__codec.decode, msgXml)
+
+
+    async def getAttachment(self, msgId, attachId):
+        """ Queries the REST server to retrieve an attachment associated to
+        a messages.
+
+        msgId: message ID of the attachment to retrieve.
+        attachId: the attachment ID.
+        Returns: the attachment.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + "messages/" + str(msgId) + "/attachments/" + str(attachId)
+        return await self._request(url).get()
+
+
+    async def getAttachments(self, message):
+        """ Queries the REST server to retrieve all the attachments of a
+        message. The attachments are retrieved concurrently.
+
+        message: object of type MessageRead with the attachments to retrieve.
+        Returns: a list of tuples with the id, name and content of the attachments.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        attachments = message.attachments or []
+        contents = await asyncio.gather(*[self.getAttachment(message.id, attachment[0])
+                                          for attachment in attachments])
+        return [(attachment[0], attachment[1], content)
+                for attachment, content in zip(attachments, contents)]
+
+
+    async def searchMessages(self, criteria, showAttributes):
+        """ Queries the REST server to retrieve the messages based
+        on a search criteria.
+
+        criteria: object of type Criteria specifying the search filter.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        Returns: a list of objects of type MessageRead.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + "messages?" + urllib.parse.urlencode(criteria.getDict())
+        msgXml = await self._request(url).get()
+        return await self._decode(self.__codec.decode, msgXml)
+
+
+    async def insertMessage(self, message):
+        """ Queries the REST server to insert a message into the logbook.
+
+        message: object of type MessageInsert.
+        Returns: an object of type MessageRead.
+        Throws: RestServerError if inserting the text message fails.
+        """
+        msgInsertXml = self.__codec.encode(message, "input_message")
+        url = self.__url + "messages/"
+
+        if not message.attachments or len(message.attachments) == 0:
+            msgReadXml = await self._request(url).post(msgInsertXml)
+        else:
+            msgReadXml = await self._request(url).multipart((msgInsertXml, 'message'), message.attachments)
+
+        return await self._decode(self.__codec.decode, msgReadXml)
+
+
+    async def updateMessage(self, message):
+        """ Queries the REST server to updates a logbook message.
+
+        message: object of type MessageUpdate.
+        Returns: an object of type MessageRead.
+        Throws: RestServerError if updating the message fails.
+        """
+        if not message.body and not message.attachments and not message.date:
+            return ""
+
+        if message.body:
+            msgInsertXml = self.__codec.encode(message, "message_body")
+            url = self.__url + 'messages/' + str(message.id) + '/body'
+
+            if message.attachments and len(message.attachments) > 0:
+                msgReadXml = await self._request(url).multipart((msgInsertXml, 'body'), message.attachments)
+            else:
+                msgReadXml = await self._request(url).put(msgInsertXml)
+        elif message.date:
+            url = self.__url + 'messages/' + str(message.id) + '/date'
+            msgReadXml = await self._request(url).put(message.date.encode('utf-8'))
+        else:
+            url = self.__url + 'messages/' + str(message.id) + '/attachments'
+            msgReadXml = await self._request(url).multipart(attachments=message.attachments)
+
+        return await self._decode(self.__codec.decode, msgReadXml)
+
+
+    async def replyToMessage(self, message):
+        """ Queries the REST server to insert a reply.
+
+        message: object of type MessageReply.
+        Returns: an object of type MessageRead.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        rootMsg = await self.getMessage(message.id)
+        msgInsert = buildReply(message, rootMsg)
+
+        msgReplyXml = self.__codec.encode(msgInsert, "input_message")
+        url = self.__url + "messages/" + str(message.id)
+
+        if not msgInsert.attachments or len(msgInsert.attachments) == 0:
+            msgReadXml = await self._request(url).post(msgReplyXml)
+        else:
+            msgReadXml = await self._request(url).multipart((msgReplyXml, 'message'), msgInsert.attachments)
+
+        return await self._decode(self.__codec.decode, msgReadXml)
+
+
+    async def getMessageTypes(self):
+        """ Queries the REST server to retrieve the message types.
+
+        Returns: a list of message types.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        typesXml = await self._request(self.__url + "mt").get()
+        return await self._decode(self.__codec.decodeMessageTypes, typesXml)
+
+
+    async def getTypeOptions(self, msgType):
+        """ Queries the REST server to retrieve the options for
+        a given message type.
+
+        msgType: the message type.
+        Returns: a list of options.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + "mt/" + urllib.parse.quote(msgType) + "/opt"
+        retval = ""
+        try:
+            typesXml = await self._request(url).get()
+            retval = await self._decode(self.__codec.decodeMessageTypeOptions, typesXml)
+        except RestServerError as ex:
+            # A 404 means the type does not have any associated options.
+            if 'HTTP Error 404' not in ex.__str__():
+                raise ex
+
+        return retval
+
+
+    async def getSystemsAffected(self):
+        """ Queries the REST server to retrieve the possible systems
+        affected.
+
+        Returns: a list of possible systems affected.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        saXml = await self._request(self.__url + "sa").get()
+        return await self._decode(self.__codec.decodeSystemsAffected, saXml)
+
+
+    async def getPredefinedSystemsAffected(self, msgType):
+        """ Queries the REST server to retrieve the predefined systems
+        affected for a given message type.
+
+        msgType: a message type.
+        Returns: a list of predefined systems affected for a message type.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + 'mt/' + urllib.parse.quote(msgType) + '/sa'
+        retval = ""
+        try:
+            saXml = await self._request(url).get()
+            retval = await self._decode(self.__codec.decodeSystemsAffected, saXml)
+        except RestServerError as ex:
+            # A 404 means the type does not have any predefined systems affected.
+            if 'HTTP Error 404' not in ex.__str__():
+                raise ex
+
+        return retval
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _request(self, url):
+        if self.__session == None:
+            connector = aiohttp.TCPConnector(limit=self.__poolSize)
+            self.__session = aiohttp.ClientSession(connector=connector, timeout=self._getClientTimeout(),
+                                                   auto_decompress=False)
+        return AsyncRequest(url, self.__authentication, self.__session, self.__codec.mediaType, self.record)
+
+
+    async def _decode(self, decode, data):
+        # Parsing is CPU bound: it runs in a worker thread, not in the event
+        # loop.
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(decode, data))
+
+
+    def _getClientTimeout(self):
+        # Same semantics as the timeouts of requests: no limit on the whole
+        # request, only on connecting and on each read.
+        timeout = self.__timeout
+        if timeout == None:
+            return aiohttp.ClientTimeout(total=None)
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        return aiohttp.ClientTimeout(total=None, sock_connect=timeout[0], sock_read=timeout[1])
@@ -16,6 +16,7 @@
 #--------------------------------------------------------------------------------------
 # Modification history:
 # 18/Dec/2012: created.
+# 18/Oct/2026: getHeaders() returns the authentication headers for the asyncio client.
 #--------------------------------------------------------------------------------------
 
 from future import standard_library
@@ -71,10 +72,15 @@ class Authentication(object):
     def addAuthenticationPy3(self,req):
         """ Adds the appropriate authentication header in the http request.
         """
+        req.headers.update(self.getHeaders())
+
+    def getHeaders(self):
+        """ Returns the authentication headers as a dictionary.
+        """
         if self.__ssocookie != None:
-            req.headers['Cookie'] = self.__ssocookie
+            return {'Cookie': self.__ssocookie}
         else:
-            req.headers['Authorization'] = "Basic %s" % self._getEncodedCredentials().decode()
+            return {'Authorization': "Basic %s" % self._getEncodedCredentials().decode()}
 
 
     # -------------------
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : HTTP validator cache
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : cache.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : ValidatorCache
+# Description   : Cache of parsed REST server responses revalidated with conditional
+#                 requests.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: cached objects are no longer shared with the callers.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+import collections
+import threading
+
+
+class ValidatorCache(object):
+    """ Cache of parsed REST server responses.
+
+    Each entry holds the validators returned by the server (ETag and
+    Last-Modified headers) and the object parsed from the response. The
+    next request for the same URL sends the validators (If-None-Match and
+    If-Modified-Since headers); if the server answers 304 Not Modified the
+    cached object is reused, without downloading or parsing anything.
+    RestServer returns a copy of it, which callers are free to modify.
+
+    The least recently used entries are evicted once 'maxEntries' is reached.
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, maxEntries=1000):
+        """ Constructor
+
+        maxEntries: maximum number of responses kept.
+        """
+        self.__maxEntries = maxEntries
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+
+    def get(self, url):
+        """ Returns the entry for a URL.
+
+        url: URL of the request.
+        Returns: a tuple with the ETag, the Last-Modified date and the parsed
+                 object, or None if the URL is not cached.
+        """
+        with self.__lock:
+            entry = self.__entries.get(url)
+            if entry != None:
+                self.__entries.move_to_end(url)
+            return entry
+
+
+    def put(self, url, etag, lastModified, value):
+        """ Stores the parsed object of a response with its validators.
+
+        url: URL of the request.
+        etag: value of the ETag header, or None.
+        lastModified: value of the Last-Modified header, or None.
+        value: the object parsed from the response.
+        """
+        # Without validators the response cannot be revalidated.
+        if etag == None and lastModified == None:
+            return
+        with self.__lock:
+            self.__entries[url] = (etag, lastModified, value)
+            self.__entries.move_to_end(url)
+            while len(self.__entries) > self.__maxEntries:
+                self.__entries.popitem(last=False)
+
+
+    def clear(self):
+        """ Removes all the entries.
+        """
+        with self.__lock:
+            self.__entries.clear()
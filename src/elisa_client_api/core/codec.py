@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Wire codecs
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : codec.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : Codec, XmlCodec, JsonCodec
+# Description   : Classes encoding the messages sent to the REST server and decoding
+#                 the messages and configuration it returns.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: decode search results into columnar tables.
+# 18/Oct/2026: make Codec an abstract base class.
+#--------------------------------------------------------------------------------------
+
+from builtins import str
+from builtins import object
+from future.utils import with_metaclass
+import abc
+import json
+
+from .serializer import Serializer, FormatterError, INTERNED_FIELDS
+from .intern import InternPool
+from elisa_client_api.core.message import Message
+from elisa_client_api.messageRead import MessageRead
+
+
+class Codec(with_metaclass(abc.ABCMeta, object)):
+    """ Interface of the wire formats understood by the REST server.
+
+    A codec encodes the messages to insert or update, decodes the messages
+    and the configuration lists returned, and tells the media type used in
+    the Accept and Content-Type headers. Codecs must implement all the
+    abstract methods to be instantiated.
+    """
+    # Media type of the encoded data.
+    mediaType = None
+
+    @abc.abstractmethod
+    def encode(self, message, topNodeName):
+        """ Encodes a message to send to the server.
+
+        message: object of type MessageInsert or MessageUpdate.
+        topNodeName: name of the top level node, e.g. "input_message".
+        Returns: the encoded message (bytes).
+        Throws: FormatterError if encoding the message fails.
+        """
+
+
+    @abc.abstractmethod
+    def decode(self, data, lazy=False):
+        """ Decodes one message or a list of messages.
+
+        data: the encoded message(s).
+        lazy: if true and supported, the fields are decoded on first access.
+        Returns: one object of type MessageRead or a list of these objects.
+        Throws: FormatterError if decoding the messages fails.
+        """
+
+
+    @abc.abstractmethod
+    def iterDecode(self, chunks, lazy=False):
+        """ Decodes a list of messages received in chunks.
+
+        chunks: an iterable over the pieces (bytes) of the encoded messages.
+        lazy: if true and supported, the fields are decoded on first access.
+        Returns: an iterator over objects of type MessageRead.
+        Throws: FormatterError if decoding the messages fails.
+        """
+
+
+    def decodeTable(self, chunks, table):
+        """ Appends to a columnar table a list of messages received in chunks.
+
+        The default implementation decodes the messages and appends them
+        one by one. Codecs may fill the table directly instead.
+
+        chunks: an iterable over the pieces (bytes) of the encoded messages.
+        table: object of type MessageTable.
+        Returns: the table.
+        Throws: FormatterError if decoding the messages fails.
+        """
+        for message in self.iterDecode(chunks):
+            table.appendMessage(message)
+        return table
+
+
+    @abc.abstractmethod
+    def decodeMessageTypes(self, data):
+        """ Returns the list of message types. """
+
+
+    @abc.abstractmethod
+    def decodeMessageTypeOptions(self, data):
+        """ Returns the list of options of a message type, as dictionaries
+        with the keys 'name', 'type', 'comment', 'possible_values' and
+        'options' (the inner options).
+        """
+
+
+    @abc.abstractmethod
+    def decodeSystemsAffected(self, data):
+        """ Returns the list of systems affected. """
+
+
+class XmlCodec(Codec):
+    """ XML wire format, the native format of the ELisA REST server.
+    """
+    mediaType = 'application/xml'
+
+    def __init__(self, internPool=None):
+        """ Constructor
+
+        internPool: object of type InternPool shared by all the messages
+                    decoded. If None, values are shared within each result.
+        """
+        self.__internPool = internPool
+
+    def encode(self, message, topNodeName):
+        return Serializer(self.__internPool).serialize(message, topNodeName)
+
+    def decode(self, data, lazy=False):
+        return Serializer(self.__internPool).deserialize(data, lazy)
+
+    def iterDecode(self, chunks, lazy=False):
+        return Serializer(self.__internPool).iterDeserialize(chunks, lazy)
+
+    def decodeTable(self, chunks, table):
+        return Serializer(self.__internPool).deserializeTable(chunks, table)
+
+    def decodeMessageTypes(self, data):
+        return Serializer(self.__internPool).deserializeMessageTypes(data)
+
+    def decodeMessageTypeOptions(self, data):
+        return Serializer(self.__internPool).deserializeMessageTypeOptions(data)
+
+    def decodeSystemsAffected(self, data):
+        return Serializer(self.__internPool).deserializeSystemsAffected(data)
+
+
+class JsonCodec(Codec):
+    """ JSON wire format, for servers or local stand-ins offering it.
+
+    The documents mirror the XML ones, with the same field names:
+      - a message is an object, e.g. {"id": 1, "subject": "...",
+        "systems_affected": ["DAQ"], "options": [{"name": "...",
+        "value": "...", "options": [...]}], "attachments": [{"ID": 1,
+        "filename": "...", "link": "..."}]};
+      - a list of messages is an array of messages or an object with a
+        "messages" array;
+      - a message sent is wrapped in an object keyed by the top level node,
+        e.g. {"input_message": {...}};
+      - configuration lists are arrays, or objects with a single array
+        ("message_types", "systems_affected", "options").
+    Scalar values are returned as strings, as with XML. Documents are
+    decoded as a whole, lazy decoding is not supported.
+    """
+    mediaType = 'application/json'
+
+    # Fields by server name: (attribute name, field class, field name).
+    _fieldsByName = dict((field[2], field) for field in Message._FIELDS)
+
+    def __init__(self, internPool=None):
+        """ Constructor
+
+        internPool: object of type InternPool shared by all the messages
+                    decoded. If None, values are shared within each result.
+        """
+        self.__internPool = internPool
+
+
+    def encode(self, message, topNodeName):
+        fields = dict()
+        for attrName in message.getFieldNames():
+            field = getattr(message, attrName)
+            name = field.name.decode('utf-8')
+            # Attachments are never serialized because its insertion follows
+            # a different path.
+            if not field.value or name == 'attachments':
+                continue
+            fields[name] = field.value if isinstance(field.value, list) else str(field.value)
+        return json.dumps({topNodeName: fields}).encode('utf-8')
+
+
+    def decode(self, data, lazy=False):
+        document = self._load(data)
+        intern = self._getPool().intern
+        if isinstance(document, dict) and 'messages' not in document:
+            return self._decodeMessage(document, intern)
+        return [self._decodeMessage(fields, intern) for fields in self._getList(document, 'messages')]
+
+
+    def iterDecode(self, chunks, lazy=False):
+        # The standard json module cannot parse incrementally.
+        messages = self.decode(b''.join(chunks))
+        if isinstance(messages, MessageRead):
+            messages = [messages]
+        for message in messages:
+            yield message
+
+
+    def decodeMessageTypes(self, data):
+        return [self._toStr(value) for value in self._getList(self._load(data), 'message_types')]
+
+
+    def decodeMessageTypeOptions(self, data):
+        opts = list()
+        for option in self._getList(self._load(data), 'options'):
+            optionVals = self._decodeTypeOption(option)
+            listInnerOpts = [self._decodeTypeOption(innerOption) for innerOption in option.get('options') or []]
+            optionVals['options'] = listInnerOpts if len(listInnerOpts) > 0 else ""
+            opts.append(optionVals)
+        return opts
+
+
+    def decodeSystemsAffected(self, data):
+        return [self._toStr(value) for value in self._getList(self._load(data), 'systems_affected')]
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _getPool(self):
+        return self.__internPool if self.__internPool != None else InternPool()
+
+
+    def _load(self, data):
+        try:
+            return json.loads(data.decode('utf-8') if isinstance(data, bytes) else data)
+        except ValueError as ex:
+            raise FormatterError(str(ex))
+
+
+    def _getList(self, document, key):
+        # Lists come either as arrays or wrapped in an object.
+        if isinstance(document, dict):
+            document = document.get(key)
+        if not isinstance(document, list):
+            raise FormatterError("expected a list of " + key)
+        return document
+
+
+    def _toStr(self, value):
+        return str(value) if value != None else None
+
+
+    def _decodeTypeOption(self, option):
+        return dict((k, self._toStr(option[k]) if k in option else "")
+                    for k in ['name', 'type', 'comment', 'possible_values'])
+
+
+    def _decodeMessage(self, fields, intern):
+        message = MessageRead()
+        for name, value in fields.items():
+            entry = self._fieldsByName.get(name)
+            if entry == None or value == None:
+                continue
+            if name == 'systems_affected':
+                value = [intern(self._toStr(system)) for system in value]
+            elif name == 'options':
+                value = [{'name': intern(self._toStr(option.get('name'))),
+                          'value': intern(self._toStr(option.get('value'))),
+                          'options': [{'name': intern(self._toStr(innerOption.get('name'))),
+                                       'value': intern(self._toStr(innerOption.get('value')))}
+                                      for innerOption in option.get('options') or []]}
+                         for option in value]
+            elif name == 'attachments':
+                value = [(self._toStr(attachment.get('ID')), self._toStr(attachment.get('filename')),
+                          self._toStr(attachment.get('link'))) for attachment in value]
+            elif name in INTERNED_FIELDS:
+                value = intern(self._toStr(value))
+            else:
+                value = self._toStr(value)
+            getattr(message, entry[0]).value = value
+        return message
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Concurrency helpers
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : concurrency.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         :
+# Description   : Helpers to run several requests to the REST server concurrently.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+#--------------------------------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def mapOrdered(function, items, workers):
+    """ Calls function(item) for each item using up to 'workers' threads.
+
+    Exceptions raised by the function are caught and returned so that one
+    failing item does not abort the others.
+
+    function: callable taking one item as argument.
+    items: list of arguments.
+    workers: maximum number of concurrent calls.
+    Returns: a list with one tuple (result, exception) per item, in the order
+             of the items. Either the result or the exception is None.
+    """
+    def call(item):
+        try:
+            return (function(item), None)
+        except Exception as ex:
+            return (None, ex)
+
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(call, items))
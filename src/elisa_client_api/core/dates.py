@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Dates of the messages
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : dates.py
+# Author        : DUNE DAQ
+# Created       : 18/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         :
+# Description   : Parsing of the ISO 8601 dates of the messages sent by the server.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 18/Oct/2026: created.
+#--------------------------------------------------------------------------------------
+
+import datetime
+import re
+
+
+# Format of the dates and times of the messages, without fraction of
+# second and time zone, e.g. 2012-12-14T12:27:17.
+ISO_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+_UTC = datetime.timezone.utc
+# Date and time, optional fraction of second and optional time zone: 'Z' or
+# an offset with or without colon.
+_ISO_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})(?:\.(\d+))?'
+                       r'(?:(Z)|([+-])(\d{2}):?(\d{2}))?$')
+
+
+def parseIsoDate(date):
+    """ Returns the datetime.datetime of an ISO 8601 date sent by the
+    server, e.g. '2012-12-14T12:27:17+01:00', '2012-12-14T11:27:17.250Z'.
+    Dates without time zone are taken as UTC.
+
+    It does not rely on datetime.fromisoformat(), which is not available
+    before Python 3.7 and does not accept 'Z' before Python 3.11.
+
+    date: a string.
+    Returns: a datetime.datetime with time zone.
+    Throws: ValueError if the string is not a valid date.
+    """
+    match = _ISO_DATE.match(date.strip())
+    if match == None:
+        raise ValueError("invalid ISO 8601 date: " + repr(date))
+    day, time, fraction, utc, sign, hours, minutes = match.groups()
+    parsed = datetime.datetime.strptime(day + 'T' + time, ISO_DATE_FORMAT)
+    if fraction != None:
+        parsed = parsed.replace(microsecond=int(fraction[:6].ljust(6, '0')))
+    if sign != None:
+        offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+        return parsed.replace(tzinfo=datetime.timezone(offset if sign == '+' else -offset))
+    return parsed.replace(tzinfo=_UTC)
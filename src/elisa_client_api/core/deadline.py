@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Operation deadline
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : deadline.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : Deadline
+# Description   : Time budget shared by all the requests of an operation.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+import time
+
+from elisa_client_api.exception import DeadlineExceededError
+
+
+class Deadline(object):
+    """ Time budget shared by all the requests of an operation.
+
+    Operations involving several requests (e.g. a reply, which retrieves the
+    original message and then inserts the reply, or the retrieval of all the
+    attachments of a message) pass the same deadline to each request, so the
+    whole operation finishes or fails within the budget.
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, seconds):
+        """ Constructor
+
+        seconds: time budget from now on.
+        """
+        self.__seconds = seconds
+        self.__expiry = time.monotonic() + seconds
+
+
+    @staticmethod
+    def after(seconds):
+        """ Returns a deadline expiring after the given number of seconds, or
+        None if seconds is None.
+        """
+        return Deadline(seconds) if seconds != None else None
+
+
+    def remaining(self):
+        """ Returns the time left in seconds, 0 if the deadline has expired.
+        """
+        return max(0.0, self.__expiry - time.monotonic())
+
+
+    def check(self):
+        """ Checks that the deadline has not expired.
+
+        Throws: DeadlineExceededError if the deadline has expired.
+        """
+        if self.expired:
+            raise DeadlineExceededError("the operation did not complete within " + str(self.__seconds) + " seconds")
+
+
+    def capTimeout(self, timeout):
+        """ Caps a requests timeout with the time left.
+
+        timeout: None, a number of seconds or a (connect, read) tuple.
+        Returns: a (connect, read) tuple not exceeding the time left.
+        """
+        remaining = self.remaining()
+        if timeout == None:
+            return (remaining, remaining)
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        return tuple(remaining if value == None else min(value, remaining) for value in timeout)
+
+    # --------------------
+    # - Property methods -
+    # --------------------
+    @property
+    def expired(self):
+        """ True once the time budget has been used up. """
+        return time.monotonic() >= self.__expiry
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : String interning pool
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : intern.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : InternPool
+# Description   : Pool sharing one string object among equal field values.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+
+
+class InternPool(object):
+    """ Pool sharing one string object among equal field values.
+
+    Fields such as the message type, the author or the systems affected
+    take a few hundred distinct values across many messages. Interning them
+    while deserializing keeps a single copy of each value, and equal values
+    compare by identity first.
+
+    Unlike sys.intern(), the pool is scoped: it is released together with
+    its owner (a result set or a client). Once 'maxEntries' values have been
+    pooled new values are returned as they are, so a field with unexpectedly
+    high cardinality cannot make the pool grow without bound.
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, maxEntries=100000):
+        """ Constructor
+
+        maxEntries: maximum number of distinct values pooled.
+        """
+        self.__maxEntries = maxEntries
+        self.__values = dict()
+
+
+    def __len__(self):
+        return len(self.__values)
+
+
+    def intern(self, value):
+        """ Returns the pooled string equal to 'value', pooling it if need be.
+
+        value: a string or None.
+        """
+        pooled = self.__values.get(value)
+        if pooled != None or value == None:
+            return pooled
+        if len(self.__values) >= self.__maxEntries:
+            return value
+        # setdefault() is atomic, concurrent callers get the same object.
+        return self.__values.setdefault(value, value)
+
+
+    def clear(self):
+        """ Removes all the pooled values.
+        """
+        self.__values.clear()
@@ -15,6 +15,8 @@
 #--------------------------------------------------------------------------------------
 # Modification history:
 # 05/Dec/2012: created.
+# 17/Oct/2026: class-level field registry instead of scanning dir() per object.
+# 17/Oct/2026: use __slots__.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
@@ -36,6 +38,36 @@ class Message(object):
 
     Accessors will be provided as needed in derived classes.
     """
+    #  The field name is the same as those use in the ELisA server.
+    #  This schema allows for generic code when serializing, deserializing
+    #  and printing the fields.
+    #  Registry of the fields: (attribute name, field class, field name).
+    _FIELDS = (('_id', SimpleField, 'id'),
+               ('_logbook', SimpleField, 'logbook'),
+               ('_username', SimpleField, 'username'),
+               ('_author', SimpleField, 'author'),
+               ('_date', SimpleField, 'date'),
+               ('_subject', SimpleField, 'subject'),
+               ('_message_type', SimpleField, 'message_type'),
+               ('_systems_affected', SystemsAffectedField, 'systems_affected'),
+               ('_options', OptionField, 'options'),
+               ('_body', SimpleField, 'body'),
+               ('_host', SimpleField, 'host'),
+               ('_has_replies', SimpleField, 'has_replies'),
+               ('_reply_to', SimpleField, 'reply_to'),
+               ('_has_attachments', SimpleField, 'has_attachments'),
+               ('_attachments', AttachmentField, 'attachments'),
+               ('_status', SimpleField, 'status'),
+               ('_thread_head', SimpleField, 'thread_head'),
+               ('_valid', SimpleField, 'valid'),
+               ('_encoding', SimpleField, 'encoding'))
+    #  Attribute names of the fields in alphabetical order, which is the
+    #  order used when serializing and printing.
+    _FIELD_NAMES = tuple(sorted(field[0] for field in _FIELDS))
+    #  Messages have no instance dictionary. Derived classes must define
+    #  __slots__ too.
+    __slots__ = tuple(field[0] for field in _FIELDS)
+
     # ------------------
     # - Public methods -
     # ------------------
@@ -43,29 +75,9 @@ class Message(object):
         # ---------------------------
         # - Private data attributes -
         # ---------------------------
-
-        #  The field name parameter is the same as those use in the ELisA server.
-        #  This schema allows for generic code when serializing, deserializing
-        #  and printing the fields.
-        self._id = SimpleField('id', id)
-        self._logbook = SimpleField('logbook')
-        self._username = SimpleField('username')
-        self._author = SimpleField('author')
-        self._date = SimpleField('date')
-        self._subject = SimpleField('subject')
-        self._message_type = SimpleField('message_type')
-        self._systems_affected = SystemsAffectedField('systems_affected')
-        self._options = OptionField('options')
-        self._body = SimpleField('body')
-        self._host = SimpleField('host')
-        self._has_replies = SimpleField('has_replies')
-        self._reply_to = SimpleField('reply_to')
-        self._has_attachments = SimpleField('has_attachments')
-        self._attachments = AttachmentField('attachments')
-        self._status = SimpleField('status')
-        self._thread_head = SimpleField('thread_head')
-        self._valid = SimpleField('valid')
-        self._encoding = SimpleField('encoding')
+        for attrName, fieldClass, name in self._FIELDS:
+            setattr(self, attrName, fieldClass(name))
+        self._id.value = str(id) if id != None else None
 
 
     def __str__(self):
@@ -77,10 +89,7 @@ class Message(object):
 
 
     def getFieldNames(self):
-        return [attr for attr in dir(self) if getattr(self, attr).__class__.__name__ == "SimpleField" \
-                                           or getattr(self, attr).__class__.__name__ == "AttachmentField" \
-                                           or getattr(self, attr).__class__.__name__ == "OptionField" \
-                                           or getattr(self, attr).__class__.__name__ == "SystemsAffectedField"]
+        return self._FIELD_NAMES
 
 
     def getTag(self):
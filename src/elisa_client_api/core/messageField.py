@@ -17,12 +17,47 @@
 # Modification history:
 # 05/Dec/2012: created.
 # 23/Jan/2013: use UTF8 for the name and value of the message fields.
+# 17/Oct/2026: add decode() returning the value of an XML node without
+#              redundant UTF8 round trips.
+# 17/Oct/2026: use __slots__ and share the encoded field names.
+# 17/Oct/2026: use lxml and compiled XPath.
+# 17/Oct/2026: optionally intern the decoded values.
+# 18/Oct/2026: decode empty and missing elements of attachments and options as None.
 #--------------------------------------------------------------------------------------
 
 from builtins import str
 from past.builtins import basestring
 from builtins import object
-import xml.etree.ElementTree as ET
+from lxml import etree
+
+
+# Compiled XPath expressions, evaluated in C.
+_SYSTEMS_AFFECTED = etree.XPath('system_affected')
+_ATTACHMENTS = etree.XPath('attachment')
+_OPTIONS = etree.XPath('option')
+_INNER_OPTIONS = etree.XPath('options/option')
+
+
+def _identity(value):
+    return value
+
+
+def _findText(node, tag):
+    # Unlike findtext(), which returns '' for an empty element, the value
+    # is None whether the element is empty or missing.
+    child = node.find(tag)
+    return child.text if child != None else None
+
+
+# Names of the fields encoded in UTF8, shared by all the fields with the
+# same name instead of being encoded again for every message.
+_encodedNames = dict()
+
+def _encodeName(name):
+    encoded = _encodedNames.get(name)
+    if encoded == None:
+        encoded = _encodedNames.setdefault(name, name.encode('utf-8'))
+    return encoded
 
 
 class SimpleField(object):
@@ -33,11 +68,13 @@ class SimpleField(object):
 
     Assume all fields are string type even those that only have numbers
     """
+    __slots__ = ('__name', '__value')
+
     # ------------------
     # - Public methods -
     # ------------------
     def __init__(self, name, value = None):
-        self.__name = name.encode('utf-8')
+        self.__name = _encodeName(name)
         self.__value = str(value) if value != None else None
 
     def __str__(self):
@@ -45,12 +82,22 @@ class SimpleField(object):
 
     def serialize(self, parentNode):
         if self.value:
-            node = ET.SubElement(parentNode, self.name.decode('utf-8'))
+            node = etree.SubElement(parentNode, self.name.decode('utf-8'))
             node.text = str(self.value)
 
     def deserialize(self, node):
         if node.text != None:
-            self.value = node.text.encode('utf-8').decode('utf-8')
+            self.value = node.text
+
+    @staticmethod
+    def decode(node, intern=None):
+        """ Returns the field value held by an XML node.
+
+        intern: function returning a shared copy of a string, or None.
+        """
+        if intern != None:
+            return intern(node.text)
+        return node.text
 
 
     # --------------------
@@ -67,12 +114,6 @@ class SimpleField(object):
     def value(self, value):
         self.__value = value
 
-    # ---------------------------
-    # - Private data attributes -
-    # ---------------------------
-    __name = None
-    __value = None
-
 
 class SystemsAffectedField(object):
     """ Class providing functionality to define the message systems
@@ -80,6 +121,8 @@ class SystemsAffectedField(object):
 
     This field contains a list with the systems affected names.
     """
+    __slots__ = ('__name', '__value')
+
     # Format:
     #  <systems_affected>
     #    <count> 2 </count>
@@ -94,7 +137,7 @@ class SystemsAffectedField(object):
         # ---------------------------
         # - Private data attributes -
         # ---------------------------
-        self.__name = name.encode('utf-8')
+        self.__name = _encodeName(name)
         self.__value = list()
 
     def __str__(self):
@@ -105,16 +148,26 @@ class SystemsAffectedField(object):
             return
 
         if len(self.value) > 0:
-            rootNode = ET.SubElement(parentNode, self.name.decode('utf-8'))
-            countNode = ET.SubElement(rootNode, 'count')
+            rootNode = etree.SubElement(parentNode, self.name.decode('utf-8'))
+            countNode = etree.SubElement(rootNode, 'count')
             countNode.text = str(len(self.value))
             for system in self.value:
-                sysNode = ET.SubElement(rootNode, 'system_affected')
+                sysNode = etree.SubElement(rootNode, 'system_affected')
                 sysNode.text = system
 
 
     def deserialize(self, node):
-        [self.value.append(child.text.encode('utf-8').decode('utf-8')) for child in node.findall('system_affected')]
+        self.value.extend(self.decode(node))
+
+    @staticmethod
+    def decode(node, intern=None):
+        """ Returns the field value held by an XML node.
+
+        intern: function returning a shared copy of a string, or None.
+        """
+        if intern != None:
+            return [intern(child.text) for child in _SYSTEMS_AFFECTED(node)]
+        return [child.text for child in _SYSTEMS_AFFECTED(node)]
 
     # --------------------
     # - Property methods -
@@ -137,6 +190,8 @@ class AttachmentField(object):
     This field contains a list of tuples with the following simple fields:
     filename, ID and link
     """
+    __slots__ = ('__name', '__value')
+
     # Format:
     #  <attachments>
     #    <count>1</count>
@@ -154,7 +209,7 @@ class AttachmentField(object):
         # ---------------------------
         # - Private data attributes -
         # ---------------------------
-        self.__name = name.encode('utf-8')
+        self.__name = _encodeName(name)
         self.__value = None
 
     def __str__(self):
@@ -180,11 +235,13 @@ class AttachmentField(object):
         pass
 
     def deserialize(self, node):
-        self.value = list()
-        [self.__value.append((child.find('ID').text.encode('utf-8').decode('utf-8'),
-                              child.find('filename').text.encode('utf-8').decode('utf-8'),
-                              child.find('link').text.encode('utf-8').decode('utf-8')))
-         for child in node.findall('attachment')]
+        self.value = self.decode(node)
+
+    @staticmethod
+    def decode(node):
+        """ Returns the field value held by an XML node. """
+        return [(_findText(child, 'ID'), _findText(child, 'filename'), _findText(child, 'link'))
+                for child in _ATTACHMENTS(node)]
 
 
     # --------------------
@@ -208,6 +265,8 @@ class OptionField(object):
     This field contains a list of tuples with the following fields:
     name, value, list of OptionField
     """
+    __slots__ = ('__name', '__value')
+
     # Format:
     #  <options>
     #    <count>1</count>
@@ -230,7 +289,7 @@ class OptionField(object):
         # ---------------------------
         # - Private data attributes -
         # ---------------------------
-        self.__name = name.encode('utf-8')
+        self.__name = _encodeName(name)
         self.__value = list()
 
 
@@ -259,39 +318,47 @@ class OptionField(object):
         if count == 0:
             return
         # First level
-        rootNode = ET.SubElement(parentNode, 'options')
+        rootNode = etree.SubElement(parentNode, 'options')
         for option in self.value:
-            optionNode = ET.SubElement(rootNode, 'option')
-            ET.SubElement(optionNode, 'name').text = str(option['name'])
-            ET.SubElement(optionNode, 'value').text = str(option['value'])
+            optionNode = etree.SubElement(rootNode, 'option')
+            etree.SubElement(optionNode, 'name').text = str(option['name'])
+            etree.SubElement(optionNode, 'value').text = str(option['value'])
             innerOptions = option.get('options', None)
             if innerOptions == None:
                 continue
             # Second level options
-            optionsNode = ET.SubElement(optionNode, 'options')
+            optionsNode = etree.SubElement(optionNode, 'options')
             for innerOption in innerOptions:
-                innerOptionNode = ET.SubElement(optionsNode, 'option')
-                ET.SubElement(innerOptionNode, 'name').text = str(innerOption['name'])
-                ET.SubElement(innerOptionNode, 'value').text = str(innerOption['value'])
-            ET.SubElement(optionsNode, 'count').text = str(len(innerOptions))
+                innerOptionNode = etree.SubElement(optionsNode, 'option')
+                etree.SubElement(innerOptionNode, 'name').text = str(innerOption['name'])
+                etree.SubElement(innerOptionNode, 'value').text = str(innerOption['value'])
+            etree.SubElement(optionsNode, 'count').text = str(len(innerOptions))
 
-        ET.SubElement(rootNode, 'count').text = str(count)
+        etree.SubElement(rootNode, 'count').text = str(count)
 
 
     def deserialize(self, node):
-        optionNodes = node.findall('option')
+        self.value.extend(self.decode(node))
+
+    @staticmethod
+    def decode(node, intern=None):
+        """ Returns the field value held by an XML node.
+
+        intern: function returning a shared copy of a string, or None.
+        """
+        if intern == None:
+            intern = _identity
+        options = list()
         # First level options
-        for option in optionNodes:
+        for option in _OPTIONS(node):
             # Second level options
-            listInnerOpts = list()
-            [[listInnerOpts.append( { 'name' : innerOptionNodes.find('name').text.encode('utf-8').decode('utf-8'),
-                                      'value' : innerOptionNodes.find('value').text.encode('utf-8').decode('utf-8') })
-              for innerOptionNodes in innerOptionsNode.findall('option')]
-             for innerOptionsNode in option.findall('options')]
-
-            self.value.append({ 'name' : option.find('name').text.encode('utf-8').decode('utf-8'),
-                               'value' : option.find('value').text.encode('utf-8').decode('utf-8'),
-                               'options' : listInnerOpts })
+            listInnerOpts = [{'name': intern(_findText(innerOption, 'name')),
+                              'value': intern(_findText(innerOption, 'value'))}
+                             for innerOption in _INNER_OPTIONS(option)]
+            options.append({'name': intern(_findText(option, 'name')),
+                            'value': intern(_findText(option, 'value')),
+                            'options': listInnerOpts})
+        return options
 
 
     # --------------------
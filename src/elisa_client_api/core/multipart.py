@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Multipart encoder
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : multipart.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : MultipartEncoder
+# Description   : Streaming encoder for multipart/form-data request bodies.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+#--------------------------------------------------------------------------------------
+
+from builtins import str
+from builtins import object
+import os
+import uuid
+import mimetypes
+
+from elisa_client_api.exception import FileError
+
+
+class MultipartEncoder(object):
+    """ Streaming encoder for multipart/form-data request bodies.
+
+    The encoder is a read-only file object. Files are read in chunks while
+    the body is sent, so the memory footprint does not depend on the size
+    of the attachments. Each file is opened only while its part is being
+    read and closed as soon as it has been sent; close() releases any file
+    still open, e.g. if the request fails half way.
+
+    Usage:
+        with MultipartEncoder() as body:
+            body.addField('message', xml, 'application/xml')
+            body.addFile('file0', path)
+            requests.post(url, data=body, headers={'Content-Type': body.contentType})
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self):
+        self.__boundary = uuid.uuid4().hex
+        # Parts of the body, either bytes or (path, size) for files.
+        self.__segments = list()
+        self.__length = 0
+        self.__index = 0
+        self.__buffer = b''
+        self.__file = None
+        self.__closed = False
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+    def __len__(self):
+        return self.__length + len(self._closingBoundary())
+
+
+    def addField(self, name, value, contentType=None):
+        """ Adds a field held in memory.
+
+        name: content disposition name of the field.
+        value: bytes or string with the field value.
+        contentType: MIME type of the field.
+        """
+        if not isinstance(value, bytes):
+            value = str(value).encode('utf-8')
+        self._addSegment(self._partHeader(name, None, contentType))
+        self._addSegment(value)
+        self._addSegment(b'\r\n')
+
+
+    def addFile(self, name, path, contentType=None):
+        """ Adds a file read in chunks while the body is sent.
+
+        name: content disposition name of the field.
+        path: path of the file.
+        contentType: MIME type of the file. Guessed from the name if None.
+        Throws: FileError if the file cannot be accessed.
+        """
+        try:
+            size = os.path.getsize(path)
+        except OSError as ex:
+            raise FileError("The attachment could not be opened: " + str(ex))
+        if contentType == None:
+            contentType = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self._addSegment(self._partHeader(name, os.path.basename(path), contentType))
+        self.__segments.append((path, size))
+        self.__length += size
+        self._addSegment(b'\r\n')
+
+
+    def read(self, size=-1):
+        """ Reads up to 'size' bytes of the encoded body (all if negative).
+        """
+        chunks = list()
+        remaining = size
+        while remaining != 0:
+            chunk = self._readSegment(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+        return b''.join(chunks)
+
+
+    def close(self):
+        """ Closes any file still open.
+        """
+        if self.__file != None:
+            self.__file.close()
+            self.__file = None
+        self.__closed = True
+
+    # --------------------
+    # - Property methods -
+    # --------------------
+    @property
+    def contentType(self):
+        """ Value of the Content-Type header of the request. """
+        return 'multipart/form-data; boundary=' + self.__boundary
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _addSegment(self, data):
+        self.__segments.append(data)
+        self.__length += len(data)
+
+
+    def _partHeader(self, name, filename, contentType):
+        disposition = 'Content-Disposition: form-data; name="' + self._quote(name) + '"'
+        if filename != None:
+            disposition += '; filename="' + self._quote(filename) + '"'
+        header = '--' + self.__boundary + '\r\n' + disposition + '\r\n'
+        if contentType != None:
+            header += 'Content-Type: ' + contentType + '\r\n'
+        return (header + '\r\n').encode('utf-8')
+
+
+    def _quote(self, value):
+        # Same escaping as browsers (HTML5) for quoted parameters.
+        return value.replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+    def _closingBoundary(self):
+        return ('--' + self.__boundary + '--\r\n').encode('utf-8')
+
+
+    def _readSegment(self, size):
+        """ Reads up to 'size' bytes from the current segment, moving to the
+        next one when the current one is exhausted.
+        """
+        while True:
+            if self.__buffer:
+                chunk = self.__buffer if size < 0 else self.__buffer[:size]
+                self.__buffer = self.__buffer[len(chunk):]
+                return chunk
+
+            if self.__file != None:
+                chunk = self.__file.read(size)
+                if chunk:
+                    return chunk
+                self.__file.close()
+                self.__file = None
+                continue
+
+            if self.__closed or self.__index > len(self.__segments):
+                return b''
+            if self.__index == len(self.__segments):
+                self.__buffer = self._closingBoundary()
+            else:
+                segment = self.__segments[self.__index]
+                if isinstance(segment, bytes):
+                    self.__buffer = segment
+                else:
+                    try:
+                        self.__file = open(segment[0], 'rb')
+                    except IOError as ex:
+                        raise FileError("The attachment could not be opened: " + str(ex))
+            self.__index += 1
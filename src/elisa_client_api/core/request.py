@@ -16,31 +16,83 @@
 # Modification history:
 # 19/Dec/2012: created.
 # 08/Jan/2012: add authentication
+# 17/Oct/2026: send the requests through the pooled transport.
+# 17/Oct/2026: add streaming get.
+# 17/Oct/2026: stream multipart bodies instead of building them in memory.
+# 17/Oct/2026: check the HTTP status of multipart requests.
+# 17/Oct/2026: add deadline.
+# 17/Oct/2026: add conditional get.
+# 17/Oct/2026: configurable media type.
+# 17/Oct/2026: detect the SSO sign-in page without decoding the responses.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
-from future import standard_library
-standard_library.install_aliases()
 from builtins import str
 from builtins import object
-import urllib.request, urllib.parse, urllib.error
+import itertools
+import urllib.parse
 import requests
-import os
-import mimetypes
 
+from .transport import Transport
+from .multipart import MultipartEncoder
 from elisa_client_api.exception import RestServerError
 
 
+# Text of the CERN sign-in page returned instead of the data when the SSO
+# authentication fails.
+SSO_SIGN_IN_TEXT = b'Sign in with your CERN account'
+# Number of bytes at the start of a response searched for the sign-in page.
+SSO_SCAN_SIZE = 64 * 1024
+
+
+def maybeSsoSignInPage(contentType):
+    """ Tells whether a response with a given Content-Type might be the SSO
+    sign-in page. The data is never sent as HTML, so only HTML responses and
+    responses without Content-Type need to be looked at.
+
+    contentType: value of the Content-Type header, or None.
+    """
+    return not contentType or 'html' in contentType.lower()
+
+
+def isSsoSignInPage(contentType, content, redirected=False):
+    """ Tells whether a successful response is the SSO sign-in page instead
+    of the data requested, without decoding the response.
+
+    An HTML response redirected to another host is the sign-in page. Other
+    HTML responses, and responses without Content-Type, are the sign-in
+    page if its text is in their first SSO_SCAN_SIZE bytes.
+
+    contentType: value of the Content-Type header, or None.
+    content: the response body or its first bytes (bytes).
+    redirected: whether the request was redirected to another host.
+    """
+    if not maybeSsoSignInPage(contentType):
+        return False
+    if contentType and redirected:
+        return True
+    return content.find(SSO_SIGN_IN_TEXT, 0, SSO_SCAN_SIZE) != -1
+
+
 class Request(object):
     """ Encapsulates the functionality to perform HTTP requests.
     """
-    def __init__(self, url, authentication):
+    def __init__(self, url, authentication, transport=None, deadline=None, mediaType='application/xml'):
         """ Constructor
 
         url: URL to make the request to.
+        authentication: object of type Authentication.
+        transport: object of type Transport whose pooled connections are
+                   used. If None, a transport is created for this request.
+        deadline: object of type Deadline the request must complete within.
+                  If None, only the transport timeouts apply.
+        mediaType: media type of the messages sent and accepted.
         """
         self.__url = url
         self.__authentication = authentication
+        self.__transport = transport if transport != None else Transport()
+        self.__deadline = deadline
+        self.__mediaType = mediaType
 
     # -----------------------------
     # - Public methods: Interface -
@@ -51,24 +103,77 @@ class Request(object):
         Returns: the data returned by the server.
         Throws: RestServerError if the request fails.
         """
-        req = urllib.request.Request(self.__url)
-        self.__authentication.addAuthentication(req)
-        req.add_header('Accept', 'application/xml')
-        req.get_method = lambda: 'GET'
+        headers = {'Accept': self.__mediaType}
+        response = self._send('GET', headers=headers)
+        self._checkSsoAuthen(response)
+        return response.content
 
+
+    def getConditional(self, etag=None, lastModified=None):
+        """ Makes a conditional get request that only returns the data if
+        it changed since it was last retrieved.
+
+        etag: value of the ETag header previously returned, or None.
+        lastModified: value of the Last-Modified header previously returned,
+                      or None.
+        Returns: a tuple with the data returned by the server, or None if it
+                 did not change (304), and the new ETag and Last-Modified
+                 headers.
+        Throws: RestServerError if the request fails.
+        """
+        headers = {'Accept': self.__mediaType}
+        if etag != None:
+            headers['If-None-Match'] = etag
+        if lastModified != None:
+            headers['If-Modified-Since'] = lastModified
+        response = self._send('GET', headers=headers)
+        newEtag = response.headers.get('ETag', etag)
+        newLastModified = response.headers.get('Last-Modified', lastModified)
+        if response.status_code == 304:
+            return (None, newEtag, newLastModified)
+        self._checkSsoAuthen(response)
+        return (response.content, newEtag, newLastModified)
+
+
+    def stream(self, chunkSize, accept=None):
+        """ Makes a get request and yields the data returned by the server
+        in chunks, without holding the whole response in memory.
+
+        chunkSize: maximum size in bytes of each chunk.
+        accept: MIME type expected from the server, or None for any.
+        Returns: an iterator over the chunks of data returned by the server.
+        Throws: RestServerError if the request fails.
+        """
+        headers = {'Accept': accept} if accept != None else {}
+        response = self._send('GET', headers=headers, stream=True)
+        size = 0
         try:
-            response = urllib.request.urlopen(req).read()
-            self._checkSsoAuthen(response)
-            return response
-        except urllib.error.HTTPError as ex:
-            # The returned code 302 is expected. The reason why is
-            # explained in http://en.wikipedia.org/wiki/HTTP_302
-            if ex.code == 302:
-                return ex.read()
-            # Otherwise it is a valid error, raise it.
-            raise RestServerError(str(ex) + ". REST server error: " + ex.read().decode())
-        except urllib.error.URLError as ex:
-            raise RestServerError(str(ex))
+            # Compressed responses are decoded chunk by chunk.
+            chunks = response.iter_content(chunkSize)
+            # Only the start of the response is read in advance to look for
+            # the sign-in page, and the chunks read are yielded unchanged.
+            if maybeSsoSignInPage(response.headers.get('Content-Type')):
+                head = list()
+                headSize = 0
+                for chunk in chunks:
+                    head.append(chunk)
+                    headSize += len(chunk)
+                    if headSize >= SSO_SCAN_SIZE:
+                        break
+                self._checkSsoAuthen(response, b''.join(head))
+                chunks = itertools.chain(head, chunks)
+            for chunk in chunks:
+                # The read timeout applies to each chunk, the deadline
+                # to the whole download.
+                if self.__deadline != None:
+                    self.__deadline.check()
+                size += len(chunk)
+                yield chunk
+            self.__transport.record(response, size)
+        except requests.exceptions.RequestException as ex:
+            self._raiseError(ex)
+        finally:
+            response.close()
 
 
     def post(self, message):
@@ -78,20 +183,10 @@ class Request(object):
         Returns: the data returned by the server.
         Throws: RestServerError if the request fails.
         """
-        req = urllib.request.Request(self.__url,message)
-        self.__authentication.addAuthentication(req)
-        req.add_header('Content-Type', 'application/xml')
-        req.add_header('Accept', 'application/xml')
-        req.get_method = lambda: 'POST'
-
-        try:
-            response = urllib.request.urlopen(req).read()
-            self._checkSsoAuthen(response)
-            return response
-        except urllib.error.HTTPError as ex:
-            raise RestServerError(str(ex) + ". REST server error: " + ex.read().decode())
-        except urllib.error.URLError as ex:
-            raise RestServerError(str(ex))
+        headers = {'Content-Type': self.__mediaType, 'Accept': self.__mediaType}
+        response = self._send('POST', headers=headers, data=message)
+        self._checkSsoAuthen(response)
+        return response.content
 
 
     def put(self, message):
@@ -101,20 +196,10 @@ class Request(object):
         Returns: the data returned by the server.
         Throws: RestServerError if the request fails.
         """
-        req = urllib.request.Request(self.__url,message)
-        self.__authentication.addAuthentication(req)
-        req.add_header('Content-Type', 'application/xml')
-        req.add_header('Accept', 'application/xml')
-        req.get_method = lambda: 'PUT'
-
-        try:
-            response = urllib.request.urlopen(req).read()
-            self._checkSsoAuthen(response)
-            return response
-        except urllib.error.HTTPError as ex:
-            raise RestServerError(str(ex) + ". REST server error: " + ex.read().decode())
-        except urllib.error.URLError as ex:
-            raise RestServerError(str(ex))
+        headers = {'Content-Type': self.__mediaType, 'Accept': self.__mediaType}
+        response = self._send('PUT', headers=headers, data=message)
+        self._checkSsoAuthen(response)
+        return response.content
 
 
     def multipart(self, message=None, attachments=None):
@@ -127,34 +212,67 @@ class Request(object):
         Throws: RestServerError if the request fails.
                 FileError if any of the attachment cannot be opened.
         """
-        session = requests.Session()
-        files={}
-        if message != None:
-            files[message[1]] = (None,message[0],'application/xml')
-        count=0
-        for attachment in attachments:
-            files['file'+str(count)] = (os.path.basename(attachment), open(attachment, 'rb'), mimetypes.guess_type(attachment)[0] or 'application/octet-stream')
-            count+=1
-        request = requests.Request('POST', self.__url, files=files)
-        prepped = session.prepare_request(request)
-        self.__authentication.addAuthenticationPy3(prepped)
-        #print(prepped.body.decode('ascii'), prepped.headers)
+        with MultipartEncoder() as body:
+            if message != None:
+                body.addField(message[1], message[0], self.__mediaType)
+            for count, attachment in enumerate(attachments or []):
+                body.addFile('file' + str(count), attachment)
 
-        try:
-            response = session.send(prepped, verify=False)
-            #self._checkSsoAuthen(response.content)
-            #print(response.text)
+            headers = {'Content-Type': body.contentType, 'Accept': self.__mediaType}
+            response = self._send('POST', headers, body, verify=False)
+            self._checkSsoAuthen(response)
             return response.content
-        except requests.exceptions.HTTPError as ex:
-            raise RestServerError(str(ex) + ". REST server error: " + ex.read().decode())
-        #except urllib.error.URLError as ex:
-        #    raise RestServerError(str(ex))
 
     # -------------------
     # - Private methods -
     # -------------------
-    def _checkSsoAuthen(self, response):
-        # Is there a better way to detect this?
-        if '<!DOCTYPE html PUBLIC' in response.decode() and 'Sign in with your CERN account' in response.decode():
-            raise RestServerError("SSO authentication failed");()
+    def _send(self, method, headers, data=None, stream=False, verify=None):
+        """ Sends a request through the transport and checks the HTTP status.
 
+        stream: if true, the response body is not read in advance.
+        verify: whether to verify the server certificate.
+        Returns: an object of type requests.Response.
+        Throws: RestServerError if the request fails.
+        """
+        request = requests.Request(method, self.__url, headers=headers, data=data)
+        prepped = self.__transport.prepare(request)
+        self.__authentication.addAuthenticationPy3(prepped)
+
+        try:
+            response = self.__transport.send(prepped, stream=stream, verify=verify, deadline=self.__deadline)
+        except requests.exceptions.RequestException as ex:
+            self._raiseError(ex)
+
+        # Keep the same error format as urllib so that callers can keep
+        # looking for the status code, e.g. 'HTTP Error 404'.
+        if response.status_code >= 400:
+            content = response.content
+            response.close()
+            raise RestServerError("HTTP Error " + str(response.status_code) + ": " + str(response.reason) +
+                                  ". REST server error: " + content.decode(errors='replace'))
+        return response
+
+
+    def _raiseError(self, ex):
+        # A timeout caused by the deadline is reported as such.
+        if isinstance(ex, requests.exceptions.Timeout) and self.__deadline != None:
+            self.__deadline.check()
+        raise RestServerError(str(ex))
+
+
+    def _checkSsoAuthen(self, response, content=None):
+        """ Checks that the server did not return the SSO sign-in page
+        instead of the data. Error statuses are already rejected by _send().
+
+        response: object of type requests.Response.
+        content: the first bytes of the response, if it is streamed. If
+                 None, the response body is used.
+        Throws: RestServerError if the SSO authentication failed.
+        """
+        contentType = response.headers.get('Content-Type')
+        if not maybeSsoSignInPage(contentType):
+            return
+        redirected = (len(response.history) > 0 and
+                      urllib.parse.urlsplit(response.url).netloc != urllib.parse.urlsplit(self.__url).netloc)
+        if isSsoSignInPage(contentType, response.content if content == None else content, redirected):
+            raise RestServerError("SSO authentication failed")
@@ -18,6 +18,22 @@
 # 22/Nov/2012: created.
 # 08/Jan/2012: add authentication.
 # 11/Feb/2013: add option to show attributes when searching for messages.
+# 17/Oct/2026: share a pooled, keep-alive transport between all the requests.
+# 17/Oct/2026: retrieve the attachments of a message concurrently.
+# 17/Oct/2026: stream attachments to files in chunks.
+# 17/Oct/2026: propagate the deadline of an operation to all its requests.
+# 17/Oct/2026: retrieve several messages concurrently.
+# 17/Oct/2026: revalidate cached messages and configuration with the server.
+# 17/Oct/2026: deserialize search results while they are received.
+# 17/Oct/2026: add lazy search results.
+# 17/Oct/2026: intern low-cardinality field values.
+# 17/Oct/2026: pluggable wire codec.
+# 17/Oct/2026: search results as columnar tables.
+# 17/Oct/2026: iterate over all the pages of a search, prefetching the next one.
+# 17/Oct/2026: retrieve several pages of a search concurrently.
+# 17/Oct/2026: split the date range of a search into concurrent shards.
+# 18/Oct/2026: return copies of the cached objects.
+# 18/Oct/2026: wait only for the shards still searched.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
@@ -28,12 +44,57 @@ from builtins import object
 import urllib.request, urllib.parse, urllib.error
 import string
 import logging
+import os
+import copy
+import collections
+import datetime
+import heapq
+import itertools
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
 
 from .request import Request
-from .serializer import Serializer
+from .transport import Transport
+from .concurrency import mapOrdered
+from .codec import XmlCodec
+from .sharding import (DEFAULT_SHARD_DAYS, getDateRange, planShards, splitShard, formatDate,
+                       getTimestamp, getDayTimestamp)
+from elisa_client_api.messageTable import MessageTable
 from elisa_client_api.exception import RestServerError
 
 
+# Default number of messages or attachments retrieved concurrently.
+DEFAULT_WORKERS = 4
+# Default size in bytes of the chunks in which attachments are streamed.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Number of messages per page returned by the server if no limit is given.
+DEFAULT_PAGE_SIZE = 100
+
+
+def buildReply(message, rootMsg):
+    """ Builds the message to insert as a reply to another message.
+
+    The reply message must inherit from the original message the type, subject,
+    and if need be, the options and systems affected.
+
+    message: object of type MessageReply.
+    rootMsg: object of type MessageRead the reply is addressed to.
+    Returns: an object of type MessageInsert.
+    """
+    from elisa_client_api.messageInsert import MessageInsert
+
+    msgInsert = MessageInsert()
+    msgInsert.author = message.author
+    msgInsert.type = rootMsg.type
+    msgInsert.systemsAffected = message.systemsAffected if message.systemsAffected else rootMsg.systemsAffected
+    msgInsert.options = message.options if message.options else rootMsg.options
+    msgInsert.subject = message.subject if message.subject else ('RE: ' + rootMsg.subject)
+    msgInsert.body = message.body
+    msgInsert.status = message.status
+    msgInsert.attachments = message.attachments
+    return msgInsert
+
+
 class RestServer(object):
     """ Accesses the ELisA logbook backend database through the REST server.
     """
@@ -41,58 +102,173 @@ class RestServer(object):
     # ------------------
     # - Public methods -
     # ------------------
-    def __init__(self, url, authentication):
+    def __init__(self, url, authentication, transport=None, cache=None, internPool=None, codec=None):
         self.__url = url
         self.__authentication = authentication
+        # Connections are pooled and kept alive across calls.
+        self.__transport = transport if transport != None else Transport()
+        # Parsed messages and configuration, revalidated with the server.
+        self.__cache = cache
+        # Wire format of the messages and configuration. The values of the
+        # low-cardinality message fields are shared by all the results if
+        # there is an intern pool, otherwise within each result only.
+        self.__codec = codec if codec != None else XmlCodec(internPool)
+
+
+    def close(self):
+        """ Closes the connections kept alive by the transport.
+        """
+        self.__transport.close()
 
 
-    def getMessage(self, msgId):
+    def getTransferStats(self):
+        """ Returns the transfer counters of the transport.
+
+        Returns: a dictionary with the number of responses and their size
+                 over the wire and after decompression.
+        """
+        return self.__transport.getStats()
+
+
+    def getMessage(self, msgId, deadline=None):
         """ Queries the REST server to retrieve the logbook message with
         the given ID.
 
         msgId: the message ID.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: an object of type MessageRead encapsulating the message
                  with the given ID.
         Throws: RestServerError if accessing the logbook fails.
         """
         url = self.__url + "messages/" + str(msgId) + "/"
-        msgXml = Request(url, self.__authentication).get()
-        return Serializer().deserialize(msgXml)
+        return self._cachedGet(url, self.__codec.decode, deadline)
+
+
+    def getMessages(self, msgIds, workers=DEFAULT_WORKERS, deadline=None):
+        """ Queries the REST server to retrieve several logbook messages.
+        Up to 'workers' messages are retrieved concurrently.
+
+        msgIds: list of message IDs.
+        workers: maximum number of messages retrieved at the same time.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        Returns: a list with one tuple per ID, in the same order as msgIds,
+                 containing the ID, the object of type MessageRead and the
+                 error raised. For each ID, either the message or the error
+                 is None.
+        """
+        msgIds = list(msgIds)
+        results = mapOrdered(lambda msgId: self.getMessage(msgId, deadline), msgIds, workers)
+        return [(msgId, message, error) for msgId, (message, error) in zip(msgIds, results)]
 
 
-    def getAttachment(self, msgId, attachId):
+    def getAttachment(self, msgId, attachId, deadline=None):
         """ Queries the REST server to retrieve an attachment associated to
         a messages.
 
         msgId: message ID of the attachment to retrieve.
         attachId: the attachment ID.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: the attachment.
         Throws: RestServerError if accessing the logbook fails.
                 ElisaError if the message has not attachments.
         """
         url = self.__url + "messages/" + str(msgId) + "/attachments/" + str(attachId)
-        req = Request(url, self.__authentication)
+        req = self._request(url, deadline)
         return req.get()
 
 
-    def getAttachments(self, message):
+    def iterAttachment(self, msgId, attachId, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None):
         """ Queries the REST server to retrieve an attachment associated to
-        a messages.
+        a message in chunks, so that it is never held in memory as a whole.
 
-        message: object of type MessageRead with the attachments to retrieve.
-        Returns: a list of tuples with the id, name and content of the attachments.
+        msgId: message ID of the attachment to retrieve.
+        attachId: the attachment ID.
+        chunkSize: maximum size in bytes of each chunk.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        Returns: an iterator over the chunks of the attachment.
         Throws: RestServerError if accessing the logbook fails.
         """
+        url = self.__url + "messages/" + str(msgId) + "/attachments/" + str(attachId)
+        return self._request(url, deadline).stream(chunkSize)
+
+
+    def saveAttachment(self, msgId, attachId, destination, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None):
+        """ Queries the REST server to retrieve an attachment associated to
+        a message and writes it in chunks to a file.
+
+        msgId: message ID of the attachment to retrieve.
+        attachId: the attachment ID.
+        destination: path of the file to create or a binary file object.
+        chunkSize: maximum size in bytes of each chunk.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        Returns: the number of bytes written.
+        Throws: RestServerError if accessing the logbook fails.
+                IOError if the file cannot be written.
+        """
+        chunks = self.iterAttachment(msgId, attachId, chunkSize, deadline)
+        if hasattr(destination, 'write'):
+            return self._writeChunks(chunks, destination)
+        with open(destination, 'wb') as outfile:
+            return self._writeChunks(chunks, outfile)
+
+
+    def saveAttachments(self, message, directory, workers=DEFAULT_WORKERS, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None):
+        """ Queries the REST server to retrieve all the attachments associated
+        to a message and writes them in chunks to a directory, using the
+        attachment names as file names. Up to 'workers' attachments are
+        retrieved concurrently.
+
+        message: object of type MessageRead with the attachments to retrieve.
+        directory: path of the directory where the attachments are written.
+        workers: maximum number of attachments retrieved at the same time.
+        chunkSize: maximum size in bytes of each chunk.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        Returns: a list of tuples with the id, name and path of the attachments,
+                 in the same order as message.attachments.
+        Throws: RestServerError if accessing the logbook fails. If several
+                attachments fail, the error of the first one is raised.
+                IOError if a file cannot be written.
+        """
+        attachments = message.attachments or []
+        paths = [os.path.join(directory, os.path.basename(attachment[1])) for attachment in attachments]
+        results = mapOrdered(lambda item: self.saveAttachment(message.id, item[0][0], item[1], chunkSize, deadline),
+                             list(zip(attachments, paths)), workers)
+
         attchsList = []
-        for attachment in message.attachments:
-            attchsList.append((attachment[0],
-                               attachment[1],
-                               self.getAttachment(message.id, attachment[0])))
+        for attachment, path, (size, error) in zip(attachments, paths, results):
+            if error != None:
+                raise error
+            attchsList.append((attachment[0], attachment[1], path))
 
         return attchsList
 
 
-    def searchMessages(self, criteria, showAttributes):
+    def getAttachments(self, message, workers=DEFAULT_WORKERS, deadline=None):
+        """ Queries the REST server to retrieve all the attachments associated
+        to a message. Up to 'workers' attachments are retrieved concurrently.
+
+        message: object of type MessageRead with the attachments to retrieve.
+        workers: maximum number of attachments retrieved at the same time.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        Returns: a list of tuples with the id, name and content of the
+                 attachments, in the same order as message.attachments.
+        Throws: RestServerError if accessing the logbook fails. If several
+                attachments fail, the error of the first one is raised.
+        """
+        attachments = message.attachments or []
+        results = mapOrdered(lambda attachment: self.getAttachment(message.id, attachment[0], deadline),
+                             attachments, workers)
+
+        attchsList = []
+        for attachment, (content, error) in zip(attachments, results):
+            if error != None:
+                raise error
+            attchsList.append((attachment[0], attachment[1], content))
+
+        return attchsList
+
+
+    def searchMessages(self, criteria, showAttributes, deadline=None, lazy=False):
         """ Queries the REST server to retrieve the messages based
         on a search criteria.
 
@@ -100,45 +276,236 @@ class RestServer(object):
                   filter.
         showAttributes: if true, it also returns the option and attachment
                         message fields.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        lazy: if true, the messages are of type LazyMessageRead and decode
+              each field on first access.
         Returns: a list of objects of type MessageRead encapsulating
                  the messages that meet the search criteria.
         Throws: RestServerError if accessing the logbook fails.
         """
 
         url = self.__url + "messages?" + urllib.parse.urlencode(criteria.getDict())
-        msgXml = Request(url, self.__authentication).get()
-        return Serializer().deserialize(msgXml)
+        msgXml = self._request(url, deadline).get()
+        return self.__codec.decode(msgXml, lazy)
 
 
-    def insertMessage(self, message):
+    def iterSearchMessages(self, criteria, showAttributes, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None, lazy=False):
+        """ Queries the REST server to retrieve the messages based on a search
+        criteria, deserializing them while the response is received.
+
+        criteria: object of type Criteria specifying the search
+                  filter.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        chunkSize: maximum size in bytes of the pieces of the response parsed
+                   at a time.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        lazy: if true, the messages are of type LazyMessageRead and decode
+              each field on first access.
+        Returns: an iterator over objects of type MessageRead encapsulating
+                 the messages that meet the search criteria.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + "messages?" + urllib.parse.urlencode(criteria.getDict())
+        chunks = self._request(url, deadline).stream(chunkSize, self.__codec.mediaType)
+        return self.__codec.iterDecode(chunks, lazy)
+
+
+    def iterMessages(self, criteria, showAttributes, deadline=None, lazy=False, workers=1):
+        """ Queries the REST server page by page to retrieve all the messages
+        based on a search criteria. Up to 'workers' pages are retrieved and
+        deserialized in background threads while the current one is consumed.
+
+        criteria: object of type Criteria specifying the search filter. Its
+                  limit is the page size (DEFAULT_PAGE_SIZE if None) and its
+                  page the first page retrieved (1 if None). It is copied,
+                  so it can be modified while iterating.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        lazy: if true, the messages are of type LazyMessageRead and decode
+              each field on first access.
+        workers: maximum number of pages retrieved at the same time.
+        Returns: an iterator over objects of type MessageRead encapsulating
+                 the messages that meet the search criteria, in the order of
+                 the pages. It stops after the first page shorter than the
+                 page size.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        criteria = copy.deepcopy(criteria)
+        pageSize = int(criteria.limit) if criteria.limit != None else DEFAULT_PAGE_SIZE
+        nextPage = int(criteria.page) if criteria.page != None else 1
+        criteria.limit = pageSize
+
+        def fetch(page):
+            # Each request gets its own copy, the criteria are not shared
+            # with the background threads.
+            pageCriteria = copy.deepcopy(criteria)
+            pageCriteria.page = page
+            return self.searchMessages(pageCriteria, showAttributes, deadline, lazy)
+
+        executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+        # Pages requested, in order. The last page is only known once it
+        # arrives, so the pages following it are requested in vain (empty).
+        futures = collections.deque()
+        try:
+            while len(futures) < max(workers, 1):
+                futures.append(executor.submit(fetch, nextPage))
+                nextPage += 1
+            while len(futures) > 0:
+                messages = futures.popleft().result()
+                if len(messages) < pageSize:
+                    # Last page: drop the pages requested after it.
+                    while len(futures) > 0:
+                        futures.pop().cancel()
+                else:
+                    futures.append(executor.submit(fetch, nextPage))
+                    nextPage += 1
+                for message in messages:
+                    yield message
+        finally:
+            # The iterator might be closed before the end: drop the pending
+            # pages without waiting for them.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def iterShardedMessages(self, criteria, showAttributes, deadline=None, lazy=False,
+                            workers=DEFAULT_WORKERS, shardDays=DEFAULT_SHARD_DAYS):
+        """ Queries the REST server to retrieve the messages based on a search
+        criteria, splitting its date range into shards searched concurrently.
+
+        The range is split into shards of 'shardDays' days sharing their
+        boundary day. A shard whose first page is full is split in two until
+        it spans a single day; single-day shards are then read page by page.
+        The messages found twice are dropped and the others are returned in
+        chronological order, as soon as no pending shard can precede them.
+
+        criteria: object of type Criteria specifying the search filter. Its
+                  limit is the page size (DEFAULT_PAGE_SIZE if None), its
+                  page is ignored and its dates give the range searched (see
+                  sharding.getDateRange()). It is copied.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        lazy: if true, the messages are of type LazyMessageRead and decode
+              each field on first access.
+        workers: maximum number of shards searched at the same time.
+        shardDays: number of days of the initial shards.
+        Returns: an iterator over objects of type MessageRead encapsulating
+                 the messages that meet the search criteria, by date.
+        Throws: RestServerError if accessing the logbook fails.
+                ValueError if the dates of the criteria are not valid.
+        """
+        criteria = copy.deepcopy(criteria)
+        pageSize = int(criteria.limit) if criteria.limit != None else DEFAULT_PAGE_SIZE
+        start, end = getDateRange(criteria)
+        criteria.limit = pageSize
+        criteria.page = None
+        criteria.interval = None
+
+        def fetch(shard):
+            # Returns the messages of the shard, or None if it must be split.
+            shardCriteria = copy.deepcopy(criteria)
+            shardCriteria.since = formatDate(shard[0])
+            shardCriteria.until = formatDate(shard[1])
+            messages = self.searchMessages(shardCriteria, showAttributes, deadline, lazy)
+            if len(messages) < pageSize:
+                return messages
+            if splitShard(shard) != None:
+                return None
+            shardCriteria.page = 2
+            return messages + list(self.iterMessages(shardCriteria, showAttributes, deadline, lazy))
+
+        executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+        # Shards in chronological order, with the future of their messages.
+        shards = [(shard, executor.submit(fetch, shard)) for shard in planShards(start, end, shardDays)]
+        # Messages found but not returned yet, by date. The counter keeps
+        # the entries unique so that messages are never compared.
+        pending = list()
+        counter = itertools.count()
+        seen = set()
+        try:
+            while len(shards) > 0:
+                # Dense shards are split as soon as they are known.
+                for i in reversed(range(len(shards))):
+                    shard, future = shards[i]
+                    if future.done() and future.result() == None:
+                        shards[i:i + 1] = [(half, executor.submit(fetch, half)) for half in splitShard(shard)]
+                if not shards[0][1].done():
+                    # Waiting for shards already done would return at once.
+                    concurrent.futures.wait([future for shard, future in shards if not future.done()],
+                                            return_when=concurrent.futures.FIRST_COMPLETED)
+                    continue
+                for message in shards.pop(0)[1].result():
+                    if message.id in seen:
+                        continue
+                    seen.add(message.id)
+                    heapq.heappush(pending, (getTimestamp(message), next(counter), message))
+                # The next shards only have messages from their first day
+                # on, in the time zone of the server: keep one day margin.
+                limit = (getDayTimestamp(shards[0][0][0] - datetime.timedelta(days=1))
+                         if len(shards) > 0 else float('inf'))
+                while len(pending) > 0 and pending[0][0] < limit:
+                    yield heapq.heappop(pending)[2]
+        finally:
+            # The iterator might be closed before the end: drop the pending
+            # shards without waiting for them.
+            for shard, future in shards:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def searchMessagesTable(self, criteria, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None, table=None):
+        """ Queries the REST server to retrieve the messages based on a search
+        criteria into a columnar table, filled while the response is received.
+
+        criteria: object of type Criteria specifying the search
+                  filter.
+        chunkSize: maximum size in bytes of the pieces of the response parsed
+                   at a time.
+        deadline: object of type Deadline bounding the whole operation, or None.
+        table: object of type MessageTable the messages are appended to. If
+               None, a new table is created.
+        Returns: the object of type MessageTable.
+        Throws: RestServerError if accessing the logbook fails.
+        """
+        url = self.__url + "messages?" + urllib.parse.urlencode(criteria.getDict())
+        chunks = self._request(url, deadline).stream(chunkSize, self.__codec.mediaType)
+        return self.__codec.decodeTable(chunks, table if table != None else MessageTable())
+
+
+    def insertMessage(self, message, deadline=None):
         """ Queries the REST server to insert a message into the logbook.
 
         message: object of type MessageInsert to be inserted into the
                  database.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: an object of type MessageRead encapsulating the message
                  inserted into the database.
         Throws: RestServerError if inserting the text message fails (but not
                 the attachments).
         """
-        serializer = Serializer()
-        msgInsertXml = serializer.serialize(message, "input_message")
+        msgInsertXml = self.__codec.encode(message, "input_message")
         url = self.__url + "messages/"
 
         # If attachments are present, send a multipart request.
         # Otherwise, send a POST request.
         if not message.attachments or len(message.attachments) == 0:
-            msgReadXml = Request(url, self.__authentication).post(msgInsertXml)
+            msgReadXml = self._request(url, deadline).post(msgInsertXml)
         else:
-            msgReadXml = Request(url, self.__authentication).multipart((msgInsertXml, 'message'), message.attachments)
+            msgReadXml = self._request(url, deadline).multipart((msgInsertXml, 'message'), message.attachments)
 
-        return serializer.deserialize(msgReadXml)
+        return self.__codec.decode(msgReadXml)
 
 
-    def updateMessage(self, message):
+    def updateMessage(self, message, deadline=None):
         """ Queries the REST server to updates a logbook message.
 
         message: object of type MessageUpdate to be updated into the
                  database.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: an object of type MessageRead encapsulating the message
                  updated into the database.
         Throws: RestServerError if updating the message fails.
@@ -152,83 +519,70 @@ class RestServer(object):
             return ""
 
         msgReadXml = None
-        serializer = Serializer()
         if message.body:
-            msgInsertXml = serializer.serialize(message, "message_body")
+            msgInsertXml = self.__codec.encode(message, "message_body")
             url = self.__url + 'messages/' + str(message.id) + '/body'
 
             if message.attachments and len(message.attachments) > 0:
-                msgReadXml = Request(url, self.__authentication).multipart((msgInsertXml, 'body'), message.attachments)
+                msgReadXml = self._request(url, deadline).multipart((msgInsertXml, 'body'), message.attachments)
             else:
-                msgReadXml = Request(url, self.__authentication).put(msgInsertXml)
+                msgReadXml = self._request(url, deadline).put(msgInsertXml)
         elif message.date:
-            msgInsertXml = serializer.serialize(message, "date")
+            msgInsertXml = self.__codec.encode(message, "date")
             url = self.__url + 'messages/' + str(message.id) + '/date'
-            msgReadXml = Request(url, self.__authentication).put(message.date.encode('utf-8'))
+            msgReadXml = self._request(url, deadline).put(message.date.encode('utf-8'))
         else:
             url = self.__url + 'messages/' + str(message.id) + '/attachments'
-            msgReadXml = Request(url, self.__authentication).multipart(attachments=message.attachments)
+            msgReadXml = self._request(url, deadline).multipart(attachments=message.attachments)
 
-        return serializer.deserialize(msgReadXml)
+        return self.__codec.decode(msgReadXml)
 
 
-    def replyToMessage(self, message):
+    def replyToMessage(self, message, deadline=None):
         """ Queries the REST server to insert a reply.
 
         message: object of type MessageReply to be inserted into the
                  database.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: an object of type MessageRead encapsulating the message
                  inserted into the database.
         Throws: RestServerError if accessing the logbook fails.
         """
-        from elisa_client_api.messageInsert import MessageInsert
-
-        # The reply message must inherit from the original message the type, subject,
-        # and if need be, the options and systems affected.
-        rootMsg = self.getMessage(message.id)
-
-        msgInsert = MessageInsert()
-        msgInsert.author = message.author
-        msgInsert.type = rootMsg.type
-        msgInsert.systemsAffected = message.systemsAffected if message.systemsAffected else rootMsg.systemsAffected
-        msgInsert.options = message.options if message.options else rootMsg.options
-        msgInsert.subject = message.subject if message.subject else ('RE: ' + rootMsg.subject)
-        msgInsert.body = message.body
-        msgInsert.status = message.status
-        msgInsert.attachments = message.attachments
+        rootMsg = self.getMessage(message.id, deadline)
+        msgInsert = buildReply(message, rootMsg)
 
         # A reply involves inserting a new message and it follows the same
         # logic and syntax.
-        serializer = Serializer()
-        msgReplyXml = serializer.serialize(msgInsert, "input_message")
+        msgReplyXml = self.__codec.encode(msgInsert, "input_message")
         url = self.__url + "messages/" + str(message.id)
 
         # If attachments are present, send a multipart request.
         # Otherwise, send a POST request.
         if not msgInsert.attachments or len(msgInsert.attachments) == 0:
-            msgReadXml = Request(url, self.__authentication).post(msgReplyXml)
+            msgReadXml = self._request(url, deadline).post(msgReplyXml)
         else:
-            msgReadXml = Request(url, self.__authentication).multipart((msgReplyXml, 'message'), msgInsert.attachments)
+            msgReadXml = self._request(url, deadline).multipart((msgReplyXml, 'message'), msgInsert.attachments)
 
-        return serializer.deserialize(msgReadXml)
+        return self.__codec.decode(msgReadXml)
 
 
-    def getMessageTypes(self):
+    def getMessageTypes(self, deadline=None):
         """ Queries the REST server to retrieve the message types.
 
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: a list of message types.
         Throws: RestServerError if accessing the logbook fails.
         """
         url = self.__url + "mt"
-        typesXml = Request(url, self.__authentication).get()
-        return Serializer().deserializeMessageTypes(typesXml)
+        return self._cachedGet(url, self.__codec.decodeMessageTypes, deadline)
 
 
-    def getTypeOptions(self, msgType):
+    def getTypeOptions(self, msgType, deadline=None):
         """ Queries the REST server to retrieve the options for
         a given message type.
 
         msgType: the message type.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: a list of message types.
         Throws: RestServerError if accessing the logbook fails.
         """
@@ -236,8 +590,8 @@ class RestServer(object):
         url = self.__url + "mt/" + urllib.parse.quote(msgType)  + "/opt"
         retval = ""
         try:
-            typesXml = Request(url, self.__authentication).get()
-            retval = Serializer().deserializeMessageTypeOptions(typesXml)
+            typesXml = self._request(url, deadline).get()
+            retval = self.__codec.decodeMessageTypeOptions(typesXml)
         except RestServerError as ex:
             # The returned code 404 indicates a missing resource. In this case
             # it means the type does not have any associated options.
@@ -248,32 +602,33 @@ class RestServer(object):
         return retval
 
 
-    def getSystemsAffected(self):
+    def getSystemsAffected(self, deadline=None):
         """ Queries the REST server to retrieve the possible systems
         affected.
 
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: a list of possible systems affected.
         Throws: RestServerError if accessing the logbook fails.
 
         """
         url = self.__url + "sa"
-        saXml = Request(url, self.__authentication).get()
-        return Serializer().deserializeSystemsAffected(saXml)
+        return self._cachedGet(url, self.__codec.decodeSystemsAffected, deadline)
 
 
-    def getPredefinedSystemsAffected(self, msgType):
+    def getPredefinedSystemsAffected(self, msgType, deadline=None):
         """ Queries the REST server to retrieve the predefined systems
         affected for a given message type.
 
         msgType: a message type.
+        deadline: object of type Deadline bounding the whole operation, or None.
         Returns: a list of predefined systems affected for a message type.
         Throws: RestServerError if accessing the logbook fails.
         """
         url = self.__url + 'mt/' + urllib.parse.quote(msgType) + '/sa'
         retval = ""
         try:
-            saXml = Request(url, self.__authentication).get()
-            retval = Serializer().deserializeSystemsAffected(saXml)
+            saXml = self._request(url, deadline).get()
+            retval = self.__codec.decodeSystemsAffected(saXml)
         except RestServerError as ex:
             # The returned code 404 indicates a missing resource. In this case
             # it means the type does not have any predefined systems affected.
@@ -283,4 +638,45 @@ class RestServer(object):
 
         return retval
 
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _request(self, url, deadline):
+        """ Returns a request to the REST server in the wire format of the codec.
+        """
+        return Request(url, self.__authentication, self.__transport, deadline, self.__codec.mediaType)
+
+
+    def _cachedGet(self, url, parse, deadline):
+        """ Retrieves and parses a resource, unless the cache holds it and
+        the server confirms it did not change.
+
+        Returns: the parsed resource. Cached objects are copied, so that the
+                 caller can modify them without altering the cache.
+        """
+        request = self._request(url, deadline)
+        if self.__cache == None:
+            return parse(request.get())
+
+        entry = self.__cache.get(url)
+        if entry == None:
+            content, etag, lastModified = request.getConditional()
+        else:
+            content, etag, lastModified = request.getConditional(entry[0], entry[1])
+            # Not modified: reuse the object already parsed.
+            if content == None:
+                return copy.deepcopy(entry[2])
+
+        value = parse(content)
+        self.__cache.put(url, etag, lastModified, value)
+        return copy.deepcopy(value)
+
+
+    def _writeChunks(self, chunks, outfile):
+        size = 0
+        for chunk in chunks:
+            outfile.write(chunk)
+            size += len(chunk)
+        return size
+
 
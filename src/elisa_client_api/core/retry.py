@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Retry policy and circuit breaker
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : retry.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : RetryPolicy, CircuitBreaker
+# Description   : Classes deciding when a failed request to the REST server is retried
+#                 and when requests are not even attempted.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: release trial requests failing for reasons unrelated to the server.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+import random
+import threading
+import time
+import email.utils
+
+from elisa_client_api.exception import CircuitOpenError
+
+
+class RetryPolicy(object):
+    """ Class deciding whether and when a failed request is retried.
+
+    Requests are retried when the connection fails or the server answers
+    with one of the retryable status codes, but only for idempotent methods.
+    The delay between attempts grows exponentially and is randomized (full
+    jitter) so that many clients do not retry in lockstep. A Retry-After
+    header sent by the server takes precedence.
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, maxRetries=3, backoffFactor=0.5, maxBackoff=30.0, jitter=True,
+                 retryStatuses=(429, 500, 502, 503, 504), retryMethods=('GET', 'HEAD')):
+        """ Constructor
+
+        maxRetries: maximum number of retries after the first attempt.
+        backoffFactor: delay in seconds before the first retry. It doubles
+                       on each retry.
+        maxBackoff: maximum delay in seconds between two attempts.
+        jitter: if true, the delay is chosen randomly between 0 and the
+                exponential backoff.
+        retryStatuses: HTTP status codes that are retried.
+        retryMethods: HTTP methods that are retried.
+        """
+        self.__maxRetries = maxRetries
+        self.__backoffFactor = backoffFactor
+        self.__maxBackoff = maxBackoff
+        self.__jitter = jitter
+        self.__retryStatuses = frozenset(retryStatuses)
+        self.__retryMethods = frozenset(method.upper() for method in retryMethods)
+
+
+    def isRetryable(self, method, attempt, status=None):
+        """ Tells whether a failed attempt must be retried.
+
+        method: HTTP method of the request.
+        attempt: number of the attempt that failed, starting at 0.
+        status: HTTP status code returned, or None if the connection failed.
+        Returns: True if the request must be retried.
+        """
+        if attempt >= self.__maxRetries or method.upper() not in self.__retryMethods:
+            return False
+        return status == None or status in self.__retryStatuses
+
+
+    def getDelay(self, attempt, retryAfter=None):
+        """ Returns the delay in seconds before the next attempt.
+
+        attempt: number of the attempt that failed, starting at 0.
+        retryAfter: value of the Retry-After header, if any.
+        """
+        delay = self._parseRetryAfter(retryAfter)
+        if delay != None:
+            return min(delay, self.__maxBackoff)
+
+        backoff = min(self.__maxBackoff, self.__backoffFactor * (2 ** attempt))
+        return random.uniform(0, backoff) if self.__jitter else backoff
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _parseRetryAfter(self, retryAfter):
+        # Retry-After is either a number of seconds or an HTTP date.
+        if not retryAfter:
+            return None
+        try:
+            return max(0.0, float(retryAfter))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(retryAfter)
+        except (TypeError, ValueError):
+            return None
+        if date == None:
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+
+class CircuitBreaker(object):
+    """ Class failing requests fast while the server is down.
+
+    After 'failureThreshold' consecutive failures (connection errors or 5xx
+    responses) the circuit opens and requests fail immediately with
+    CircuitOpenError. Once 'resetTimeout' seconds have elapsed one trial
+    request is let through: if it succeeds the circuit closes again,
+    otherwise it stays open for another 'resetTimeout' seconds.
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, failureThreshold=5, resetTimeout=30.0):
+        """ Constructor
+
+        failureThreshold: number of consecutive failures opening the circuit.
+        resetTimeout: seconds the circuit stays open before a trial request.
+        """
+        self.__failureThreshold = failureThreshold
+        self.__resetTimeout = resetTimeout
+        self.__lock = threading.Lock()
+        self.__failures = 0
+        self.__openedAt = None
+        self.__trialInFlight = False
+
+
+    def allowRequest(self):
+        """ Checks whether a request can be sent.
+
+        Returns: True if the request is the trial request of an open circuit.
+                 Its outcome must then be recorded, or the trial released.
+        Throws: CircuitOpenError if the circuit is open.
+        """
+        with self.__lock:
+            if self.__openedAt == None:
+                return False
+            remaining = self.__openedAt + self.__resetTimeout - time.time()
+            if remaining <= 0 and not self.__trialInFlight:
+                self.__trialInFlight = True
+                return True
+        raise CircuitOpenError("the REST server is considered down after " + str(self.__failures) +
+                               " consecutive failures, retry in " + str(max(0, int(remaining))) + " seconds")
+
+
+    def recordSuccess(self):
+        """ Records a successful request, closing the circuit.
+        """
+        with self.__lock:
+            self.__failures = 0
+            self.__openedAt = None
+            self.__trialInFlight = False
+
+
+    def releaseTrial(self):
+        """ Lets another request through as trial request, without recording
+        any outcome. To be called when the trial request failed for a reason
+        unrelated to the server, e.g. an attachment that cannot be read.
+        """
+        with self.__lock:
+            self.__trialInFlight = False
+
+
+    def recordFailure(self):
+        """ Records a failed request, opening the circuit if need be.
+        """
+        with self.__lock:
+            self.__failures += 1
+            if self.__trialInFlight or self.__failures >= self.__failureThreshold:
+                self.__openedAt = time.time()
+            self.__trialInFlight = False
+
+    # --------------------
+    # - Property methods -
+    # --------------------
+    @property
+    def isOpen(self):
+        """ True while requests are rejected. """
+        with self.__lock:
+            return self.__openedAt != None
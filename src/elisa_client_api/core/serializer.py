@@ -17,15 +17,61 @@
 # Modification history:
 # 23/Nov/2012: created.
 # 04/Feb/2013: bug in deserializeMessageTypeOptions()
+# 17/Oct/2026: add incremental deserialization of message lists.
+# 17/Oct/2026: dispatch the message fields through a table built once per class.
+# 17/Oct/2026: add lazy deserialization.
+# 17/Oct/2026: use lxml only, with per-thread parsers and compiled XPath.
+# 17/Oct/2026: intern low-cardinality field values.
+# 17/Oct/2026: fill columnar message tables.
 #--------------------------------------------------------------------------------------
 
 from builtins import object
-import xml.etree.ElementTree as ET
 import string
 import logging
+import operator
+import threading
 from lxml import etree
 
-from elisa_client_api.messageRead import MessageRead
+from elisa_client_api.messageRead import MessageRead, LazyMessageRead
+from elisa_client_api.core.intern import InternPool
+
+
+# Compiled XPath expressions, evaluated in C.
+_MESSAGES = etree.XPath('message')
+_MESSAGE_TYPES = etree.XPath('message_type')
+_SYSTEMS_AFFECTED = etree.XPath('system_affected')
+_OPTIONS = etree.XPath('option')
+_INNER_OPTIONS = etree.XPath('options/option')
+# Message fields taking few distinct values, interned when deserialized.
+# The systems affected and the options are always interned.
+INTERNED_FIELDS = frozenset(['logbook', 'username', 'author', 'message_type', 'host', 'has_replies',
+                              'has_attachments', 'status', 'valid', 'encoding', 'systems_affected', 'options'])
+# Fields of the options of a message type.
+_OPTION_KEYS = ('name', 'type', 'comment', 'possible_values')
+
+# Parsers are reused between calls but cannot be shared between threads.
+_parsers = threading.local()
+
+def _getParser(recover):
+    """ Returns the XML parser of the calling thread.
+
+    recover: if true, the parser tries hard to parse broken XML (messages
+             may contain invalid characters); otherwise it fails on errors.
+    """
+    parser = getattr(_parsers, 'recover' if recover else 'strict', None)
+    if parser == None:
+        parser = etree.XMLParser(recover=recover)
+        setattr(_parsers, 'recover' if recover else 'strict', parser)
+    return parser
+
+
+def _optionValues(node):
+    # Texts of the first children with the option keys as tags, "" for the
+    # missing ones. Children are visited backwards so the first one wins.
+    values = dict.fromkeys(_OPTION_KEYS, "")
+    for child in node.iterchildren(*_OPTION_KEYS, reversed=True):
+        values[child.tag] = child.text
+    return values
 
 
 class FormatterError(Exception):
@@ -42,6 +88,20 @@ class Serializer(object):
     """ Class providing serializing and deserializing methods for the
     logbook message.
     """
+    # Tables mapping the XML tags of the message fields to their decoders,
+    # one per message class. See _getDecoders().
+    _decoders = dict()
+
+    def __init__(self, internPool=None):
+        """ Constructor
+
+        internPool: object of type InternPool sharing the values of the
+                    low-cardinality fields of the messages deserialized. If
+                    None, each serializer has its own pool, i.e. values are
+                    shared within a result set.
+        """
+        self.__internPool = internPool if internPool != None else InternPool()
+
 
     def serialize(self, message, topNodeName):
         """ Creates an XML format string from a logbook message.
@@ -50,35 +110,85 @@ class Serializer(object):
         Returns: the XML representation of the logbook message.
         Throws: FormatterError if serializing the message fails.
         """
-        root = ET.Element(topNodeName)
+        root = etree.Element(topNodeName)
         fields = message.getFieldNames()
         for field in fields:
             attr = getattr(message, field)
             attr.serialize(root)
 
-        return ET.tostring(root)
+        return etree.tostring(root)
 
 
-    def deserialize(self, xmlStr):
+    def deserialize(self, xmlStr, lazy=False):
         """ Creates an object of type MessageRead from an XML format string.
 
         xmlStr: the XML string representation of the logbook message.
+        lazy: if true, the messages are of type LazyMessageRead and their
+              fields are decoded on first access.
         Returns: one object of type MessageRead or a list these objects.
         Throws: FormatterError if deserializing the message fails.
         """
-        #print (xmlStr)
-        my_parser = etree.XMLParser(recover=True)
-        root = ET.fromstring(xmlStr,parser = my_parser)
+        root = etree.fromstring(xmlStr, _getParser(True))
         # Check if there is one message only or a list of them
         if root.tag == "message":
             # One message
-            return self._deserializeMessage(root)
+            return self._deserializeMessage(root, lazy)
         # Many messages
         listMsgs = list()
-        [listMsgs.append(self._deserializeMessage(node)) for node in root.findall('message')]
+        [listMsgs.append(self._deserializeMessage(node, lazy)) for node in _MESSAGES(root)]
         return listMsgs
 
 
+    def iterDeserialize(self, chunks, lazy=False):
+        """ Creates objects of type MessageRead incrementally from an XML
+        document received in chunks.
+
+        Each message is yielded as soon as its closing tag has been parsed
+        and its XML element is then freed, so neither the whole document
+        nor the whole list of messages is held in memory.
+
+        chunks: an iterable over the pieces (bytes) of the XML document with
+                one message or a list of them.
+        lazy: if true, the messages are of type LazyMessageRead and their
+              fields are decoded on first access. Their XML elements are
+              then kept, detached from the document.
+        Returns: an iterator over objects of type MessageRead.
+        Throws: FormatterError if deserializing the messages fails.
+        """
+        for node in self._iterMessageNodes(chunks, lazy):
+            yield self._deserializeMessage(node, lazy)
+
+
+    def deserializeTable(self, chunks, table):
+        """ Appends to a columnar table the messages of an XML document
+        received in chunks.
+
+        Only the columns of the table are extracted and no MessageRead is
+        created. Each XML element is freed once its message is appended.
+
+        chunks: an iterable over the pieces (bytes) of the XML document with
+                one message or a list of them.
+        table: object of type MessageTable.
+        Returns: the table.
+        Throws: FormatterError if deserializing the messages fails.
+        """
+        for node in self._iterMessageNodes(chunks, False):
+            values = dict()
+            systems = ()
+            options = ()
+            for child in node:
+                if child.tag == 'systems_affected':
+                    systems = [system.text for system in _SYSTEMS_AFFECTED(child)]
+                elif child.tag == 'options':
+                    options = [(option.findtext('name'), option.findtext('value')) for option in _OPTIONS(child)]
+                else:
+                    values[child.tag] = child.text
+            table.append(values.get('id'), values.get('date'), values.get('message_type'), values.get('author'),
+                         values.get('status'), values.get('has_replies'), values.get('thread_head'),
+                         systems, options)
+        return table
+
+
     def deserializeMessageTypes(self, xmlStr):
         """ Creates a list with the message types as defined in the
         ElisA logbook configuration.
@@ -87,11 +197,8 @@ class Serializer(object):
         Returns: a list with the message types.
         Throws: FormatterError if deserializing the types fails.
         """
-        types = list()
-        root = ET.fromstring(xmlStr)
-        for child in root.findall('message_type'):
-            types.append(child.text)
-        return types
+        root = etree.fromstring(xmlStr, _getParser(False))
+        return [child.text for child in _MESSAGE_TYPES(root)]
 
 
     def deserializeMessageTypeOptions(self, xmlStr):
@@ -104,31 +211,14 @@ class Serializer(object):
         Throws: FormatterError if deserializing the options fails.
         """
         opts = list()
-        rootOption = ET.fromstring(xmlStr)
+        rootOption = etree.fromstring(xmlStr, _getParser(False))
 
         # First level options
-        for optionNode in rootOption.findall('option'):
-            optionVals = dict()
+        for optionNode in _OPTIONS(rootOption):
             # Second level options
-            listInnerOpts = list()
-            for innerOptionsNode in optionNode.findall('options'):
-                for innerOptionNode in innerOptionsNode.findall('option'):
-                    elemDic = dict()
-                    for k in ['name', 'type', 'comment', 'possible_values']:
-                        elemDic[k] = innerOptionNode.find(k).text if innerOptionNode.find(k) != None else ""
-                    listInnerOpts.append(elemDic)
-
-            # Add first level option
-            for k  in ['name', 'type', 'comment', 'possible_values'] :
-                optionVals[k] = optionNode.find(k).text if optionNode.find(k) != None else ""
-
-# Valid as of python 2.7
-#                    listInnerOpts.append( { k:innerOptionNode.find(k).text
-#                                           for k in ['name', 'type', 'comment', 'possible_values']
-#                                           if innerOptionNode.find(k) != None } )
+            listInnerOpts = [_optionValues(innerOptionNode) for innerOptionNode in _INNER_OPTIONS(optionNode)]
             # Add first level option
-#            optionVals = { k:optionNode.find(k).text for k  in ['name', 'type', 'comment', 'possible_values']
-#                             if optionNode.find(k) != None }
+            optionVals = _optionValues(optionNode)
             optionVals['options'] = listInnerOpts if len(listInnerOpts) > 0 else ""
             opts.append(optionVals)
 
@@ -143,27 +233,83 @@ class Serializer(object):
         Returns: a list with the systems affected.
         Throws: FormatterError if deserializing the types fails.
         """
-        types = list()
-        root = ET.fromstring(xmlStr)
-        for child in root.findall('system_affected'):
-            types.append(child.text)
-        return types
+        root = etree.fromstring(xmlStr, _getParser(False))
+        return [child.text for child in _SYSTEMS_AFFECTED(root)]
 
     # -------------------
     # - Private methods -
     # -------------------
-    def _deserializeMessage(self, node):
+    def _iterMessageNodes(self, chunks, keep):
+        """ Yields the outermost <message> elements of an XML document
+        received in chunks, as soon as they are complete.
+
+        keep: if false, each element is cleared once the caller asks for the
+              next one. It is always detached from the document.
+        """
+        parser = etree.XMLPullParser(events=('start', 'end'), tag='message', recover=True)
+        # Number of <message> elements open. Only the outermost ones are
+        # messages, whatever the root of the document.
+        depth = 0
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, node in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth > 0:
+                    continue
+                yield node
+                # Free the element and the references kept by its parent.
+                if not keep:
+                    node.clear()
+                parent = node.getparent()
+                if parent != None:
+                    parent.remove(node)
+        parser.close()
+
+
+    def _deserializeMessage(self, node, lazy=False):
         """ Creates an object of type MessageRead from an XML format string.
 
         node: the XML node representing the logbook message.
+        lazy: if true, returns a LazyMessageRead decoding the node on demand.
         Returns: an object of type MessageRead.
         Throws: TBD
         """
+        if lazy:
+            return LazyMessageRead(node)
         message = MessageRead()
+        decoders = self._getDecoders(MessageRead)
+        intern = self.__internPool.intern
         for child in node:
-            attr = getattr(message, message.getTag() + child.tag)
-            if attr != None:
-                attr.deserialize(child)
-            else:
+            decoder = decoders.get(child.tag)
+            if decoder != None:
+                getField, decode, interned = decoder
+                value = decode(child, intern) if interned else decode(child)
+                if value != None:
+                    getField(message).value = value
+            elif isinstance(child.tag, str):
                 logging.error("Unknown XML tag in message: " + child.tag)
         return message
+
+
+    @classmethod
+    def _getDecoders(cls, messageClass):
+        """ Returns the table mapping the XML tags of the fields of a message
+        class to a (field getter, value decoder, interned) tuple.
+
+        The table is built once per class from a prototype message, so
+        deserializing a field costs a dictionary lookup instead of a string
+        concatenation and an attribute lookup by name.
+        """
+        decoders = cls._decoders.get(messageClass)
+        if decoders == None:
+            prototype = messageClass()
+            decoders = dict()
+            for attrName in prototype.getFieldNames():
+                field = getattr(prototype, attrName)
+                tag = field.name.decode('utf-8')
+                decoders[tag] = (operator.attrgetter(attrName), field.decode, tag in INTERNED_FIELDS)
+            cls._decoders[messageClass] = decoders
+        return decoders
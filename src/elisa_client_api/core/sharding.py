@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Time sharding of searches
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : sharding.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         :
+# Description   : Helpers splitting the date range of a search into shards searched
+#                 independently.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: parse the dates of the messages with an explicit format.
+#--------------------------------------------------------------------------------------
+
+import datetime
+import logging
+
+from .dates import parseIsoDate
+
+
+# Format of the dates of the search criteria, e.g. 14-DEC-2012.
+DATE_FORMAT = '%d-%b-%Y'
+# Default number of days of each shard before dense shards are split.
+DEFAULT_SHARD_DAYS = 7
+# Number of months searched by the server if no initial date is given.
+DEFAULT_MONTH_INTERVAL = 3
+
+_UTC = datetime.timezone.utc
+
+
+def parseDate(value):
+    """ Returns the datetime.date of a search date.
+
+    value: a string in DATE_FORMAT (case insensitive), or a datetime.date.
+    Throws: ValueError if the string is not a valid date.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(str(value).strip(), DATE_FORMAT).date()
+
+
+def formatDate(date):
+    """ Returns a datetime.date as a search date, e.g. 14-DEC-2012.
+    """
+    return date.strftime(DATE_FORMAT).upper()
+
+
+def getDateRange(criteria, today=None):
+    """ Returns the first and last day searched by a search criteria, as
+    the server understands them: the initial date defaults to 'interval'
+    months (DEFAULT_MONTH_INTERVAL if None) before the end date, which
+    defaults to today.
+
+    criteria: object of type SearchCriteria.
+    today: datetime.date of today, or None for the current date.
+    Returns: a tuple with two datetime.date.
+    Throws: ValueError if a date is not valid.
+    """
+    end = parseDate(criteria.until) if criteria.until != None else (today or datetime.date.today())
+    if criteria.since != None:
+        return (parseDate(criteria.since), end)
+    months = int(criteria.interval) if criteria.interval != None else DEFAULT_MONTH_INTERVAL
+    year, month = divmod(end.year * 12 + end.month - 1 - months, 12)
+    # Clamp the day to the length of the month, e.g. 31 March - 1 month.
+    day = end.day
+    while True:
+        try:
+            return (datetime.date(year, month + 1, day), end)
+        except ValueError:
+            day -= 1
+
+
+def planShards(start, end, days=DEFAULT_SHARD_DAYS):
+    """ Splits a range of days into consecutive shards of 'days' days.
+
+    Consecutive shards share their boundary day, so that no message is
+    missed whether the server includes the end date or not. The messages
+    of the boundary days are found twice and must be deduplicated.
+
+    start, end: first and last day (datetime.date) of the range.
+    days: number of days of each shard (the last one might be shorter).
+    Returns: a list of (first day, last day) tuples in chronological order.
+    """
+    step = datetime.timedelta(days=max(days, 1))
+    shards = list()
+    while start + step < end:
+        shards.append((start, start + step))
+        start += step
+    shards.append((start, end))
+    return shards
+
+
+def splitShard(shard):
+    """ Splits a shard in two halves sharing their boundary day.
+
+    shard: (first day, last day) tuple.
+    Returns: a list with the two halves, or None if the shard is too
+             short to be split (less than two days).
+    """
+    start, end = shard
+    days = (end - start).days
+    if days < 2:
+        return None
+    middle = start + datetime.timedelta(days=days // 2)
+    return [(start, middle), (middle, end)]
+
+
+def getTimestamp(message):
+    """ Returns the date of a message in seconds since the epoch, or
+    float('-inf') if the message has no valid date (see parseTimestamp()).
+
+    message: object of type MessageRead.
+    """
+    return parseTimestamp(message.date)
+
+
+def parseTimestamp(date):
+    """ Returns an ISO 8601 date sent by the server, e.g.
+    '2012-12-14T12:27:17+01:00', in seconds since the epoch (see
+    dates.parseIsoDate()), or float('-inf') if it is None or not valid.
+    Invalid dates are logged.
+    """
+    if not date:
+        return float('-inf')
+    try:
+        return parseIsoDate(date).timestamp()
+    except ValueError as ex:
+        logging.warning("Date taken as the oldest possible: " + str(ex))
+        return float('-inf')
+
+
+def getDayTimestamp(date):
+    """ Returns the start of a day (datetime.date) in seconds since the
+    epoch, UTC.
+    """
+    return datetime.datetime(date.year, date.month, date.day, tzinfo=_UTC).timestamp()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : HTTP transport
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : transport.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : Transport
+# Description   : Connection-pooled HTTP transport shared by all the requests made
+#                 to the REST server.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: negotiate compressed responses and count the bytes transferred.
+# 17/Oct/2026: add retry policy and circuit breaker.
+# 17/Oct/2026: add timeouts and deadlines.
+# 18/Oct/2026: release the trial request of the circuit breaker on any failure.
+# 18/Oct/2026: rely on the default Accept-Encoding header of requests.
+# 18/Oct/2026: only connection errors, timeouts and 5xx statuses count as failures.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+import threading
+import time
+import requests
+import requests.adapters
+
+
+# Default (connect, read) timeouts in seconds.
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+
+class Transport(object):
+    """ Connection-pooled HTTP transport.
+
+    A single transport is owned by a RestServer and shared by all its
+    requests. Connections are kept alive between requests, so consecutive
+    calls to the same server reuse the TCP connection and its TLS session
+    instead of performing a new handshake each time.
+
+    Compressed responses (gzip, deflate) are negotiated by the default
+    headers of requests and decoded on the fly, also when streamed. The
+    transport counts the bytes received over the wire and the bytes after
+    decoding, see getStats().
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, poolSize=10, retryPolicy=None, circuitBreaker=None, timeout=DEFAULT_TIMEOUT):
+        """ Constructor
+
+        poolSize: maximum number of connections kept alive per host. It should
+                  be at least the number of threads using the transport
+                  concurrently.
+        retryPolicy: object of type RetryPolicy deciding which failed requests
+                     are retried. If None, requests are never retried.
+        circuitBreaker: object of type CircuitBreaker failing requests fast
+                        while the server is down. If None, requests are
+                        always attempted.
+        timeout: seconds to wait for the server, either a number or a
+                 (connect, read) tuple. The read timeout applies to each
+                 read from the connection. None waits forever.
+        """
+        self.__timeout = timeout
+        self.__retryPolicy = retryPolicy
+        self.__circuitBreaker = circuitBreaker
+        self.__session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=poolSize)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+
+        self.__lock = threading.Lock()
+        self.__responses = 0
+        self.__wireBytes = 0
+        self.__decodedBytes = 0
+
+
+    def prepare(self, request):
+        """ Prepares a request to be sent through this transport.
+
+        request: object of type requests.Request.
+        Returns: an object of type requests.PreparedRequest.
+        """
+        return self.__session.prepare_request(request)
+
+
+    def send(self, prepped, stream=False, verify=None, deadline=None):
+        """ Sends a prepared request reusing a pooled connection.
+
+        prepped: object of type requests.PreparedRequest.
+        stream: if true, the response body is not read in advance.
+        verify: whether to verify the server certificate. If None, the
+                session and environment settings are used.
+        deadline: object of type Deadline bounding the time spent, including
+                  retries. If None, only the timeouts apply.
+        Returns: an object of type requests.Response. It might have an error
+                 status if retries are exhausted.
+        Throws: requests.exceptions.RequestException if the request fails.
+                CircuitOpenError if the circuit breaker rejects the request.
+                DeadlineExceededError if the deadline expires.
+        """
+        # Session.send() does not honour the environment (proxies, CA bundle)
+        # by itself, only Session.request() does.
+        settings = self.__session.merge_environment_settings(prepped.url, {}, stream, verify, None)
+        attempt = 0
+        while True:
+            # The deadline is checked before the circuit breaker, which might
+            # let this attempt through as its trial request.
+            if deadline != None:
+                deadline.check()
+                settings['timeout'] = deadline.capTimeout(self.__timeout)
+            else:
+                settings['timeout'] = self.__timeout
+            trial = self.__circuitBreaker != None and self.__circuitBreaker.allowRequest()
+            try:
+                response = self.__session.send(prepped, **settings)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._recordOutcome(False)
+                if not self._retry(prepped, attempt, None, deadline):
+                    raise
+            except BaseException:
+                # Any other failure (e.g. an attachment that cannot be read or
+                # an interruption) says nothing about the server, but must
+                # not leave the trial request of the circuit breaker pending.
+                if trial:
+                    self.__circuitBreaker.releaseTrial()
+                raise
+            else:
+                self._recordOutcome(response.status_code < 500)
+                if not self._retry(prepped, attempt, response, deadline):
+                    break
+                response.close()
+            attempt += 1
+
+        if not stream:
+            self.record(response, len(response.content))
+        return response
+
+
+    def record(self, response, decodedBytes):
+        """ Accounts for a response whose body has been read completely.
+
+        Responses not streamed are accounted for by send(). Streamed responses
+        must be accounted for by the caller once consumed.
+
+        response: object of type requests.Response.
+        decodedBytes: size of the body after decoding.
+        """
+        # The raw response counts the bytes read from the connection, that
+        # is, before decompression.
+        tell = getattr(response.raw, 'tell', None)
+        wireBytes = tell() if tell != None else decodedBytes
+        with self.__lock:
+            self.__responses += 1
+            self.__wireBytes += wireBytes
+            self.__decodedBytes += decodedBytes
+
+
+    def getStats(self):
+        """ Returns the transfer counters.
+
+        Returns: a dictionary with the number of responses received
+                 ('responses'), the size of their bodies as received over
+                 the wire ('wireBytes') and after decompression
+                 ('decodedBytes').
+        """
+        with self.__lock:
+            return {'responses': self.__responses,
+                    'wireBytes': self.__wireBytes,
+                    'decodedBytes': self.__decodedBytes}
+
+
+    def close(self):
+        """ Closes all the pooled connections.
+        """
+        self.__session.close()
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _retry(self, prepped, attempt, response, deadline):
+        """ Waits before retrying a failed attempt if the retry policy and the
+        deadline allow it.
+
+        Returns: True if the request must be sent again.
+        """
+        if self.__retryPolicy == None:
+            return False
+        # A streamed body (e.g. multipart upload) has been consumed and
+        # cannot be sent again.
+        if hasattr(prepped.body, 'read'):
+            return False
+        status = response.status_code if response != None else None
+        if not self.__retryPolicy.isRetryable(prepped.method, attempt, status):
+            return False
+        retryAfter = response.headers.get('Retry-After') if response != None else None
+        delay = self.__retryPolicy.getDelay(attempt, retryAfter)
+        # Do not wait for an attempt that could not complete in time.
+        if deadline != None and delay >= deadline.remaining():
+            return False
+        time.sleep(delay)
+        return True
+
+
+    def _recordOutcome(self, success):
+        if self.__circuitBreaker == None:
+            return
+        if success:
+            self.__circuitBreaker.recordSuccess()
+        else:
+            self.__circuitBreaker.recordFailure()
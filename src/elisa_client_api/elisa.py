@@ -17,32 +17,74 @@
 # 22/Nov/2012: created.
 # 08/Jan/2013: add authentication.
 # 11/Feb/2013: add option to show attributes when searching for messages.
+# 17/Oct/2026: add close() to release the pooled connections.
+# 17/Oct/2026: add retry policy and circuit breaker.
+# 17/Oct/2026: add timeouts and deadlines.
+# 17/Oct/2026: add getMessages() to retrieve several messages at once.
+# 17/Oct/2026: add conditional get cache.
+# 17/Oct/2026: add iterSearchMessages() to stream search results.
+# 17/Oct/2026: add lazy search results.
+# 17/Oct/2026: add interning pool.
+# 17/Oct/2026: add pluggable wire codec.
+# 17/Oct/2026: add searchMessagesTable() returning a columnar table.
+# 17/Oct/2026: add iterMessages() walking all the pages of a search.
+# 17/Oct/2026: retrieve several pages of a search concurrently.
+# 17/Oct/2026: add iterShardedMessages() splitting the date range of a search.
+# 18/Oct/2026: cached objects are copied for each call.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
 from builtins import object
-from elisa_client_api.core.restServer import RestServer
+from elisa_client_api.core.restServer import RestServer, DEFAULT_WORKERS, DEFAULT_CHUNK_SIZE
 from elisa_client_api.core.authentication import Authentication
+from elisa_client_api.core.transport import Transport, DEFAULT_TIMEOUT
+from elisa_client_api.core.deadline import Deadline
+from elisa_client_api.core.sharding import DEFAULT_SHARD_DAYS
 
 
 class Elisa(object):
     """ Interface to the ELisA logbook database.
     """
-    def __init__(self, connection, username=None, password=None, ssocookie=None):
+    def __init__(self, connection, username=None, password=None, ssocookie=None,
+                 retryPolicy=None, circuitBreaker=None, timeout=DEFAULT_TIMEOUT, poolSize=10,
+                 cache=None, internPool=None, codec=None):
         """ Constructor
 
         connection: connection to the logbook database back-end.
         username: user name to be used by ldap.
         password: password to be used with ldap.
         ssocookie: file with the sso-cookie created by auth-get-sso-cookie
+        retryPolicy: object of type RetryPolicy deciding which failed requests
+                     are retried, e.g. RetryPolicy(maxRetries=5). If None,
+                     requests are never retried.
+        circuitBreaker: object of type CircuitBreaker failing requests fast
+                        (CircuitOpenError) while the server is down. If None,
+                        requests are always attempted.
+        timeout: seconds to wait for the server on each request, either a
+                 number or a (connect, read) tuple. None waits forever.
+        poolSize: maximum number of connections kept alive. It bounds the
+                  number of concurrent requests that reuse connections.
+        cache: object of type ValidatorCache keeping the messages, message
+               types and systems affected retrieved. They are revalidated
+               with the server (ETag/Last-Modified) and not downloaded again
+               if unchanged. Each call returns its own copy of the cached
+               objects. If None, nothing is cached.
+        internPool: object of type InternPool sharing the values of the
+                    low-cardinality fields (type, author, systems affected,
+                    options...) across all the messages retrieved by this
+                    client. If None, values are shared within each result.
+        codec: object of type Codec with the wire format, e.g. JsonCodec()
+               for servers offering JSON. If None, XML is used (XmlCodec)
+               and the intern pool given, if any.
         """
         authenticaiton = Authentication(username, password, ssocookie)
-        self._server = RestServer(connection, authenticaiton)
+        transport = Transport(poolSize, retryPolicy, circuitBreaker, timeout)
+        self._server = RestServer(connection, authenticaiton, transport, cache, internPool, codec)
 
     # -----------------------------
     # - Public methods: Interface -
     # -----------------------------
-    def getMessage(self, msgId):
+    def getMessage(self, msgId, deadline=None):
         """ Retrieves the logbook message with the given ID.
 
         This method interacts with the ELisA logbook to retrieve
@@ -50,14 +92,36 @@ class Elisa(object):
         The validity of this criteria is realized at the server side.
 
         msgId: the message ID.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: an object of type MessageRead encapsulating the message
                  with the given ID.
         Throws: ElisaError if accessing the logbook fails.
         """
-        return self._server.getMessage(msgId)
+        return self._server.getMessage(msgId, Deadline.after(deadline))
 
 
-    def getAttachment(self, msgId, attachmentId):
+    def getMessages(self, msgIds, workers=DEFAULT_WORKERS, deadline=None):
+        """ Retrieves the logbook messages with the given IDs.
+
+        The messages are retrieved concurrently over the pooled connections.
+        A message that cannot be retrieved (e.g. an unknown ID) does not
+        abort the retrieval of the others: its error is returned instead.
+
+        msgIds: list of message IDs.
+        workers: maximum number of messages retrieved at the same time. It
+                 should not exceed the pool size given to the constructor.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        Returns: a list with one tuple per ID, in the same order as msgIds,
+                 containing the ID, the object of type MessageRead and the
+                 ElisaError raised. For each ID, either the message or the
+                 error is None.
+        """
+        return self._server.getMessages(msgIds, workers, Deadline.after(deadline))
+
+
+    def getAttachment(self, msgId, attachmentId, deadline=None):
         """ Retrieves the attachment with the given ID for the given message ID.
 
         This method interacts with the ELisA logbook to retrieve the
@@ -70,27 +134,87 @@ class Elisa(object):
 
         msgId: message ID of the attachment to retrieve.
         attachmentId: the attachment ID
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: the attachment.
         Throws: ElisaError if accessing the logbook fails.
         """
-        return self._server.getAttachment(msgId, attachmentId)
+        return self._server.getAttachment(msgId, attachmentId, Deadline.after(deadline))
 
 
-    def getAttachments(self, message):
+    def getAttachments(self, message, workers=DEFAULT_WORKERS, deadline=None):
         """ Retrieves all the attachments for a logbook message.
 
         This method interacts with the ELisA logbook to retrieve
         all the attachments for the message in the arguments.
         The validity of this criteria is realized at the server side.
+        The attachments are retrieved concurrently.
 
         message: object of type MessageRead with the attachment to retrieve.
-        Returns: a list of tuples with the id, name and content of the attachments.
+        workers: maximum number of attachments retrieved at the same time.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        Returns: a list of tuples with the id, name and content of the
+                 attachments, in the same order as message.attachments.
         Throws: ElisaError if accessing the logbook fails.
         """
-        return self._server.getAttachments(message)
+        return self._server.getAttachments(message, workers, Deadline.after(deadline))
 
 
-    def searchMessages(self, criteria, showAttributes=False):
+    def iterAttachment(self, msgId, attachmentId, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None):
+        """ Retrieves the attachment with the given ID for the given message ID
+        in chunks.
+
+        Unlike getAttachment(), the attachment is never held in memory as
+        a whole, so the memory used does not depend on its size.
+
+        msgId: message ID of the attachment to retrieve.
+        attachmentId: the attachment ID
+        chunkSize: maximum size in bytes of each chunk.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        Returns: an iterator over the chunks (bytes) of the attachment.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return self._server.iterAttachment(msgId, attachmentId, chunkSize, Deadline.after(deadline))
+
+
+    def saveAttachment(self, msgId, attachmentId, destination, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None):
+        """ Retrieves the attachment with the given ID for the given message ID
+        and writes it in chunks to a file.
+
+        msgId: message ID of the attachment to retrieve.
+        attachmentId: the attachment ID
+        destination: path of the file to create or a binary file object.
+        chunkSize: maximum size in bytes of each chunk.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        Returns: the number of bytes written.
+        Throws: ElisaError if accessing the logbook fails.
+                IOError if the file cannot be written.
+        """
+        return self._server.saveAttachment(msgId, attachmentId, destination, chunkSize, Deadline.after(deadline))
+
+
+    def saveAttachments(self, message, directory, workers=DEFAULT_WORKERS, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None):
+        """ Retrieves all the attachments for a logbook message and writes
+        them in chunks to a directory, using the attachment names as file
+        names. The attachments are retrieved concurrently.
+
+        message: object of type MessageRead with the attachment to retrieve.
+        directory: path of the directory where the attachments are written.
+        workers: maximum number of attachments retrieved at the same time.
+        chunkSize: maximum size in bytes of each chunk.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        Returns: a list of tuples with the id, name and path of the attachments.
+        Throws: ElisaError if accessing the logbook fails.
+                IOError if a file cannot be written.
+        """
+        return self._server.saveAttachments(message, directory, workers, chunkSize, Deadline.after(deadline))
+
+
+    def searchMessages(self, criteria, showAttributes=False, deadline=None, lazy=False):
         """ Retrieves the logbook messages that match the given search criteria.
 
         This method interacts with the ELisA logbook to retrieve
@@ -102,14 +226,141 @@ class Elisa(object):
                   filter.
         showAttributes: if true, it also returns the option and attachment
                         message fields.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        lazy: if true, the fields of the messages are decoded the first time
+              they are read. It saves time when only a few fields of each
+              message are used (e.g. id, date and subject).
         Returns: a list of objects of type MessageRead encapsulating
                  the messages that meet the search criteria.
         Throws: ElisaError if accessing the logbook fails.
         """
-        return self._server.searchMessages(criteria, showAttributes)
+        return self._server.searchMessages(criteria, showAttributes, Deadline.after(deadline), lazy)
+
+
+    def iterSearchMessages(self, criteria, showAttributes=False, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None, lazy=False):
+        """ Retrieves the logbook messages that match the given search criteria
+        one at a time.
+
+        Same as searchMessages() but the messages are yielded as the response
+        is received and parsed, so memory does not grow with the number of
+        messages found. The connection is held until the iterator is exhausted
+        or closed.
+
+        criteria: object of type SearchCriteria specifying the search
+                  filter.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        chunkSize: maximum size in bytes of the pieces of the response parsed
+                   at a time.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        lazy: if true, the fields of the messages are decoded the first time
+              they are read.
+        Returns: an iterator over objects of type MessageRead encapsulating
+                 the messages that meet the search criteria.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return self._server.iterSearchMessages(criteria, showAttributes, chunkSize, Deadline.after(deadline), lazy)
 
 
-    def insertMessage(self, message):
+    def iterMessages(self, criteria, showAttributes=False, deadline=None, lazy=False, workers=1):
+        """ Retrieves all the logbook messages that match the given search
+        criteria, walking the result pages transparently.
+
+        searchMessages() returns a single page of 'criteria.limit' messages.
+        This method requests the pages one after the other, starting with
+        'criteria.page' (the first one if None), and stops after the first
+        page shorter than the limit. The next page is retrieved and parsed
+        in the background while the messages of the current one are
+        consumed, so long scans run at the speed of the network.
+
+        Large results, e.g. a month of entries, are retrieved faster with
+        several workers: up to 'workers' consecutive pages are then requested
+        at the same time. The messages are still returned in the order of
+        the server, and at most workers - 1 empty pages are requested after
+        the last one.
+
+        criteria: object of type SearchCriteria specifying the search
+                  filter and the page size ('limit', 100 if None). It is
+                  copied and never modified.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        deadline: seconds within which the whole iteration must complete.
+                  If None, only the connection timeouts apply.
+        lazy: if true, the fields of the messages are decoded the first time
+              they are read.
+        workers: maximum number of pages retrieved at the same time. It
+                 should not exceed the pool size given to the constructor.
+        Returns: an iterator over objects of type MessageRead encapsulating
+                 the messages that meet the search criteria.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return self._server.iterMessages(criteria, showAttributes, Deadline.after(deadline), lazy, workers)
+
+
+    def iterShardedMessages(self, criteria, showAttributes=False, deadline=None, lazy=False,
+                            workers=DEFAULT_WORKERS, shardDays=DEFAULT_SHARD_DAYS):
+        """ Retrieves all the logbook messages that match the given search
+        criteria, splitting its date range into smaller searches run
+        concurrently.
+
+        Searches over long periods are slow and might time out on the
+        server. This method searches the period from 'criteria.since' to
+        'criteria.until' (by default, 'criteria.interval' months up to
+        today) in shards of 'shardDays' days. A shard with more messages
+        than a page ('criteria.limit', 100 if None) is split in two until
+        it spans a single day, so dense periods are searched in smaller
+        pieces. The messages are returned once, ordered by date, as soon as
+        the shards that might precede them are complete.
+
+        criteria: object of type SearchCriteria specifying the search
+                  filter. Dates are given as DD-MON-YYYY (e.g. 14-DEC-2012)
+                  or datetime.date. Its page is ignored. It is copied and
+                  never modified.
+        showAttributes: if true, it also returns the option and attachment
+                        message fields.
+        deadline: seconds within which the whole iteration must complete.
+                  If None, only the connection timeouts apply.
+        lazy: if true, the fields of the messages are decoded the first time
+              they are read.
+        workers: maximum number of shards searched at the same time. It
+                 should not exceed the pool size given to the constructor.
+        shardDays: number of days of the initial shards, e.g. 7 for weeks.
+        Returns: an iterator over objects of type MessageRead encapsulating
+                 the messages that meet the search criteria, oldest first.
+        Throws: ElisaError if accessing the logbook fails.
+                ValueError if the dates of the criteria are not valid.
+        """
+        return self._server.iterShardedMessages(criteria, showAttributes, Deadline.after(deadline), lazy,
+                                                workers, shardDays)
+
+
+    def searchMessagesTable(self, criteria, chunkSize=DEFAULT_CHUNK_SIZE, deadline=None, table=None):
+        """ Retrieves the logbook messages that match the given search criteria
+        into a columnar table.
+
+        The table is filled while the response is received and parsed,
+        without creating MessageRead objects. It holds the id, date, type,
+        author, status, has_replies and thread_head of each message plus
+        its systems affected and first level options, and converts to NumPy
+        arrays or a pandas DataFrame without copying.
+
+        criteria: object of type SearchCriteria specifying the search
+                  filter.
+        chunkSize: maximum size in bytes of the pieces of the response parsed
+                   at a time.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        table: object of type MessageTable the messages are appended to, e.g.
+               to gather several searches. If None, a new table is created.
+        Returns: an object of type MessageTable.
+        Throws: ElisaError if accessing the logbook fails.
+        """
+        return self._server.searchMessagesTable(criteria, chunkSize, Deadline.after(deadline), table)
+
+
+    def insertMessage(self, message, deadline=None):
         """ Inserts a logbook message into the ELisA back-end database.
 
         Inserts in the ELisA logbook back-end database the message encapsulated
@@ -118,14 +369,16 @@ class Elisa(object):
         message type
 
         message: object of type MessageWrite to be inserted into the database.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: an object of type MessageRead encapsulating the message
                  inserted into the database.
         Throws: ElisaError if accessing the logbook fails.
         """
-        return self._server.insertMessage(message)
+        return self._server.insertMessage(message, Deadline.after(deadline))
 
 
-    def updateMessage(self, message):
+    def updateMessage(self, message, deadline=None):
         """ Updates a logbook message.
 
         Inserts the updated message encapsulated in the 'message' argument.
@@ -133,14 +386,16 @@ class Elisa(object):
         check is realized at the server side.
 
         message: object of type MessageUpdate to be inserted into the database.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: an object of type MessageRead encapsulating the message
                  updated into the database.
         Throws: ElisaError if updating the message fails.
         """
-        return self._server.updateMessage(message)
+        return self._server.updateMessage(message, Deadline.after(deadline))
 
 
-    def replyToMessage(self, message):
+    def replyToMessage(self, message, deadline=None):
         """ Replies to a logbook message.
 
         Inserts the reply message encapsulated in the 'message' argument.
@@ -149,42 +404,73 @@ class Elisa(object):
 
         message: object of type MessageReply to be inserted into the
                  database.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: an object of type MessageRead encapsulating the message
                  inserted into the database.
         Throws: ElisaError if the reply message could not be inserted.
         """
-        return self._server.replyToMessage(message)
+        return self._server.replyToMessage(message, Deadline.after(deadline))
 
 
-    def getMessageType(self, msgType=None):
+    def getMessageType(self, msgType=None, deadline=None):
         """ Retrieves the possible message types or the options for
         a message type is specified in the argument.
 
         msgType: a message type.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: a list of message types or a dictionary with the options
                  associated to a specific type.
         Throws: ElisaError if accessing the logbook fails.
         """
         if msgType == None:
-            return self._server.getMessageTypes()
+            return self._server.getMessageTypes(Deadline.after(deadline))
         else:
-            return self._server.getTypeOptions(msgType)
+            return self._server.getTypeOptions(msgType, Deadline.after(deadline))
 
 
-    def getSystemsAffected(self, msgType=None):
+    def getSystemsAffected(self, msgType=None, deadline=None):
         """ Retrieves the possible systems affected or the predefined
         systems affected for a given message type if that type is
         specified in the argument.
 
         msgType: a message type.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
         Returns: a list of possible systems affected or a list of
                  predefined systems affected for a given message type.
         Throws: ElisaError if accessing the logbook fails.
         """
         if msgType == None:
-            return self._server.getSystemsAffected()
+            return self._server.getSystemsAffected(Deadline.after(deadline))
         else:
-            return self._server.getPredefinedSystemsAffected(msgType)
+            return self._server.getPredefinedSystemsAffected(msgType, Deadline.after(deadline))
+
+
+    def getTransferStats(self):
+        """ Retrieves the transfer counters since this object was created.
+
+        Responses are requested compressed (gzip or deflate) and decoded
+        transparently. The counters allow comparing the amount of data
+        received over the network with the amount of data decoded.
+
+        Returns: a dictionary with the number of responses received
+                 ('responses'), the size of their bodies as received over
+                 the wire ('wireBytes') and after decompression
+                 ('decodedBytes').
+        """
+        return self._server.getTransferStats()
+
+
+    def close(self):
+        """ Closes the connections to the ELisA logbook.
+
+        Connections are kept alive and reused between calls. This method
+        releases them; the object can still be used afterwards, at the cost
+        of opening new connections.
+        """
+        self._server.close()
 
 
     # ---------------------------
@@ -16,6 +16,9 @@
 # Modification history:
 # 04/Dec/2012: created.
 # 18/Mar/2013: parse the Rest Server error.
+# 17/Oct/2026: add CircuitOpenError.
+# 17/Oct/2026: add DeadlineExceededError.
+# 17/Oct/2026: add MirrorError.
 #--------------------------------------------------------------------------------------
 
 from builtins import str
@@ -69,6 +72,20 @@ class RestServerError(ElisaError):
         super(RestServerError, self).__init__("access to the REST server failed. {0}".format(reason))
 
 
+class CircuitOpenError(RestServerError):
+    """ Exception thrown without contacting the rest server because it
+    failed repeatedly in the recent past.
+    """
+    pass
+
+
+class DeadlineExceededError(RestServerError):
+    """ Exception thrown when an operation does not complete within its
+    deadline.
+    """
+    pass
+
+
 class ArgumentError(ElisaError):
     """ Exception thrown when an argument is wrongly passed to the API
     """
@@ -76,6 +93,14 @@ class ArgumentError(ElisaError):
         super(ArgumentError, self).__init__("wrong argument. {0}".format(argument))
 
 
+class MirrorError(ElisaError):
+    """ Exception thrown when the local mirror of a logbook cannot be read
+    or written.
+    """
+    def __init__(self, reason):
+        super(MirrorError, self).__init__("access to the local mirror failed. {0}".format(reason))
+
+
 class FileError(ElisaError):
     """ Elisa exception thrown when an argument is wrongly passed to the API
     """
@@ -15,6 +15,7 @@
 #--------------------------------------------------------------------------------------
 # Modification history:
 # 27/Nov/2012: created.
+# 17/Oct/2026: use __slots__.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
@@ -25,6 +26,7 @@ from elisa_client_api.core.message import Message
 class MessageInsert(MessageReply):
     """ Class providing accessors for the insert operation.
     """
+    __slots__ = ()
 
     def __init__(self):
         super(MessageInsert, self).__init__(None)
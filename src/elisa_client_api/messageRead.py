@@ -8,13 +8,15 @@
 # Created       : 27/Nov/2012
 # Revision      : 0 $
 #--------------------------------------------------------------------------------------
-# Class         : MessageRead
+# Class         : MessageRead, LazyMessageRead
 # Description   : Class providing accessors for the read operation.
 #--------------------------------------------------------------------------------------
 # Copyright (c) 2012 by University of California, Irvine. All rights reserved.
 #--------------------------------------------------------------------------------------
 # Modification history:
 # 27/Nov/2012: created.
+# 17/Oct/2026: use __slots__.
+# 17/Oct/2026: add LazyMessageRead.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
@@ -24,6 +26,45 @@ from elisa_client_api.core.message import Message
 class MessageRead(Message):
     """ Class providing accessors for the read operation.
     """
+    __slots__ = ()
+
     # All the accesssors are getters and are already defined in Message
     def __init__(self, msgId = None):
         super(MessageRead, self).__init__(msgId)
+
+
+class LazyMessageRead(MessageRead):
+    """ Message read that decodes its fields on first access.
+
+    The message keeps a reference to its parsed XML element and each field
+    is decoded from it the first time it is read, e.g. through its property.
+    Scans reading a few fields (id, date, subject) do not pay for decoding
+    bodies, options and attachments. In exchange, the XML elements are held
+    in memory as long as the messages.
+    """
+    __slots__ = ('_node',)
+
+    # Fields by attribute name: (attribute name, field class, field name).
+    _fieldsByAttr = dict((field[0], field) for field in Message._FIELDS)
+
+    def __init__(self, node):
+        """ Constructor
+
+        node: the XML element of the message.
+        """
+        # The fields are created on demand by __getattr__().
+        self._node = node
+
+
+    def __getattr__(self, name):
+        # Only called when the slot of the field has not been set yet.
+        entry = self._fieldsByAttr.get(name)
+        if entry == None:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        attrName, fieldClass, fieldName = entry
+        field = fieldClass(fieldName)
+        child = self._node.find(fieldName)
+        if child != None:
+            field.deserialize(child)
+        setattr(self, attrName, field)
+        return field
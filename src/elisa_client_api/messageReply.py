@@ -15,6 +15,7 @@
 #--------------------------------------------------------------------------------------
 # Modification history:
 # 27/Nov/2012: created.
+# 17/Oct/2026: use __slots__.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
@@ -25,6 +26,8 @@ from elisa_client_api.core.message import Message
 class MessageReply(MessageUpdate):
     """ Class providing accessors for the reply operation.
     """
+    __slots__ = ()
+
 
     def __init__(self, msgId=None):
         super(MessageReply, self).__init__(msgId)
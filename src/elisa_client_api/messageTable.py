@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Columnar table of logbook messages
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : messageTable.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : MessageTable
+# Description   : Column-oriented container of search results for analytics, with
+#                 NumPy and pandas export.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: parse the dates with an explicit format, logging invalid ones.
+# 18/Oct/2026: store the number of replies in 64 bits.
+#--------------------------------------------------------------------------------------
+
+from builtins import object
+import array
+import datetime
+import logging
+
+from elisa_client_api.core.dates import parseIsoDate
+
+
+# Value stored for missing integers.
+MISSING = -1
+# Value stored for missing dates, the NaT (not a time) of NumPy.
+MISSING_DATE = -2**63
+
+_UTC = datetime.timezone.utc
+
+
+class _Categories(object):
+    """ Dictionary encoding of a string column: each distinct value is
+    stored once and the column holds their codes.
+    """
+    def __init__(self):
+        self.codes = dict()
+        self.values = list()
+
+    def encode(self, value):
+        if value == None:
+            return MISSING
+        code = self.codes.get(value)
+        if code == None:
+            code = self.codes.setdefault(value, len(self.values))
+            self.values.append(value)
+        return code
+
+
+class MessageTable(object):
+    """ Column-oriented table of logbook messages.
+
+    Search results are appended by the deserializer straight into typed
+    arrays, without creating one object per message and field:
+      - 'id', 'thread_head' and 'has_replies' are integer arrays (-1 if
+        missing);
+      - 'date' is an array of seconds since the epoch (UTC), NaT if missing;
+      - 'type', 'author' and 'status' are dictionary encoded: an array of
+        codes (-1 if missing) into a list of distinct values;
+      - 'systems_affected' and the first level 'options' are variable
+        length: their values are flattened in one array of codes and the
+        values of message i are those between offsets[i] and offsets[i+1].
+
+    The arrays support the buffer protocol, so toNumpy() and toPandas()
+    wrap them without copying. While the arrays returned are alive no more
+    messages can be appended (BufferError). NumPy and pandas are only
+    imported by these methods.
+    """
+    # Names of the scalar columns.
+    COLUMNS = ('id', 'date', 'type', 'author', 'status', 'has_replies', 'thread_head')
+
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self):
+        self.__ids = array.array('q')
+        self.__dates = array.array('q')
+        self.__types = array.array('i')
+        self.__authors = array.array('i')
+        self.__statuses = array.array('i')
+        self.__hasReplies = array.array('q')
+        self.__threadHeads = array.array('q')
+        self.__systems = array.array('i')
+        self.__systemsOffsets = array.array('q', [0])
+        self.__optionNames = array.array('i')
+        self.__optionValues = array.array('i')
+        self.__optionsOffsets = array.array('q', [0])
+        # Distinct values of the dictionary encoded columns. The names and
+        # values of the options share one dictionary.
+        self.__typeCategories = _Categories()
+        self.__authorCategories = _Categories()
+        self.__statusCategories = _Categories()
+        self.__systemCategories = _Categories()
+        self.__optionCategories = _Categories()
+
+
+    def __len__(self):
+        return len(self.__ids)
+
+
+    def append(self, msgId, date, msgType, author, status, hasReplies, threadHead,
+               systemsAffected=(), options=()):
+        """ Appends a message. Values are strings as sent by the server, or
+        None if missing.
+
+        msgId, hasReplies, threadHead: integers as strings.
+        date: ISO 8601 date, e.g. '2012-12-14T12:27:17+01:00'.
+        msgType, author, status: strings.
+        systemsAffected: iterable over the systems affected.
+        options: iterable over (name, value) tuples of the first level options.
+        """
+        self.__ids.append(self._toInt(msgId))
+        self.__dates.append(self._toSeconds(date))
+        self.__types.append(self.__typeCategories.encode(msgType))
+        self.__authors.append(self.__authorCategories.encode(author))
+        self.__statuses.append(self.__statusCategories.encode(status))
+        self.__hasReplies.append(self._toInt(hasReplies))
+        self.__threadHeads.append(self._toInt(threadHead))
+        for system in systemsAffected:
+            self.__systems.append(self.__systemCategories.encode(system))
+        self.__systemsOffsets.append(len(self.__systems))
+        for name, value in options:
+            self.__optionNames.append(self.__optionCategories.encode(name))
+            self.__optionValues.append(self.__optionCategories.encode(value))
+        self.__optionsOffsets.append(len(self.__optionNames))
+
+
+    def appendMessage(self, message):
+        """ Appends an object of type MessageRead.
+        """
+        self.append(message.id, message.date, message.type, message.author, message.status,
+                    message.hasReplies, message.threadHead, message.systemsAffected or (),
+                    [(option['name'], option['value']) for option in message.options or ()])
+
+
+    def getColumn(self, name):
+        """ Returns the values of a scalar column as a list, with strings
+        decoded, dates as datetime objects and None for missing values.
+
+        name: one of COLUMNS.
+        """
+        if name in ('type', 'author', 'status'):
+            codes, categories = self._getEncoded(name)
+            return [categories[code] if code != MISSING else None for code in codes]
+        if name == 'date':
+            return [datetime.datetime.fromtimestamp(seconds, _UTC) if seconds != MISSING_DATE else None
+                    for seconds in self.__dates]
+        values = self._getArray(name)
+        return [value if value != MISSING else None for value in values]
+
+
+    def getSystemsAffected(self, index):
+        """ Returns the systems affected of the message at a given row.
+        """
+        start, end = self.__systemsOffsets[index], self.__systemsOffsets[index + 1]
+        return [self.__systemCategories.values[code] for code in self.__systems[start:end]]
+
+
+    def getOptions(self, index):
+        """ Returns the (name, value) tuples of the first level options of
+        the message at a given row.
+        """
+        start, end = self.__optionsOffsets[index], self.__optionsOffsets[index + 1]
+        values = self.__optionCategories.values
+        return [(values[self.__optionNames[i]], values[self.__optionValues[i]]) for i in range(start, end)]
+
+
+    def toNumpy(self):
+        """ Returns the columns as NumPy arrays sharing memory with the table.
+
+        Returns: a dictionary with
+          - the scalar columns (COLUMNS): integer arrays, 'date' as
+            datetime64[s] and the codes of the dictionary encoded columns;
+          - '<column>_categories': the list of distinct values of 'type',
+            'author', 'status', 'systems_affected' and 'options';
+          - 'systems_affected' and 'systems_affected_offsets': the codes of
+            all the systems affected and the offsets of each message;
+          - 'option_names', 'option_values' and 'options_offsets': the codes
+            of all the options and the offsets of each message.
+        Throws: ImportError if NumPy is not installed.
+        """
+        import numpy
+        columns = dict()
+        for name in ('id', 'has_replies', 'thread_head', 'type', 'author', 'status'):
+            columns[name] = numpy.frombuffer(self._getArray(name), dtype=self._getArray(name).typecode)
+        columns['date'] = numpy.frombuffer(self.__dates, dtype='int64').view('datetime64[s]')
+        columns['systems_affected'] = numpy.frombuffer(self.__systems, dtype='i')
+        columns['systems_affected_offsets'] = numpy.frombuffer(self.__systemsOffsets, dtype='q')
+        columns['option_names'] = numpy.frombuffer(self.__optionNames, dtype='i')
+        columns['option_values'] = numpy.frombuffer(self.__optionValues, dtype='i')
+        columns['options_offsets'] = numpy.frombuffer(self.__optionsOffsets, dtype='q')
+        columns['type_categories'] = self.__typeCategories.values
+        columns['author_categories'] = self.__authorCategories.values
+        columns['status_categories'] = self.__statusCategories.values
+        columns['systems_affected_categories'] = self.__systemCategories.values
+        columns['options_categories'] = self.__optionCategories.values
+        return columns
+
+
+    def toPandas(self):
+        """ Returns the scalar columns as a pandas DataFrame.
+
+        Numeric columns wrap the arrays of the table and the dictionary
+        encoded columns become categoricals built from their codes, so no
+        value is converted one by one. The variable length columns are
+        available through toNumpy().
+
+        Throws: ImportError if pandas is not installed.
+        """
+        import pandas
+        columns = self.toNumpy()
+        data = dict()
+        for name in self.COLUMNS:
+            if name in ('type', 'author', 'status'):
+                data[name] = pandas.Categorical.from_codes(columns[name], columns[name + '_categories'])
+            else:
+                data[name] = columns[name]
+        return pandas.DataFrame(data, columns=list(self.COLUMNS), copy=False)
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _getArray(self, name):
+        return {'id': self.__ids, 'date': self.__dates, 'type': self.__types, 'author': self.__authors,
+                'status': self.__statuses, 'has_replies': self.__hasReplies,
+                'thread_head': self.__threadHeads}[name]
+
+
+    def _getEncoded(self, name):
+        categories = {'type': self.__typeCategories, 'author': self.__authorCategories,
+                      'status': self.__statusCategories}[name]
+        return self._getArray(name), categories.values
+
+
+    def _toInt(self, value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return MISSING
+
+
+    def _toSeconds(self, date):
+        if not date:
+            return MISSING_DATE
+        try:
+            return int(parseIsoDate(date).timestamp())
+        except ValueError as ex:
+            logging.warning("Date stored as missing: " + str(ex))
+            return MISSING_DATE
@@ -0,0 +1,503 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Local mirror of a logbook
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : mirror.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : Mirror
+# Description   : Copy of the messages of a logbook in a local SQLite database,
+#                 synchronized incrementally and searched offline.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: add full-text index of the subjects and bodies.
+# 18/Oct/2026: reject messages without valid ID, parse the high-water mark explicitly.
+# 18/Oct/2026: reject invalid IDs when reading messages.
+#--------------------------------------------------------------------------------------
+
+from builtins import str
+from builtins import object
+import logging
+import re
+import sqlite3
+
+from elisa_client_api.core.message import Message
+from elisa_client_api.core.messageField import SimpleField
+from elisa_client_api.core.restServer import DEFAULT_WORKERS, DEFAULT_PAGE_SIZE
+from elisa_client_api.core.dates import parseIsoDate
+from elisa_client_api.core.sharding import (DEFAULT_SHARD_DAYS, getDateRange, formatDate, parseDate,
+                                            parseTimestamp)
+from elisa_client_api.messageRead import MessageRead
+from elisa_client_api.searchCriteria import SearchCriteria
+from elisa_client_api.exception import MirrorError
+
+
+# Default number of messages stored per transaction while synchronizing.
+DEFAULT_BATCH_SIZE = 1000
+
+# Scalar fields stored as columns of the messages table: (attribute name,
+# field class, field name). The ID is the primary key.
+_COLUMNS = tuple(field for field in Message._FIELDS if field[1] == SimpleField and field[2] != 'id')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    {0},
+    timestamp REAL,
+    day TEXT);
+CREATE INDEX IF NOT EXISTS messages_timestamp ON messages (timestamp);
+CREATE INDEX IF NOT EXISTS messages_day ON messages (day);
+CREATE TABLE IF NOT EXISTS systems_affected (
+    message_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    system TEXT,
+    PRIMARY KEY (message_id, position));
+CREATE INDEX IF NOT EXISTS systems_affected_system ON systems_affected (system);
+CREATE TABLE IF NOT EXISTS options (
+    message_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    parent INTEGER,
+    name TEXT,
+    value TEXT,
+    PRIMARY KEY (message_id, position));
+CREATE INDEX IF NOT EXISTS options_name ON options (name, value);
+CREATE TABLE IF NOT EXISTS attachments (
+    message_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    attachment_id TEXT,
+    filename TEXT,
+    link TEXT,
+    PRIMARY KEY (message_id, position));
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT);
+""".format(',\n    '.join(field[2] + ' TEXT' for field in _COLUMNS))
+
+# Full-text index of the subjects and bodies. It is an external content
+# table: the text is only stored in the messages table, and the triggers
+# keep the index up to date whenever it changes.
+_TEXT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_text USING fts5(
+    subject, body, content='messages', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3');
+CREATE TRIGGER IF NOT EXISTS messages_text_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_text (rowid, subject, body) VALUES (new.id, new.subject, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_text_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_text (messages_text, rowid, subject, body) VALUES ('delete', old.id, old.subject, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_text_update AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_text (messages_text, rowid, subject, body) VALUES ('delete', old.id, old.subject, old.body);
+    INSERT INTO messages_text (rowid, subject, body) VALUES (new.id, new.subject, new.body);
+END;
+"""
+
+# Weights of the subject and body in the bm25 ranking of the full-text
+# search: a word in the subject counts as much as five in the body.
+_SUBJECT_WEIGHT = 5.0
+_BODY_WEIGHT = 1.0
+
+# Terms of a full-text query: "quoted phrases" or words, optionally
+# followed by * for prefixes.
+_TEXT_TERMS = re.compile(r'"([^"]*)"(\*?)|([^\s"]+)')
+
+# Maximum number of IDs per query when loading the list fields.
+_IDS_PER_QUERY = 500
+
+
+class Mirror(object):
+    """ Copy of the messages of a logbook in a local SQLite database.
+
+    sync() retrieves from the server the messages dated from the last one
+    stored (the high-water mark) on, and stores them with their systems
+    affected, options and attachment metadata (not their content).
+    searchMessages() then searches the stored messages with the same
+    criteria as the server, without network access.
+
+    searchText() searches the subjects and bodies through a full-text index
+    (SQLite FTS5) updated as messages are stored, and ranks the results.
+
+    Messages are identified by their ID: retrieving a message again replaces
+    the stored copy. Only messages dated from the high-water mark on are
+    retrieved, so later changes to older messages (e.g. status) are not
+    seen unless they are synchronized again with 'since'.
+
+    The object must be used from the thread that created it.
+    """
+    # ------------------
+    # - Public methods -
+    # ------------------
+    def __init__(self, path):
+        """ Constructor
+
+        path: path of the SQLite database file, created if need be, or
+              ':memory:' for a database in memory.
+        Throws: MirrorError if the database cannot be opened.
+        """
+        try:
+            self.__connection = sqlite3.connect(path)
+            # Replacing a message must fire the delete trigger too, to
+            # remove its previous text from the full-text index.
+            self.__connection.execute('PRAGMA recursive_triggers = ON')
+            self.__connection.executescript(_SCHEMA)
+            self.__fullText = self._createTextIndex()
+        except sqlite3.Error as ex:
+            raise MirrorError(str(ex))
+
+
+    def __len__(self):
+        return self._query('SELECT COUNT(*) FROM messages')[0][0]
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+    def close(self):
+        """ Closes the database.
+        """
+        self.__connection.close()
+
+
+    def getHighWaterMark(self):
+        """ Returns the date of the newest message synchronized, as sent by
+        the server (e.g. '2012-12-14T12:27:17+01:00'), or None if nothing
+        was synchronized yet.
+        """
+        rows = self._query("SELECT value FROM sync_state WHERE key = 'high_water_mark'")
+        return rows[0][0] if len(rows) > 0 else None
+
+
+    def sync(self, client, since=None, workers=DEFAULT_WORKERS, shardDays=DEFAULT_SHARD_DAYS, pageSize=DEFAULT_PAGE_SIZE,
+             deadline=None, batchSize=DEFAULT_BATCH_SIZE):
+        """ Retrieves from the server and stores the messages not synchronized
+        yet, with Elisa.iterShardedMessages().
+
+        The search starts on the day of the high-water mark, or on 'since'
+        the first time. Messages are stored oldest first in transactions of
+        'batchSize' messages, each advancing the high-water mark, so an
+        interrupted synchronization resumes where it stopped.
+
+        client: object of type Elisa connected to the logbook.
+        since: initial date of the first synchronization, as DD-MON-YYYY or
+               datetime.date. If None, the last 3 months are retrieved.
+               Ignored once there is a high-water mark.
+        workers: maximum number of searches run at the same time.
+        shardDays: number of days searched by each request.
+        pageSize: maximum number of messages per request.
+        deadline: seconds within which the whole operation must complete.
+                  If None, only the connection timeouts apply.
+        batchSize: number of messages stored per transaction.
+        Returns: the number of messages stored.
+        Throws: ElisaError if accessing the logbook fails.
+                MirrorError if the messages cannot be stored.
+        """
+        criteria = SearchCriteria()
+        criteria.limit = pageSize
+        mark = self.getHighWaterMark()
+        if mark != None:
+            # The day of the mark in the time zone of the server.
+            criteria.since = formatDate(parseIsoDate(mark).date())
+        elif since != None:
+            criteria.since = formatDate(parseDate(since))
+
+        count = 0
+        batch = list()
+        for message in client.iterShardedMessages(criteria, True, deadline, False, workers, shardDays):
+            batch.append(message)
+            if len(batch) >= batchSize:
+                count += self.store(batch, True)
+                batch = list()
+        return count + self.store(batch, True)
+
+
+    def store(self, messages, advanceMark=False):
+        """ Stores messages, replacing the stored copies if any.
+
+        messages: list of objects of type MessageRead, with their attributes.
+        advanceMark: if true, the high-water mark is moved to the newest
+                     message stored if it is newer.
+        Returns: the number of messages stored.
+        Throws: MirrorError if the messages cannot be stored, e.g. one of
+                them has no valid ID. No message is stored then.
+        """
+        columns = ', '.join(['id'] + [field[2] for field in _COLUMNS] + ['timestamp', 'day'])
+        insert = 'INSERT OR REPLACE INTO messages ({0}) VALUES ({1})'.format(
+            columns, ', '.join('?' * (len(_COLUMNS) + 3)))
+        mark = self.getHighWaterMark() if advanceMark else None
+        markTimestamp = parseTimestamp(mark)
+        try:
+            with self.__connection:
+                for message in messages:
+                    try:
+                        msgId = int(message.id)
+                    except (TypeError, ValueError):
+                        raise MirrorError("invalid message ID: " + repr(message.id))
+                    date = message.date
+                    timestamp = parseTimestamp(date)
+                    row = [msgId] + [getattr(message, field[0]).value for field in _COLUMNS]
+                    # Messages without a valid date are stored without day.
+                    if timestamp == float('-inf'):
+                        row += [None, None]
+                    else:
+                        row += [timestamp, date[:10]]
+                    self.__connection.execute(insert, row)
+                    self._storeLists(msgId, message)
+                    if advanceMark and timestamp > markTimestamp:
+                        mark, markTimestamp = date, timestamp
+                if advanceMark and mark != None:
+                    self.__connection.execute("INSERT OR REPLACE INTO sync_state VALUES ('high_water_mark', ?)",
+                                              (mark,))
+        except sqlite3.Error as ex:
+            raise MirrorError(str(ex))
+        return len(messages)
+
+
+    def getMessage(self, msgId):
+        """ Returns the stored message with the given ID.
+
+        msgId: the message ID.
+        Returns: an object of type MessageRead, or None if it is not stored.
+        Throws: MirrorError if the ID is not valid or the database cannot be
+                read.
+        """
+        try:
+            msgId = int(msgId)
+        except (TypeError, ValueError):
+            raise MirrorError("invalid message ID: " + repr(msgId))
+        messages = self._load('WHERE messages.id = ?', [msgId])
+        return messages[0] if len(messages) > 0 else None
+
+
+    def searchMessages(self, criteria=None):
+        """ Retrieves the stored messages that match a search criteria.
+
+        The fields of the criteria filter the messages as follows:
+          - userName, author, type, status: equal values;
+          - subject, body: contain the value, ignoring ASCII case;
+          - systemsAffected: a list, or a comma separated string, of
+            systems; the messages affect at least one of them;
+          - options: a list of 'name=value' strings ('parent.name=value'
+            for inner options) or of dictionaries as built by
+            OptionsBuilder; the messages have all of them;
+          - since, until: first and last day included; interval: number
+            of months before 'until' (or today) if 'since' is None;
+          - limit, page: page size and page number (from 1). Unlike the
+            server, all the messages are returned if limit is None.
+        Fields left to None do not filter, in particular the dates are not
+        restricted to the last months as on the server.
+
+        criteria: object of type SearchCriteria, or None for all the
+                  messages.
+        Returns: a list of objects of type MessageRead, oldest first.
+        Throws: MirrorError if the database cannot be read.
+                ValueError if the dates of the criteria are not valid.
+        """
+        clauses, params = self._getFilters(criteria if criteria != None else SearchCriteria())
+        query = ('WHERE ' + ' AND '.join(clauses) if len(clauses) > 0 else '') + ' ORDER BY timestamp, messages.id'
+        return self._load(query + self._getPage(criteria, params), params)
+
+
+    def searchText(self, text, criteria=None):
+        """ Retrieves the stored messages whose subject or body match a
+        full-text query, the most relevant first.
+
+        The query is made of words, all of which must be found (ignoring
+        case and accents), "quoted phrases" whose words must be found one
+        after the other, and prefixes: words or phrases followed by *, e.g.
+        'trigger "run stop"*' matches 'Trigger rates drop, run stopped'.
+        Results are ranked with bm25, a word found in the subject weighing
+        more than in the body.
+
+        text: the full-text query.
+        criteria: object of type SearchCriteria further filtering the
+                  messages (see searchMessages()), its limit and page
+                  applying to the ranked results, or None.
+        Returns: a list of objects of type MessageRead, best match first.
+        Throws: MirrorError if the database cannot be read or SQLite does
+                not support FTS5.
+                ValueError if the dates of the criteria are not valid.
+        """
+        if not self.__fullText:
+            raise MirrorError("full-text search requires SQLite with FTS5")
+        match = self._getTextQuery(text)
+        if match == None:
+            return []
+        clauses, params = self._getFilters(criteria if criteria != None else SearchCriteria())
+        query = ('JOIN messages_text ON messages_text.rowid = messages.id WHERE messages_text MATCH ?' +
+                 ''.join(' AND ' + clause for clause in clauses) +
+                 ' ORDER BY bm25(messages_text, ?, ?), messages.id')
+        params = [match] + params + [_SUBJECT_WEIGHT, _BODY_WEIGHT]
+        return self._load(query + self._getPage(criteria, params), params)
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _query(self, query, params=()):
+        try:
+            return self.__connection.execute(query, params).fetchall()
+        except sqlite3.Error as ex:
+            raise MirrorError(str(ex))
+
+
+    def _createTextIndex(self):
+        # Returns whether the full-text index is available.
+        exists = self.__connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'messages_text'").fetchone()
+        try:
+            self.__connection.executescript(_TEXT_SCHEMA)
+        except sqlite3.OperationalError as ex:
+            logging.warning("Full-text search disabled: " + str(ex))
+            return False
+        # Databases created before the index existed are indexed once.
+        if exists == None:
+            with self.__connection:
+                self.__connection.execute("INSERT INTO messages_text (messages_text) VALUES ('rebuild')")
+        return True
+
+
+    def _getTextQuery(self, text):
+        # Returns the FTS5 query of a full-text query, or None if it is
+        # empty. Each term is quoted so that no character is taken as FTS5
+        # syntax, and the terms are combined with AND.
+        terms = list()
+        for phrase, prefix, word in _TEXT_TERMS.findall(text or ''):
+            if word:
+                prefix = '*' if word.endswith('*') else ''
+                phrase = word.rstrip('*')
+            if phrase.strip():
+                terms.append('"' + phrase.replace('"', '""') + '"' + prefix)
+        return ' AND '.join(terms) if len(terms) > 0 else None
+
+
+    def _getPage(self, criteria, params):
+        # Returns the LIMIT clause of a criteria and adds its parameters.
+        if criteria == None or criteria.limit == None:
+            return ''
+        limit = int(criteria.limit)
+        page = int(criteria.page) if criteria.page != None else 1
+        params += [limit, (page - 1) * limit]
+        return ' LIMIT ? OFFSET ?'
+
+
+    def _storeLists(self, msgId, message):
+        # The previous copy of the message is replaced as a whole.
+        for table in ('systems_affected', 'options', 'attachments'):
+            self.__connection.execute('DELETE FROM ' + table + ' WHERE message_id = ?', (msgId,))
+        self.__connection.executemany('INSERT INTO systems_affected VALUES (?, ?, ?)',
+                                      [(msgId, i, system) for i, system in enumerate(message.systemsAffected or [])])
+        rows = list()
+        for option in message.options or []:
+            parent = len(rows)
+            rows.append((msgId, parent, None, option.get('name'), option.get('value')))
+            for innerOption in option.get('options') or []:
+                rows.append((msgId, len(rows), parent, innerOption.get('name'), innerOption.get('value')))
+        self.__connection.executemany('INSERT INTO options VALUES (?, ?, ?, ?, ?)', rows)
+        self.__connection.executemany('INSERT INTO attachments VALUES (?, ?, ?, ?, ?)',
+                                      [(msgId, i) + tuple(attachment)
+                                       for i, attachment in enumerate(message.attachments or [])])
+
+
+    def _getFilters(self, criteria):
+        clauses = list()
+        params = list()
+        # Columns are qualified, the full-text index has columns of the same name.
+        for value, clause in ((criteria.userName, 'messages.username = ?'),
+                              (criteria.author, 'messages.author = ?'),
+                              (criteria.type, 'messages.message_type = ?'),
+                              (criteria.status, 'messages.status = ?')):
+            if value != None:
+                clauses.append(clause)
+                params.append(str(value))
+        for value, column in ((criteria.subject, 'messages.subject'), (criteria.body, 'messages.body')):
+            if value != None:
+                clauses.append(column + " LIKE ? ESCAPE '\\'")
+                params.append('%' + str(value).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+        if criteria.systemsAffected != None:
+            systems = criteria.systemsAffected
+            if isinstance(systems, str):
+                systems = [system.strip() for system in systems.split(',')]
+            clauses.append('messages.id IN (SELECT message_id FROM systems_affected WHERE system IN ({0}))'.format(
+                ', '.join('?' * len(systems))))
+            params += [str(system) for system in systems]
+        for parent, name, value in self._getOptionFilters(criteria.options):
+            if parent == None:
+                clauses.append('EXISTS (SELECT 1 FROM options o WHERE o.message_id = messages.id AND '
+                               'o.parent IS NULL AND o.name = ? AND o.value = ?)')
+                params += [name, value]
+            else:
+                clauses.append('EXISTS (SELECT 1 FROM options o JOIN options p ON p.message_id = o.message_id AND '
+                               'p.position = o.parent WHERE o.message_id = messages.id AND p.name = ? AND '
+                               'o.name = ? AND o.value = ?)')
+                params += [parent, name, value]
+        since = parseDate(criteria.since) if criteria.since != None else None
+        if since == None and criteria.interval != None:
+            since = getDateRange(criteria)[0]
+        if since != None:
+            clauses.append('messages.day >= ?')
+            params.append(since.isoformat())
+        if criteria.until != None:
+            clauses.append('messages.day <= ?')
+            params.append(parseDate(criteria.until).isoformat())
+        return clauses, params
+
+
+    def _getOptionFilters(self, options):
+        # Returns the options as (parent name or None, name, value) tuples.
+        if options == None:
+            return []
+        if isinstance(options, (str, dict)):
+            options = [options]
+        filters = list()
+        for option in options:
+            if isinstance(option, dict):
+                filters.append((None, option['name'], str(option['value'])))
+                for innerOption in option.get('options') or []:
+                    filters.append((option['name'], innerOption['name'], str(innerOption['value'])))
+            else:
+                name, value = [part.strip() for part in str(option).split('=', 1)]
+                parent, _, name = name.rpartition('.')
+                filters.append((parent or None, name, value))
+        return filters
+
+
+    def _load(self, query, params):
+        columns = ', '.join('messages.' + column for column in ['id'] + [field[2] for field in _COLUMNS])
+        rows = self._query('SELECT ' + columns + ' FROM messages ' + query, params)
+        messages = dict()
+        for row in rows:
+            message = MessageRead(row[0])
+            for field, value in zip(_COLUMNS, row[1:]):
+                getattr(message, field[0]).value = value
+            messages[row[0]] = message
+        ids = list(messages)
+        for start in range(0, len(ids), _IDS_PER_QUERY):
+            self._loadLists(messages, ids[start:start + _IDS_PER_QUERY])
+        return [messages[msgId] for msgId in ids]
+
+
+    def _loadLists(self, messages, ids):
+        where = ' WHERE message_id IN ({0}) ORDER BY message_id, position'.format(', '.join('?' * len(ids)))
+        for msgId, system in self._query('SELECT message_id, system FROM systems_affected' + where, ids):
+            messages[msgId].systemsAffected.append(system)
+        options = dict()
+        for msgId, position, parent, name, value in self._query(
+                'SELECT message_id, position, parent, name, value FROM options' + where, ids):
+            if parent == None:
+                options[(msgId, position)] = {'name': name, 'value': value, 'options': []}
+                messages[msgId].options.append(options[(msgId, position)])
+            else:
+                options[(msgId, parent)]['options'].append({'name': name, 'value': value})
+        for msgId, attachmentId, filename, link in self._query(
+                'SELECT message_id, attachment_id, filename, link FROM attachments' + where, ids):
+            # Unlike the other lists, attachments are None until set.
+            if messages[msgId].attachments == None:
+                messages[msgId]._attachments.value = list()
+            messages[msgId].attachments.append((attachmentId, filename, link))
@@ -17,6 +17,8 @@
 # Modification history:
 # 14/Jan/2013: created.
 # 04/Feb/2013: attachmentsDst instead of attachPath.
+# 17/Oct/2026: download the attachments concurrently.
+# 17/Oct/2026: stream the attachments to disk in binary mode.
 #--------------------------------------------------------------------------------------
 
 from __future__ import print_function
@@ -35,14 +37,12 @@ __version__ = '.'.join(__version_info__)
 __author__ = 'Raul Murillo Garcia <rmurillo@cern.ch>'
 
 
-def writeAttachments(elisa, message, path, logger):
+def writeAttachments(elisa, message, path, logger, workers):
     try:
-        attachments = elisa.getAttachments(message)
+        # The attachments are streamed to disk, never held in memory.
+        attachments = elisa.saveAttachments(message, path, workers)
         for attachment in attachments:
-            filename = path + attachment[1]
-            with open(filename, "w") as outfile:
-                outfile.write(attachment[2])
-                logger.debug('Attachment ' + attachment[1] + ' stored in ' + path)
+            logger.debug('Attachment ' + attachment[1] + ' stored in ' + attachment[2])
 
     except IOError as ex:
         logger.error(str(ex))
@@ -56,7 +56,7 @@ def main():
                     'ldap', 'logbook', 'id', 'username','author', 'subject',
                     'type', 'systems', 'options', 'body',
                     'status', 'since', 'to',  'attributes',
-                    'interval', 'limit', 'attachmentsDst']
+                    'interval', 'limit', 'attachmentsDst', 'workers']
     mandatoryArgs = []
     parser, cmdlArgs = euh.buildCommandLineArguments(__elisaUtilName__, availableArgs, mandatoryArgs)
 
@@ -92,7 +92,7 @@ def main():
             message = elisa.getMessage(cmdlArgs.id)
             print(message)
             if None != cmdlArgs.attachmentsDst and 0 != message.hasAttachments:
-                writeAttachments(elisa, message, cmdlArgs.attachmentsDst, logger)
+                writeAttachments(elisa, message, cmdlArgs.attachmentsDst, logger, cmdlArgs.workers)
         except ElisaError as ex:
             logger.error(str(ex))
     else:
@@ -120,6 +120,6 @@ def main():
                 print(message)
                 # Any attachments to be saved?
                 if None != cmdlArgs.attachmentsDst and 0 != message.hasAttachments:
-                    writeAttachments(elisa, message, cmdlArgs.attachmentsDst)
+                    writeAttachments(elisa, message, cmdlArgs.attachmentsDst, logger, cmdlArgs.workers)
         except ElisaError as ex:
             logger.error(str(ex))
@@ -17,6 +17,7 @@
 # Modification history:
 # 16/Jan/2013: created.
 # 11/Feb/2013: add option to show attributes when searching for messages.
+# 17/Oct/2026: add option to set the number of concurrent downloads.
 #--------------------------------------------------------------------------------------
 
 
@@ -208,6 +209,12 @@ def buildCommandLineArguments(utilName, cmlArgs, mandatory):
                                                 help='path to download the attachments to. If this option is not ' \
                                                 'specified, the attachments are not downloaded. If a value is not ' \
                                                 'provided for this option, the attachments are stored in the current path'),
+            'workers': lambda: parser.add_option('-w', '--workers',
+                                                type='int',
+                                                dest='workers',
+                                                metavar='COUNT',
+                                                default=4,
+                                                help='maximum number of attachments downloaded at the same time. By default 4.'),
             'attachmentsSrc': lambda: parser.add_option('-m', '--attachment-file',
                                                 type='string',
                                                 action="append",
@@ -17,6 +17,7 @@
 # Modification history:
 # 22/Nov/2012: created.
 # 04/Dec/2012: use properties.
+# 17/Oct/2026: class-level field registry instead of scanning dir() per object.
 #--------------------------------------------------------------------------------------
 
 from __future__ import absolute_import
@@ -31,6 +32,26 @@ class SearchCriteria(object):
     This class provides all the fields required to form a search criteria
     to retrieve logbook messages from the ELisA database.
     """
+    #  The field name is the same as those use in the ELisA server.
+    #  This schema allows for generic code when serializing, deserializing
+    #  and printing the fields.
+    #  Registry of the fields: (attribute name, field name).
+    _FIELDS = (('_limit', 'limit'),                     # Number of entries returned (100 by default).
+               ('_page', 'page'),                       # Page number for results pagination.
+               ('_userName', 'userName'),               # Filter results per user name.
+               ('_author', 'author'),                   # Filter results per author.
+               ('_systemsAffected', 'systems_affected'), # List of system affected to filter entries on.
+               ('_type', 'message_type'),               # Filter per message type.
+               ('_options', 'options'),                 # Filter per message options.
+               ('_subject', 'subject'),                 # Filter results by subject.
+               ('_status', 'status'),                   # Filter results by status.
+               ('_body', 'body'),                       # Filter results by body.
+               ('_since', 'from'),                      # Initial search date.
+               ('_until', 'to'),                        # End search date.
+               ('_interval', 'month_interval'))         # Month interval.
+    #  Attribute names of the fields in alphabetical order.
+    _FIELD_NAMES = tuple(sorted(field[0] for field in _FIELDS))
+
     # ------------------
     # - Public methods -
     # ------------------
@@ -38,22 +59,8 @@ class SearchCriteria(object):
         # -------------------
         # - Data attributes -
         # -------------------
-        #  The field name parameter is the same as those use in the ELisA server.
-        #  This schema allows for generic code when serializing, deserializing
-        #  and printing the fields.
-        self._limit = SearchField('limit')          # Number of entries returned (100 by default).
-        self._page = SearchField('page')            # Page number for results pagination.
-        self._userName = SearchField('userName')    # Filter results per user name.
-        self._author = SearchField('author')        # Filter results per author.
-        self._systemsAffected = SearchField('systems_affected') # List of system affected to filter entries on.
-        self._type = SearchField('message_type')    # Filter per message type.
-        self._options = SearchField('options')      # Filter per message options.
-        self._subject = SearchField('subject')      # Filter results by subject.
-        self._status = SearchField('status')        # Filter results by status.
-        self._body = SearchField('body')            # Filter results by body.
-        self._since = SearchField('from')           # Initial search date.
-        self._until = SearchField('to')             # End search date.
-        self._interval = SearchField('month_interval') # Month interval.
+        for attrName, name in self._FIELDS:
+            setattr(self, attrName, SearchField(name))
 
 
     def __str__(self):
@@ -186,6 +193,6 @@ class SearchCriteria(object):
     # - Private methods -
     # -------------------
     def _getFieldNames(self):
-        return [attr for attr in dir(self) if getattr(self, attr).__class__.__name__ == "SearchField"]
+        return self._FIELD_NAMES
 
 
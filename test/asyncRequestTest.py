@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Unit test for the asynchronous HTTP requests.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : asyncRequestTest.py
+# Author        : DUNE DAQ
+# Created       : 18/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : AsyncRequestTest
+# Description   : Unit test for the asyncio client, run against a local stand-in
+#                 server.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 18/Oct/2026: created.
+# 18/Oct/2026: test the transfer counters.
+# 18/Oct/2026: test the codecs.
+#--------------------------------------------------------------------------------------
+
+import unittest
+import logging
+import asyncio
+import email
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from elisa_client_api.asyncElisa import AsyncElisa
+from elisa_client_api.core.codec import XmlCodec, JsonCodec
+from elisa_client_api.messageInsert import MessageInsert
+from elisa_client_api.searchCriteria import SearchCriteria
+from elisa_client_api.exception import RestServerError, FileError
+
+from requestTest import StubServer, StubHandler
+
+
+class AsyncRequestTest(unittest.TestCase):
+    """ Test for the asyncio client.
+    """
+    def setUp(self):
+        self._stub = StubServer(('127.0.0.1', 0), StubHandler)
+        self._stub.clients = set()
+        self._stub.failures = 0
+        self._stub.delay = 0
+        self._stub.etag = None
+        self._stub.signIn = None
+        self._stub.corrupt = False
+        self._stub.total = 100
+        self._stub.pages = []
+        self._stub.shards = []
+        self._stub.lock = threading.Lock()
+        self._stub.active = 0
+        self._stub.maxActive = 0
+        threading.Thread(target=self._stub.serve_forever).start()
+        self._url = 'http://127.0.0.1:{0}/elisa/api/'.format(self._stub.server_port)
+        self._loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self._loop.close()
+        self._stub.shutdown()
+        self._stub.server_close()
+
+    # -------------------------
+    # - Public methods: tests -
+    # -------------------------
+    def test_getMessage(self):
+        """ Tests the concurrent retrieval of messages over pooled connections.
+        """
+        logging.debug("Testing the operation: getMessage()")
+        async def run():
+            async with AsyncElisa(self._url, 'user', 'password', poolSize=4) as elisa:
+                return await asyncio.gather(*[elisa.getMessage(msgId) for msgId in range(1, 21)])
+        self._stub.delay = 0.05
+        messages = self._run(run())
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(1, 21)])
+        self.assertEqual(messages[0].systemsAffected, ['DAQ'])
+        self.assertEqual(self._stub.maxActive, 4)
+        self.assertEqual(len(self._stub.clients), 4)
+
+
+    def test_searchMessages(self):
+        """ Tests the search of messages.
+        """
+        logging.debug("Testing the operation: searchMessages()")
+        async def run():
+            async with AsyncElisa(self._url, 'user', 'password') as elisa:
+                return await elisa.searchMessages(SearchCriteria()), elisa.getTransferStats()
+        messages, stats = self._run(run())
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(100)])
+        # The response was compressed and is accounted for.
+        self.assertEqual(stats['responses'], 1)
+        self.assertLess(stats['wireBytes'] * 10, stats['decodedBytes'])
+
+
+    def test_codec(self):
+        """ Tests the messages sent and received as JSON, and that responses
+        are decoded out of the event loop.
+        """
+        logging.debug("Testing the codecs.")
+        message = MessageInsert()
+        message.subject = 'Unit test'
+        message.systemsAffected = ['DAQ', 'HLT']
+        async def run(codec):
+            async with AsyncElisa(self._url, 'user', 'password', codec=codec) as elisa:
+                return await elisa.getMessage(3), await elisa.insertMessage(message)
+        read, inserted = self._run(run(JsonCodec()))
+        self.assertEqual((read.id, read.systemsAffected, inserted.id), ('3', ['DAQ'], '1'))
+        contentType, body = self._stub.posted
+        self.assertEqual(contentType, 'application/json')
+        self.assertEqual(json.loads(body.decode()),
+                         {'input_message': {'subject': 'Unit test', 'systems_affected': ['DAQ', 'HLT']}})
+
+        class ThreadCodec(XmlCodec):
+            threads = set()
+            def decode(self, data, lazy=False):
+                self.threads.add(threading.current_thread())
+                return XmlCodec.decode(self, data, lazy)
+        read, inserted = self._run(run(ThreadCodec()))
+        self.assertEqual((read.id, inserted.id), ('3', '1'))
+        self.assertNotIn(threading.current_thread(), ThreadCodec.threads)
+        self.assertGreater(len(ThreadCodec.threads), 0)
+
+
+    def test_insertMessage(self):
+        """ Tests the insertion of a message with an attachment.
+        """
+        logging.debug("Testing the operation: insertMessage()")
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'run.root')
+            with open(path, 'wb') as outfile:
+                outfile.write(os.urandom(300000))
+            message = MessageInsert()
+            message.subject = 'Unit test'
+            message.attachments = [path]
+            async def run():
+                async with AsyncElisa(self._url, 'user', 'password') as elisa:
+                    return await elisa.insertMessage(message)
+            self.assertEqual(self._run(run()).id, '1')
+
+            contentType, body = self._stub.posted
+            parts = email.message_from_bytes(b'Content-Type: ' + contentType.encode() + b'\r\n\r\n' + body).get_payload()
+            self.assertEqual(parts[0].get_param('name', header='content-disposition'), 'message')
+            self.assertIn(b'<subject>Unit test</subject>', parts[0].get_payload(decode=True))
+            self.assertEqual(parts[1].get_filename(), 'run.root')
+            with open(path, 'rb') as infile:
+                self.assertEqual(parts[1].get_payload(decode=True), infile.read())
+
+            # An attachment that cannot be opened is reported as such.
+            message.attachments = [os.path.join(directory, 'missing.root')]
+            self.assertRaises(FileError, self._run, run())
+        finally:
+            shutil.rmtree(directory)
+
+
+    def test_errors(self):
+        """ Tests that HTTP, SSO, decompression, connection and timeout errors
+        are reported as RestServerError.
+        """
+        logging.debug("Testing the error reporting.")
+        async def getMessage(url, msgId, timeout=10):
+            async with AsyncElisa(url, 'user', 'password', timeout=timeout) as elisa:
+                return await elisa.getMessage(msgId)
+
+        with self.assertRaises(RestServerError) as context:
+            self._run(getMessage(self._url, 'unknown'))
+        self.assertIn('HTTP Error 404', str(context.exception))
+
+        self._stub.signIn = 'redirect'
+        with self.assertRaises(RestServerError) as context:
+            self._run(getMessage(self._url, 1))
+        self.assertIn('SSO authentication failed', str(context.exception))
+        self._stub.signIn = None
+
+        self._stub.corrupt = True
+        with self.assertRaises(RestServerError) as context:
+            self._run(getMessage(self._url, 1))
+        self.assertIn('could not be decompressed', str(context.exception))
+        self._stub.corrupt = False
+
+        self._stub.delay = 2
+        start = time.time()
+        self.assertRaises(RestServerError, self._run, getMessage(self._url, 1, (10, 0.2)))
+        self.assertLess(time.time() - start, 1.0)
+
+        self._stub.delay = 0
+        self.assertRaises(RestServerError, self._run, getMessage('http://127.0.0.1:1/elisa/api/', 1))
+
+    # -------------------
+    # - Private methods -
+    # -------------------
+    def _run(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
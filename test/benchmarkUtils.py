@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Helpers shared by the benchmarks.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : benchmarkUtils.py
+# Author        : DUNE DAQ
+# Created       : 18/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Description   : Timing and memory measurements and the sample search result used
+#                 by the benchmarks.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 18/Oct/2026: created.
+#--------------------------------------------------------------------------------------
+
+import gc
+import time
+import tracemalloc
+
+
+MESSAGE_XML = """<message><id>{0}</id><logbook>70</logbook><username>rmurillo</username>
+<author>Raul Murillo</author><date>2012-12-14T12:27:17+01:00</date><subject>Message {0}</subject>
+<message_type>Trigger</message_type><systems_affected><count>2</count><system_affected>HLT</system_affected>
+<system_affected>LVL1</system_affected></systems_affected><options><count>1</count><option>
+<name>Trigger_Area</name><value>Trigger Group</value></option></options>
+<body>Body of the message {0}, long enough to be representative of a shift entry.</body>
+<host>pc-atlas-cr-01</host><has_replies>0</has_replies><reply_to>0</reply_to>
+<has_attachments>1</has_attachments><attachments><count>1</count><attachment><filename>plot.png</filename>
+<ID>{0}</ID><link>http://localhost/elisa/api/messages/{0}/attachments/{0}</link></attachment></attachments>
+<status>closed</status><thread_head>{0}</thread_head><valid>valid</valid><encoding>1</encoding></message>"""
+
+
+def buildDocument(count):
+    """ Returns a search result with 'count' messages, as sent by the server.
+    """
+    return ('<messages>' + ''.join(MESSAGE_XML.format(i) for i in range(count)) + '</messages>').encode('utf-8')
+
+
+def getBestTime(function, argument, repetitions):
+    """ Returns the shortest time in seconds taken by function(argument)
+    out of 'repetitions' calls.
+    """
+    best = None
+    for i in range(repetitions):
+        start = time.perf_counter()
+        function(argument)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best == None else min(best, elapsed)
+    return best
+
+
+def getTracedMemory(build):
+    """ Returns a tuple with the object returned by build() and the bytes
+    allocated by Python that it still holds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Benchmark of the wire codecs.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : codecBenchmark.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Description   : Measures the parse cost per message and the size per message of the
+#                 same search result in each wire format.
+#
+#                 Usage: python codecBenchmark.py [messages] [repetitions]
+#
+#                 New codecs are measured by adding them to CODECS together with a
+#                 function building a list of messages in their format.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: use the helpers shared by the benchmarks.
+#--------------------------------------------------------------------------------------
+
+import json
+import sys
+
+from elisa_client_api.core.codec import XmlCodec, JsonCodec
+
+from benchmarkUtils import buildDocument, getBestTime
+
+
+def buildJson(count):
+    return json.dumps({'messages': [
+        {'id': i, 'logbook': 70, 'username': 'rmurillo', 'author': 'Raul Murillo',
+         'date': '2012-12-14T12:27:17+01:00', 'subject': 'Message {0}'.format(i), 'message_type': 'Trigger',
+         'systems_affected': ['HLT', 'LVL1'],
+         'options': [{'name': 'Trigger_Area', 'value': 'Trigger Group', 'options': []}],
+         'body': 'Body of the message {0}, long enough to be representative of a shift entry.'.format(i),
+         'host': 'pc-atlas-cr-01', 'has_replies': 0, 'reply_to': 0, 'has_attachments': 1,
+         'attachments': [{'filename': 'plot.png', 'ID': i,
+                          'link': 'http://localhost/elisa/api/messages/{0}/attachments/{0}'.format(i)}],
+         'status': 'closed', 'thread_head': i, 'valid': 'valid', 'encoding': 1}
+        for i in range(count)]}).encode('utf-8')
+
+
+# Codecs measured: (name, function decoding a list of messages, function
+# building a document with a number of messages).
+CODECS = [('xml', XmlCodec().decode, buildDocument),
+          ('xml, lazy', lambda document: XmlCodec().decode(document, lazy=True), buildDocument),
+          ('json', JsonCodec().decode, buildJson)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print('{0} messages, best of {1}'.format(count, repetitions))
+    for name, decode, build in CODECS:
+        document = build(count)
+        elapsed = getBestTime(decode, document, repetitions)
+        print('{0:12}: {1:7.2f} us/message, {2:6.0f} bytes/message'.format(
+            name, elapsed * 1e6 / count, float(len(document)) / count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Benchmark of the memory used by the messages.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : memoryBenchmark.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Description   : Measures the memory held by the messages of a search result with
+#                 the current layout (__slots__) and with the previous one (an
+#                 instance dictionary per message and per field).
+#
+#                 Usage: python memoryBenchmark.py [messages]
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: measure the messages without interning.
+# 18/Oct/2026: use the helpers shared by the benchmarks.
+#--------------------------------------------------------------------------------------
+
+import sys
+
+from elisa_client_api.core.serializer import Serializer
+from elisa_client_api.core.intern import InternPool
+
+from benchmarkUtils import buildDocument, getTracedMemory
+
+
+class DictField(object):
+    """ Field with an instance dictionary and its own encoded name, as
+    before __slots__ were used.
+    """
+    def __init__(self, name, value):
+        self.__name = name.encode('utf-8')
+        self.__value = value
+
+
+class DictMessage(object):
+    """ Message with an instance dictionary, as before __slots__ were used.
+    """
+    def __init__(self, message):
+        for attrName in message.getFieldNames():
+            field = getattr(message, attrName)
+            setattr(self, attrName, DictField(field.name.decode('utf-8'), field.value))
+
+
+def measure(name, build, count):
+    messages, size = getTracedMemory(build)
+    print('{0:20}: {1:8.1f} MB, {2:6.0f} bytes/message'.format(name, size / 2.0**20, float(size) / count))
+    return messages
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    # Values are parsed in all cases, only their storage differs.
+    chunks = [buildDocument(count)]
+    print('{0} messages'.format(count))
+    measure('__slots__, interned', lambda: list(Serializer().iterDeserialize(chunks)), count)
+    measure('__slots__', lambda: list(Serializer(InternPool(0)).iterDeserialize(chunks)), count)
+    measure('instance dictionary', lambda: [DictMessage(message) for message in
+                                            Serializer(InternPool(0)).iterDeserialize(chunks)], count)
+
+
+if __name__ == '__main__':
+    main()
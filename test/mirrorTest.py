@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Unit test for the local mirror of a logbook.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : mirrorTest.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : MirrorTest
+# Description   : Unit test for the local mirror, synchronized from a local stand-in
+#                 server.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: test the full-text search.
+# 18/Oct/2026: test the messages without valid ID.
+#--------------------------------------------------------------------------------------
+
+import unittest
+import logging
+import datetime
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+from elisa_client_api.elisa import Elisa
+from elisa_client_api.mirror import Mirror
+from elisa_client_api.messageRead import MessageRead
+from elisa_client_api.searchCriteria import SearchCriteria
+from elisa_client_api.exception import MirrorError
+
+from requestTest import StubServer, StubHandler, messageDate
+
+
+def buildMessage(msgId, date, author='Raul Murillo', systems=None, options=None, attachments=None):
+    message = MessageRead(msgId)
+    message._author.value = author
+    message._date.value = date
+    message._subject.value = 'Run {0} stopped'.format(msgId)
+    message._body.value = 'Body of 100% of message {0}'.format(msgId)
+    message._message_type.value = 'Trigger'
+    message._systems_affected.value = systems
+    message._options.value = options
+    message._attachments.value = attachments
+    return message
+
+
+class MirrorTest(unittest.TestCase):
+    """ Test for the local mirror of a logbook.
+    """
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._directory, 'atlas.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    # -------------------------
+    # - Public methods: tests -
+    # -------------------------
+    def test_store(self):
+        """ Tests that stored messages are read back with all their fields.
+        """
+        logging.debug("Testing the storage of messages.")
+        options = [{'name': 'Trigger_Area', 'value': 'Trigger Group',
+                    'options': [{'name': 'Menu', 'value': 'Physics'}]},
+                   {'name': 'Shifter', 'value': 'Yes', 'options': []}]
+        with Mirror(self._path) as mirror:
+            mirror.store([buildMessage(1, '2012-12-14T12:27:17+01:00', systems=['DAQ', 'HLT'], options=options,
+                                       attachments=[('3', 'plot.png', 'http://localhost/3')]),
+                          buildMessage(2, '2012-12-15T08:00:00+01:00')])
+            self.assertEqual(mirror.getHighWaterMark(), None)
+        with Mirror(self._path) as mirror:
+            self.assertEqual(len(mirror), 2)
+            for msgId in (None, 'unknown'):
+                self.assertRaises(MirrorError, mirror.getMessage, msgId)
+            message = mirror.getMessage(1)
+            self.assertEqual(message.id, '1')
+            self.assertEqual(message.subject, 'Run 1 stopped')
+            self.assertEqual(message.date, '2012-12-14T12:27:17+01:00')
+            self.assertEqual(message.systemsAffected, ['DAQ', 'HLT'])
+            self.assertEqual(message.options, options)
+            self.assertEqual(message.attachments, [('3', 'plot.png', 'http://localhost/3')])
+            self.assertEqual(mirror.getMessage(2).systemsAffected, [])
+            self.assertEqual(mirror.getMessage(3), None)
+
+            # Storing a message again replaces it.
+            mirror.store([buildMessage(1, '2012-12-14T12:27:17+01:00', author='Someone else', systems=['DCS'])])
+            self.assertEqual(len(mirror), 2)
+            for msgId in (None, 'unknown'):
+                self.assertRaises(MirrorError, mirror.getMessage, msgId)
+            self.assertEqual(mirror.getMessage(1).author, 'Someone else')
+            self.assertEqual(mirror.getMessage(1).systemsAffected, ['DCS'])
+            self.assertEqual(mirror.getMessage(1).options, [])
+
+            # Messages without valid ID are rejected with the whole batch.
+            for msgId in (None, 'unknown'):
+                self.assertRaises(MirrorError, mirror.store, [buildMessage(3, '2012-12-16T08:00:00+01:00'),
+                                                              buildMessage(msgId, '2012-12-16T08:00:00+01:00')])
+            self.assertEqual(len(mirror), 2)
+            for msgId in (None, 'unknown'):
+                self.assertRaises(MirrorError, mirror.getMessage, msgId)
+
+
+    def test_searchMessages(self):
+        """ Tests the offline search with the fields of the search criteria.
+        """
+        logging.debug("Testing the offline search.")
+        mirror = Mirror(':memory:')
+        options = [{'name': 'Trigger_Area', 'value': 'Trigger Group',
+                    'options': [{'name': 'Menu', 'value': 'Physics'}]}]
+        mirror.store([buildMessage(i, (datetime.datetime(2012, 12, 1, 10) + datetime.timedelta(days=i)).isoformat(),
+                                   author='Author {0}'.format(i % 2), systems=['DAQ'] if i % 3 == 0 else ['HLT'],
+                                   options=options if i % 5 == 0 else None)
+                      for i in range(30, 0, -1)])
+
+        def search(**fields):
+            criteria = SearchCriteria()
+            for name, value in fields.items():
+                setattr(criteria, name, value)
+            return [int(message.id) for message in mirror.searchMessages(criteria)]
+
+        self.assertEqual([int(message.id) for message in mirror.searchMessages()], list(range(1, 31)))
+        self.assertEqual(search(author='Author 1', systemsAffected='DAQ'), [3, 9, 15, 21, 27])
+        self.assertEqual(search(systemsAffected=['DAQ', 'HLT']), list(range(1, 31)))
+        self.assertEqual(search(subject='RUN 1 '), [1])
+        self.assertEqual(search(body='100%'), list(range(1, 31)))
+        self.assertEqual(search(body='10_%'), [])
+        self.assertEqual(search(options=['Trigger_Area=Trigger Group']), [5, 10, 15, 20, 25, 30])
+        self.assertEqual(search(options=['Trigger_Area.Menu=Physics', 'Trigger_Area=Trigger Group']),
+                         [5, 10, 15, 20, 25, 30])
+        self.assertEqual(search(options=options), [5, 10, 15, 20, 25, 30])
+        self.assertEqual(search(options=['Trigger_Area.Menu=Cosmics']), [])
+        self.assertEqual(search(since='05-DEC-2012', until='07-dec-2012'), [4, 5, 6])
+        self.assertEqual(search(until='31-DEC-2012', interval=0), [30])
+        self.assertEqual(search(limit=4, page=2), [5, 6, 7, 8])
+        mirror.close()
+
+
+    def test_searchText(self):
+        """ Tests the ranked full-text search of the subjects and bodies.
+        """
+        logging.debug("Testing the full-text search.")
+        mirror = Mirror(self._path)
+        texts = [(1, 'Shift summary', 'The run stopped because of a trigger problem.'),
+                 (2, 'Trigger problem', 'Trigger rates dropped, run stopped by the shifter.'),
+                 (3, 'Run stopped', 'Busy from the calorimeter.'),
+                 (4, 'Beam dump', 'Magnet quench, no stop of the run needed.'),
+                 (5, 'Calorimètre', 'Problème de tension.')]
+        messages = list()
+        for msgId, subject, body in texts:
+            message = buildMessage(msgId, '2012-12-0{0}T10:00:00+01:00'.format(msgId), author='Author {0}'.format(msgId % 2))
+            message._subject.value = subject
+            message._body.value = body
+            messages.append(message)
+        mirror.store(messages)
+
+        def search(text, **fields):
+            criteria = SearchCriteria()
+            for name, value in fields.items():
+                setattr(criteria, name, value)
+            return [int(message.id) for message in mirror.searchText(text, criteria)]
+
+        # A word in the subject ranks higher than in the body.
+        self.assertEqual(search('trigger problem'), [2, 1])
+        self.assertEqual(search('"run stopped"'), [3, 1, 2])
+        self.assertEqual(search('"stop of"'), [4])
+        self.assertEqual(search('stop*'), [3, 1, 2, 4])
+        self.assertEqual(search('"run stop"*'), [3, 1, 2])
+        self.assertEqual(search('calorimetre'), [5])
+        self.assertEqual(search('calorimet*'), [5, 3])
+        self.assertEqual(search('stop*', author='Author 0'), [2, 4])
+        self.assertEqual(search('stop*', limit=2, page=2), [2, 4])
+        # FTS5 syntax is taken literally.
+        self.assertEqual(search('run AND'), [])
+        self.assertEqual(search('"'), [])
+        self.assertEqual(mirror.searchText('beam')[0].subject, 'Beam dump')
+
+        # The index follows the messages replaced.
+        messages[3]._subject.value = 'Magnet quench'
+        mirror.store([messages[3]])
+        self.assertEqual(search('beam'), [])
+        self.assertEqual(search('quench'), [4])
+        mirror.close()
+
+        # Databases created without index are indexed when opened.
+        connection = sqlite3.connect(self._path)
+        connection.executescript('DROP TABLE messages_text; DROP TRIGGER messages_text_insert; '
+                                 'DROP TRIGGER messages_text_delete; DROP TRIGGER messages_text_update;')
+        connection.close()
+        with Mirror(self._path) as mirror:
+            self.assertEqual([int(message.id) for message in mirror.searchText('quench')], [4])
+
+
+    def test_sync(self):
+        """ Tests the incremental synchronization from the server.
+        """
+        logging.debug("Testing the synchronization of the mirror.")
+        stub = StubServer(('127.0.0.1', 0), StubHandler)
+        stub.clients = set()
+        stub.failures = 0
+        stub.delay = 0
+        stub.etag = None
+        stub.signIn = None
+        stub.corrupt = False
+        stub.pages = []
+        stub.shards = []
+        stub.lock = threading.Lock()
+        stub.active = 0
+        stub.maxActive = 0
+        stub.total = 100
+        threading.Thread(target=stub.serve_forever).start()
+        client = Elisa('http://127.0.0.1:{0}/elisa/api/'.format(stub.server_port), 'user', 'password')
+        try:
+            with Mirror(self._path) as mirror:
+                # 4 messages a day from 1 January 2012: IDs 0 to 39 in 10 days.
+                stub.total = 40
+                # Yearly shards keep the number of requests low up to today.
+                self.assertEqual(mirror.sync(client, since=datetime.date(2012, 1, 1), shardDays=366, batchSize=7), 40)
+                self.assertEqual(len(mirror), 40)
+                self.assertEqual(mirror.getHighWaterMark(), messageDate(39).isoformat())
+                self.assertEqual(mirror.getMessage(12).systemsAffected, ['DAQ'])
+
+                # The next synchronization starts on the day of the newest message.
+                stub.total = 50
+                stub.shards = []
+                self.assertEqual(mirror.sync(client, shardDays=366), 14)
+                self.assertEqual(min(stub.shards)[0], datetime.date(2012, 1, 10))
+                self.assertEqual(len(mirror), 50)
+                self.assertEqual(mirror.getHighWaterMark(), messageDate(49).isoformat())
+                criteria = SearchCriteria()
+                criteria.since = '12-JAN-2012'
+                self.assertEqual([message.id for message in mirror.searchMessages(criteria)],
+                                 [str(i) for i in range(44, 50)])
+                # The messages synchronized are in the full-text index.
+                self.assertEqual(len(mirror.searchText('"unit test"', criteria)), 6)
+        finally:
+            client.close()
+            stub.shutdown()
+            stub.server_close()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
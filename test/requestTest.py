@@ -0,0 +1,701 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Unit test for the HTTP requests.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : requestTest.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Class         : RequestTest
+# Description   : Unit test for the HTTP requests against a local stand-in server.
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: test the incremental deserialization of search results.
+# 17/Oct/2026: test the JSON codec.
+# 17/Oct/2026: test the columnar search results.
+# 17/Oct/2026: test the detection of the SSO sign-in page.
+# 17/Oct/2026: test the iteration over all the pages of a search.
+# 17/Oct/2026: test the concurrent retrieval of pages.
+# 17/Oct/2026: test the time sharded searches.
+# 18/Oct/2026: test the trial request of the circuit breaker.
+# 18/Oct/2026: test that cached messages are not shared.
+# 18/Oct/2026: test the dates of the columnar tables.
+# 18/Oct/2026: test that sharded searches wait without spinning.
+# 18/Oct/2026: test that local errors do not open the circuit breaker.
+# 18/Oct/2026: test that incomplete codecs cannot be created.
+# 18/Oct/2026: test large reply counts in the columnar tables.
+#--------------------------------------------------------------------------------------
+
+import unittest
+import logging
+import email
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import datetime
+import time
+import threading
+import urllib.parse
+import http.server
+import socketserver
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from elisa_client_api.core.authentication import Authentication
+from elisa_client_api.core.restServer import RestServer
+from elisa_client_api.core.retry import RetryPolicy, CircuitBreaker
+from elisa_client_api.core.transport import Transport
+from elisa_client_api.core.deadline import Deadline
+from elisa_client_api.core.cache import ValidatorCache
+from elisa_client_api.core.codec import Codec, JsonCodec
+from elisa_client_api.core.sharding import getDateRange, planShards, parseTimestamp
+from elisa_client_api.messageInsert import MessageInsert
+from elisa_client_api.messageTable import MessageTable
+from elisa_client_api.searchCriteria import SearchCriteria
+from elisa_client_api.exception import RestServerError, CircuitOpenError, DeadlineExceededError, FileError
+
+
+MESSAGE_XML = """<message><author>Raul Murillo</author><subject>Unit test</subject>
+<id>{0}</id><message_type>Trigger</message_type><systems_affected><count>1</count>
+<system_affected>DAQ</system_affected></systems_affected></message>"""
+
+
+# The stand-in server dates a message every 6 hours from 1 January 2012.
+FIRST_DATE = datetime.datetime(2012, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))
+
+
+def messageDate(msgId):
+    return FIRST_DATE + datetime.timedelta(hours=6 * msgId)
+
+
+def messageJson(msgId):
+    return {'author': 'Raul Murillo', 'subject': 'Unit test', 'id': int(msgId),
+            'message_type': 'Trigger', 'systems_affected': ['DAQ']}
+
+
+SIGN_IN_HTML = b"""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN">
+<html><head><title>CERN Single Sign-On</title></head>
+<body><h1>Sign in with your CERN account</h1></body></html>"""
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """ Minimal stand-in for the ELisA REST server.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.clients.add(self.client_address)
+        with self.server.lock:
+            self.server.active += 1
+            self.server.maxActive = max(self.server.maxActive, self.server.active)
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.active -= 1
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            self.send_response(503)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self._signIn():
+            return
+        parts = self.path.strip('/').split('/')
+        headers = dict()
+        useJson = 'application/json' in self.headers.get('Accept', '')
+        if parts[-1] == 'binary':
+            body = bytes(range(256)) * 4
+            headers['Content-Type'] = 'application/octet-stream'
+        elif 'attachments' in parts:
+            body = ('attachment ' + parts[-1]).encode()
+        elif parts[-1].isdigit() and useJson:
+            body = json.dumps(messageJson(parts[-1])).encode()
+        elif parts[-1].isdigit():
+            body = MESSAGE_XML.format(parts[-1]).encode()
+        elif parts[-1].split('?')[0] == 'messages' and useJson:
+            body = json.dumps({'messages': [messageJson(i) for i in self._getPage()]}).encode()
+        elif parts[-1].split('?')[0] == 'messages' and 'from=' in self.path:
+            body = ('<messages>' + ''.join(MESSAGE_XML.format(i).replace('</message>', '<date>' +
+                    messageDate(i).isoformat() + '</date></message>') for i in self._getPage()) + '</messages>').encode()
+        elif parts[-1].split('?')[0] == 'messages':
+            body = ('<messages>' + ''.join(MESSAGE_XML.format(i) for i in self._getPage()) + '</messages>').encode()
+        else:
+            self.send_error(404)
+            return
+        if self.server.etag != None:
+            if self.headers.get('If-None-Match') == self.server.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            headers['ETag'] = self.server.etag
+        if self.server.corrupt:
+            # Announces a compression the body does not have.
+            headers['Content-Encoding'] = 'gzip'
+        elif 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(200)
+        headers['Content-Length'] = str(len(body))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        self.server.posted = (self.headers['Content-Type'], self.rfile.read(length))
+        if self._signIn():
+            return
+        if 'application/json' in self.headers.get('Accept', ''):
+            body = json.dumps(messageJson(1)).encode()
+        else:
+            body = MESSAGE_XML.format(1).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _getPage(self):
+        # IDs of the messages in the page requested, out of 'total' messages.
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        limit = int(query.get('limit', ['100'])[0])
+        page = int(query.get('page', ['1'])[0])
+        self.server.pages.append(page)
+        msgIds = range(self.server.total)
+        if 'from' in query:
+            # Both days are included, in the time zone of the server.
+            first = datetime.datetime.strptime(query['from'][0], '%d-%b-%Y').replace(tzinfo=FIRST_DATE.tzinfo)
+            last = datetime.datetime.strptime(query['to'][0], '%d-%b-%Y').replace(tzinfo=FIRST_DATE.tzinfo)
+            self.server.shards.append((first.date(), last.date()))
+            msgIds = [i for i in msgIds if first <= messageDate(i) < last + datetime.timedelta(days=1)]
+        return msgIds[(page - 1) * limit:page * limit]
+
+    def _signIn(self):
+        # Answers with the SSO sign-in page, directly or after redirecting
+        # to another host name, if the stub is set to do so.
+        if self.path == '/login':
+            body = b'<html><body>Login</body></html>'
+        elif self.server.signIn == 'page':
+            body = SIGN_IN_HTML
+        elif self.server.signIn == 'redirect':
+            self.send_response(302)
+            self.send_header('Location', 'http://localhost:{0}/login'.format(self.server.server_port))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return True
+        else:
+            return False
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+
+
+class StubServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, clientAddress):
+        # Clients closing the connection on purpose are not errors.
+        pass
+
+
+class RequestTest(unittest.TestCase):
+    """ Test for the HTTP requests.
+    """
+    def setUp(self):
+        self._stub = StubServer(('127.0.0.1', 0), StubHandler)
+        self._stub.clients = set()
+        self._stub.failures = 0
+        self._stub.delay = 0
+        self._stub.etag = None
+        self._stub.signIn = None
+        self._stub.corrupt = False
+        self._stub.total = 100
+        self._stub.pages = []
+        self._stub.shards = []
+        self._stub.lock = threading.Lock()
+        self._stub.active = 0
+        self._stub.maxActive = 0
+        threading.Thread(target=self._stub.serve_forever).start()
+        self._url = 'http://127.0.0.1:{0}/elisa/api/'.format(self._stub.server_port)
+        self._server = RestServer(self._url, Authentication('user', 'password'))
+
+    def tearDown(self):
+        self._server.close()
+        self._stub.shutdown()
+        self._stub.server_close()
+
+    # -------------------------
+    # - Public methods: tests -
+    # -------------------------
+    def test_connectionReuse(self):
+        """ Tests that consecutive requests reuse the same connection.
+        """
+        logging.debug("Testing the connection reuse.")
+        for msgId in range(1, 21):
+            message = self._server.getMessage(msgId)
+            self.assertEqual(message.id, str(msgId))
+        self.assertEqual(self._server.getAttachment(1, 7), b'attachment 7')
+        self.assertEqual(len(self._stub.clients), 1)
+
+
+    def test_getMessages(self):
+        """ Tests the batched retrieval of messages.
+        """
+        logging.debug("Testing the operation: getMessages()")
+        msgIds = [str(i) for i in range(1, 31)] + ['unknown', '31']
+        results = self._server.getMessages(msgIds, workers=8)
+        self.assertEqual([result[0] for result in results], msgIds)
+        self.assertEqual([result[1].id for result in results if result[1] != None],
+                         [str(i) for i in range(1, 32)])
+        self.assertIsInstance(results[30][2], RestServerError)
+        self.assertIn('HTTP Error 404', str(results[30][2]))
+
+
+    def test_cache(self):
+        """ Tests that unchanged messages are served from the cache.
+        """
+        logging.debug("Testing the validator cache.")
+        self._stub.etag = '"v1"'
+        server = RestServer(self._url, Authentication('user', 'password'), cache=ValidatorCache())
+        message = server.getMessage(1)
+        decodedBytes = server.getTransferStats()['decodedBytes']
+        # Modifying a message does not alter the cache.
+        message._systems_affected.value.append('HLT')
+        cached = server.getMessage(1)
+        self.assertIsNot(cached, message)
+        self.assertEqual(cached.systemsAffected, ['DAQ'])
+        self.assertEqual(server.getTransferStats()['decodedBytes'], decodedBytes)
+
+        self._stub.etag = '"v2"'
+        self.assertIsNot(server.getMessage(1), message)
+        self.assertEqual(server.getMessage(1).id, '1')
+        server.close()
+
+
+    def test_getAttachments(self):
+        """ Tests that concurrently retrieved attachments keep their order.
+        """
+        logging.debug("Testing the concurrent retrieval of attachments.")
+        message = self._server.getMessage(1)
+        message._attachments.value = [(str(i), 'plot' + str(i) + '.png', '') for i in range(20)]
+        attachments = self._server.getAttachments(message, workers=8)
+        self.assertEqual([attachment[0] for attachment in attachments], [str(i) for i in range(20)])
+        self.assertEqual([attachment[2] for attachment in attachments],
+                         [('attachment ' + str(i)).encode() for i in range(20)])
+
+
+    def test_saveAttachments(self):
+        """ Tests the streaming of attachments in chunks to files.
+        """
+        logging.debug("Testing the streaming of attachments.")
+        chunks = list(self._server.iterAttachment(1, 7, chunkSize=4))
+        self.assertEqual(chunks, [b'atta', b'chme', b'nt 7'])
+
+        outfile = io.BytesIO()
+        self.assertEqual(self._server.saveAttachment(1, 7, outfile), 12)
+        self.assertEqual(outfile.getvalue(), b'attachment 7')
+
+        message = self._server.getMessage(1)
+        message._attachments.value = [('1', 'a.root', ''), ('2', 'b.tgz', '')]
+        directory = tempfile.mkdtemp()
+        try:
+            attachments = self._server.saveAttachments(message, directory)
+            self.assertEqual([attachment[1] for attachment in attachments], ['a.root', 'b.tgz'])
+            with open(os.path.join(directory, 'b.tgz'), 'rb') as infile:
+                self.assertEqual(infile.read(), b'attachment 2')
+        finally:
+            shutil.rmtree(directory)
+
+
+    def test_multipart(self):
+        """ Tests the streaming multipart upload of attachments.
+        """
+        logging.debug("Testing the multipart upload.")
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'run.root')
+            with open(path, 'wb') as outfile:
+                outfile.write(os.urandom(300000))
+            message = MessageInsert()
+            message.subject = 'Unit test'
+            message.attachments = [path]
+            self.assertEqual(self._server.insertMessage(message).id, '1')
+
+            contentType, body = self._stub.posted
+            parts = email.message_from_bytes(b'Content-Type: ' + contentType.encode() + b'\r\n\r\n' + body).get_payload()
+            self.assertEqual(parts[0].get_param('name', header='content-disposition'), 'message')
+            self.assertIn(b'<subject>Unit test</subject>', parts[0].get_payload(decode=True))
+            self.assertEqual(parts[1].get_filename(), 'run.root')
+            with open(path, 'rb') as infile:
+                self.assertEqual(parts[1].get_payload(decode=True), infile.read())
+        finally:
+            shutil.rmtree(directory)
+
+
+    def test_compression(self):
+        """ Tests that compressed responses are decoded and accounted for.
+        """
+        logging.debug("Testing the compressed responses.")
+        messages = self._server.searchMessages(SearchCriteria(), False)
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(100)])
+        self.assertEqual(b''.join(self._server.iterAttachment(1, 7)), b'attachment 7')
+        stats = self._server.getTransferStats()
+        self.assertEqual(stats['responses'], 2)
+        self.assertLess(stats['wireBytes'] * 10, stats['decodedBytes'])
+
+
+    def test_iterSearchMessages(self):
+        """ Tests that search results are deserialized while they are received.
+        """
+        logging.debug("Testing the incremental deserialization of search results.")
+        messages = self._server.iterSearchMessages(SearchCriteria(), False, chunkSize=64)
+        first = next(messages)
+        self.assertEqual(first.id, '0')
+        self.assertEqual(first.systemsAffected, ['DAQ'])
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(1, 100)])
+        self.assertEqual(self._server.getTransferStats()['responses'], 1)
+
+
+    def test_jsonCodec(self):
+        """ Tests the messages sent and received as JSON.
+        """
+        logging.debug("Testing the JSON codec.")
+        server = RestServer(self._url, Authentication('user', 'password'), codec=JsonCodec())
+        try:
+            message = server.getMessage(3)
+            self.assertEqual(message.id, '3')
+            self.assertEqual(message.systemsAffected, ['DAQ'])
+            messages = server.searchMessages(SearchCriteria(), False)
+            self.assertEqual([message.id for message in messages], [str(i) for i in range(100)])
+            self.assertIs(messages[0].type, messages[1].type)
+            messages = server.iterSearchMessages(SearchCriteria(), False)
+            self.assertEqual(len(list(messages)), 100)
+
+            message = MessageInsert()
+            message.subject = 'Unit test'
+            message.systemsAffected = ['DAQ', 'HLT']
+            self.assertEqual(server.insertMessage(message).id, '1')
+            contentType, body = self._stub.posted
+            self.assertEqual(contentType, 'application/json')
+            self.assertEqual(json.loads(body.decode()),
+                             {'input_message': {'subject': 'Unit test', 'systems_affected': ['DAQ', 'HLT']}})
+        finally:
+            server.close()
+
+        # Incomplete codecs cannot be created.
+        class IncompleteCodec(Codec):
+            def decode(self, data, lazy=False):
+                return None
+        self.assertRaises(TypeError, IncompleteCodec)
+
+
+    def test_iterMessages(self):
+        """ Tests the iteration over all the pages of a search, with the next
+        page retrieved in advance.
+        """
+        logging.debug("Testing the iteration over the pages of a search.")
+        self._stub.total = 250
+        criteria = SearchCriteria()
+        criteria.limit = 100
+        messages = self._server.iterMessages(criteria, False)
+        self.assertEqual(next(messages).id, '0')
+        # The second page is requested while the first one is consumed.
+        start = time.time()
+        while 2 not in self._stub.pages and time.time() - start < 5:
+            time.sleep(0.01)
+        self.assertEqual(self._stub.pages, [1, 2])
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(1, 250)])
+        # The short third page is the last one.
+        self.assertEqual(self._stub.pages, [1, 2, 3])
+        self.assertEqual(criteria.page, None)
+
+        # A full last page is followed by an empty one.
+        self._stub.total = 200
+        self._stub.pages = []
+        criteria.page = 2
+        self.assertEqual([message.id for message in self._server.iterMessages(criteria, False)],
+                         [str(i) for i in range(100, 200)])
+        self.assertEqual(self._stub.pages, [2, 3])
+
+
+    def test_iterMessagesConcurrent(self):
+        """ Tests the concurrent retrieval of the pages of a search.
+        """
+        logging.debug("Testing the concurrent retrieval of pages.")
+        self._stub.total = 1050
+        self._stub.delay = 0.1
+        criteria = SearchCriteria()
+        criteria.limit = 100
+        messages = list(self._server.iterMessages(criteria, False, workers=4))
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(1050)])
+        # No more than 4 pages at a time, and nothing requested after the
+        # last page (11) but the pages in flight.
+        self.assertEqual(self._stub.maxActive, 4)
+        self.assertEqual(sorted(self._stub.pages)[:11], list(range(1, 12)))
+        self.assertLessEqual(max(self._stub.pages), 14)
+
+
+    def test_iterShardedMessages(self):
+        """ Tests the search split into date shards, with dense shards split
+        further and the messages found twice dropped.
+        """
+        logging.debug("Testing the time sharded search.")
+        self._stub.total = 400
+        criteria = SearchCriteria()
+        criteria.since = '01-JAN-2012'
+        criteria.until = '29-feb-2012'
+        criteria.limit = 20
+        messages = list(self._server.iterShardedMessages(criteria, False, workers=4))
+        # 4 messages a day from 1 January to 29 February included.
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(240)])
+        # Weeks have 28 or more messages, more than a page, so they were split.
+        self.assertIn((datetime.date(2012, 1, 1), datetime.date(2012, 1, 8)), self._stub.shards)
+        self.assertIn((datetime.date(2012, 1, 1), datetime.date(2012, 1, 4)), self._stub.shards)
+        self.assertEqual(criteria.limit, 20)
+        self.assertEqual(criteria.since, '01-JAN-2012')
+
+        # Single day shards are read page by page.
+        self._stub.shards = []
+        criteria.since = '02-JAN-2012'
+        criteria.until = '03-JAN-2012'
+        criteria.limit = 3
+        messages = list(self._server.iterShardedMessages(criteria, False, shardDays=1))
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(4, 12)])
+        self.assertEqual(self._stub.shards, [(datetime.date(2012, 1, 2), datetime.date(2012, 1, 3))] * 3)
+
+        # Waiting for a slow first shard while the others are done does not
+        # use the processor.
+        searchMessages = self._server.searchMessages
+        def slowSearchMessages(criteria, *args):
+            if criteria.since == '01-JAN-2012':
+                time.sleep(0.5)
+            return searchMessages(criteria, *args)
+        self._server.searchMessages = slowSearchMessages
+        criteria.since = '01-JAN-2012'
+        criteria.until = '29-JAN-2012'
+        criteria.limit = 100
+        start = time.process_time()
+        messages = list(self._server.iterShardedMessages(criteria, False, workers=4))
+        self.assertEqual([message.id for message in messages], [str(i) for i in range(116)])
+        self.assertLess(time.process_time() - start, 0.25)
+
+        # Range given as a month interval, shards sharing their boundary day.
+        criteria = SearchCriteria()
+        criteria.until = '31-MAR-2012'
+        criteria.interval = 1
+        start, end = getDateRange(criteria)
+        self.assertEqual((start, end), (datetime.date(2012, 2, 29), datetime.date(2012, 3, 31)))
+        self.assertEqual(planShards(start, end, 14), [(datetime.date(2012, 2, 29), datetime.date(2012, 3, 14)),
+                                                      (datetime.date(2012, 3, 14), datetime.date(2012, 3, 28)),
+                                                      (datetime.date(2012, 3, 28), datetime.date(2012, 3, 31))])
+
+        # Messages are merged by their date, whatever its time zone.
+        self.assertEqual(parseTimestamp('2012-12-14T11:27:17.5Z'), parseTimestamp('2012-12-14T12:27:17.5+01:00'))
+        self.assertEqual(parseTimestamp(None), float('-inf'))
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(parseTimestamp('14-DEC-2012'), float('-inf'))
+
+
+    def test_searchMessagesTable(self):
+        """ Tests that search results fill a columnar table, whatever the codec.
+        """
+        logging.debug("Testing the columnar search results.")
+        table = self._server.searchMessagesTable(SearchCriteria(), chunkSize=64)
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table.getColumn('id'), list(range(100)))
+        self.assertEqual(table.getColumn('type'), ['Trigger'] * 100)
+        self.assertEqual(table.getColumn('date'), [None] * 100)
+        self.assertEqual(table.getSystemsAffected(99), ['DAQ'])
+
+        server = RestServer(self._url, Authentication('user', 'password'), codec=JsonCodec())
+        try:
+            server.searchMessagesTable(SearchCriteria(), table=table)
+        finally:
+            server.close()
+        self.assertEqual(len(table), 200)
+        self.assertEqual(table.getColumn('author'), ['Raul Murillo'] * 200)
+
+
+    def test_messageTableDates(self):
+        """ Tests the dates of a columnar table, whatever their time zone.
+        """
+        logging.debug("Testing the dates of the columnar tables.")
+        table = MessageTable()
+        for date in ['2012-12-14T12:27:17+01:00', '2012-12-14T11:27:17Z', '2012-12-14T11:27:17.250Z',
+                     '2012-12-14T06:57:17-0430', '2012-12-14T11:27:17', None]:
+            table.append('1', date, 'Trigger', None, None, '0', '1')
+        utc = datetime.datetime(2012, 12, 14, 11, 27, 17, tzinfo=datetime.timezone.utc)
+        self.assertEqual(table.getColumn('date'), [utc] * 5 + [None])
+        with self.assertLogs(level='WARNING'):
+            table.append('1', '14-DEC-2012', 'Trigger', None, None, '0', '1')
+        self.assertEqual(table.getColumn('date')[-1], None)
+
+        # Large reply counts do not overflow their column.
+        table.append('2', None, 'Trigger', None, None, '300', '1')
+        self.assertEqual(table.getColumn('has_replies')[-2:], [0, 300])
+
+
+    @unittest.skipIf(numpy == None, "NumPy is not installed")
+    def test_searchMessagesTableNumpy(self):
+        """ Tests that the columns of a table are exported without copies.
+        """
+        logging.debug("Testing the NumPy export of the columnar search results.")
+        table = self._server.searchMessagesTable(SearchCriteria())
+        columns = table.toNumpy()
+        self.assertEqual(columns['id'].tolist(), list(range(100)))
+        self.assertEqual(columns['type_categories'], ['Trigger'])
+        self.assertTrue(numpy.isnat(columns['date']).all())
+        self.assertEqual(numpy.diff(columns['systems_affected_offsets']).tolist(), [1] * 100)
+        with self.assertRaises(BufferError):
+            table.append('100', None, 'Trigger', None, None, '0', '100')
+
+
+    def test_retry(self):
+        """ Tests that transient server errors are retried.
+        """
+        logging.debug("Testing the retry policy.")
+        self._stub.failures = 2
+        with self.assertRaises(RestServerError):
+            self._server.getMessage(1)
+
+        self._stub.failures = 2
+        transport = Transport(retryPolicy=RetryPolicy(maxRetries=2, backoffFactor=0))
+        server = RestServer(self._url, Authentication('user', 'password'), transport)
+        self.assertEqual(server.getMessage(1).id, '1')
+        self.assertEqual(self._stub.failures, 0)
+        server.close()
+
+
+    def test_circuitBreaker(self):
+        """ Tests that the circuit breaker fails fast while the server is down.
+        """
+        logging.debug("Testing the circuit breaker.")
+        self._stub.failures = 100
+        transport = Transport(circuitBreaker=CircuitBreaker(failureThreshold=2, resetTimeout=60))
+        server = RestServer(self._url, Authentication('user', 'password'), transport)
+        for i in range(2):
+            self.assertRaises(RestServerError, server.getMessage, 1)
+        self.assertRaises(CircuitOpenError, server.getMessage, 1)
+        self.assertEqual(self._stub.failures, 98)
+        server.close()
+
+
+    def test_circuitBreakerTrial(self):
+        """ Tests that a trial request failing for any reason does not leave
+        the circuit breaker open forever, and that only the failures of the
+        server open it.
+        """
+        logging.debug("Testing the trial request of the circuit breaker.")
+        breaker = CircuitBreaker(failureThreshold=1, resetTimeout=0.1)
+        server = RestServer(self._url, Authentication('user', 'password'), Transport(circuitBreaker=breaker))
+        self._stub.failures = 1
+        self.assertRaises(RestServerError, server.getMessage, 1)
+        self.assertTrue(breaker.isOpen)
+
+        # An expired deadline does not use up the trial request.
+        time.sleep(0.2)
+        self.assertRaises(DeadlineExceededError, server.getMessage, 1, Deadline(0))
+        self.assertEqual(server.getMessage(1).id, '1')
+        self.assertFalse(breaker.isOpen)
+
+        # An attachment that cannot be read is not a failure of the server.
+        directory = tempfile.mkdtemp()
+        try:
+            message = MessageInsert()
+            message.subject = 'Unit test'
+            message.attachments = [directory]
+            for i in range(2):
+                self.assertRaises(FileError, server.insertMessage, message)
+            self.assertFalse(breaker.isOpen)
+            # Neither is a response that cannot be decoded.
+            self._stub.corrupt = True
+            for i in range(2):
+                self.assertRaises(RestServerError, server.getMessage, 1)
+            self._stub.corrupt = False
+            self.assertFalse(breaker.isOpen)
+
+            # Nor does it use up the trial request.
+            self._stub.failures = 1
+            self.assertRaises(RestServerError, server.getMessage, 1)
+            time.sleep(0.2)
+            self.assertRaises(FileError, server.insertMessage, message)
+            self.assertTrue(breaker.isOpen)
+            self.assertEqual(server.getMessage(1).id, '1')
+            self.assertFalse(breaker.isOpen)
+        finally:
+            shutil.rmtree(directory)
+        server.close()
+
+
+    def test_deadline(self):
+        """ Tests that an operation fails once its deadline expires.
+        """
+        logging.debug("Testing the deadline.")
+        message = self._server.getMessage(1)
+        message._attachments.value = [(str(i), 'plot' + str(i) + '.png', '') for i in range(6)]
+        self._stub.delay = 0.2
+        start = time.time()
+        with self.assertRaises(DeadlineExceededError):
+            self._server.getAttachments(message, workers=1, deadline=Deadline(0.5))
+        self.assertLess(time.time() - start, 1.0)
+
+        self._stub.delay = 2
+        start = time.time()
+        self.assertRaises(DeadlineExceededError, self._server.getMessage, 1, Deadline(0.3))
+        self.assertLess(time.time() - start, 1.0)
+
+
+    def test_ssoSignIn(self):
+        """ Tests that the SSO sign-in page is detected on every kind of
+        request, and that binary data is returned as it is.
+        """
+        logging.debug("Testing the detection of the SSO sign-in page.")
+        self.assertEqual(self._server.getAttachment(1, 'binary'), bytes(range(256)) * 4)
+        self.assertEqual(b''.join(self._server.iterAttachment(1, 'binary')), bytes(range(256)) * 4)
+
+        message = MessageInsert()
+        message.subject = 'Unit test'
+        for signIn in ['page', 'redirect']:
+            self._stub.signIn = signIn
+            self.assertRaisesRegex(RestServerError, 'SSO', self._server.getMessage, 1)
+            self.assertRaisesRegex(RestServerError, 'SSO', self._server.searchMessages, SearchCriteria(), False)
+            self.assertRaisesRegex(RestServerError, 'SSO', self._server.insertMessage, message)
+
+        self._stub.signIn = 'page'
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'run.root')
+            with open(path, 'wb') as outfile:
+                outfile.write(b'data')
+            message.attachments = [path]
+            self.assertRaisesRegex(RestServerError, 'SSO', self._server.insertMessage, message)
+        finally:
+            shutil.rmtree(directory)
+
+
+    def test_httpError(self):
+        """ Tests that HTTP errors are reported with their status code.
+        """
+        logging.debug("Testing the HTTP error reporting.")
+        with self.assertRaises(RestServerError) as context:
+            self._server.getMessage('unknown')
+        self.assertIn('HTTP Error 404', str(context.exception))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,9 @@
 #--------------------------------------------------------------------------------------
 # Modification history:
 # 17/Dec/2012: created.
+# 17/Oct/2026: test the lazy deserialization.
+# 17/Oct/2026: test the interning of field values.
+# 18/Oct/2026: test the empty elements of attachments and options.
 #--------------------------------------------------------------------------------------
 
 import unittest
@@ -108,6 +111,57 @@ class SerializeTest(unittest.TestCase):
         self.assertEqual(message.id, '132814')
          
  
+    def test_deserializeLazy(self):
+        """ Tests that lazy messages decode the same fields on demand.
+        """
+        logging.debug("Testing the lazy deserialization of messages.")
+        xmlIn = """<messages><message><id>1</id><subject>First</subject><body>Test</body>
+        <systems_affected><count>1</count><system_affected>DAQ</system_affected></systems_affected>
+        <options><count>1</count><option><name>Trigger_Area</name><value>Online</value>
+        <options><count>1</count><option><name>Trigger_Group</name><value>Muon</value></option></options>
+        </option></options></message><message><id>2</id><subject>Second</subject></message></messages>"""
+        eager = Serializer().deserialize(xmlIn)
+        lazy = Serializer().deserialize(xmlIn, lazy=True)
+        self.assertEqual(lazy[1].subject, 'Second')
+        self.assertEqual(lazy[1].body, None)
+        self.assertEqual(lazy[0].options, [{'name': 'Trigger_Area', 'value': 'Online',
+                                            'options': [{'name': 'Trigger_Group', 'value': 'Muon'}]}])
+        self.assertEqual([str(message) for message in lazy], [str(message) for message in eager])
+        streamed = list(Serializer().iterDeserialize([xmlIn], lazy=True))
+        self.assertEqual([str(message) for message in streamed], [str(message) for message in eager])
+
+
+    def test_deserializeInterned(self):
+        """ Tests that equal low-cardinality values share one string.
+        """
+        logging.debug("Testing the interning of field values.")
+        xmlIn = """<messages>""" + 2 * """<message><author>Raul Murillo</author><body>Test</body>
+        <systems_affected><count>1</count><system_affected>DAQ</system_affected></systems_affected>
+        <options><count>1</count><option><name>Trigger_Area</name><value>Online</value></option></options>
+        </message>""" + """</messages>"""
+        first, second = Serializer().deserialize(xmlIn.encode('utf-8'))
+        self.assertIs(first.author, second.author)
+        self.assertIs(first.systemsAffected[0], second.systemsAffected[0])
+        self.assertIs(first.options[0]['value'], second.options[0]['value'])
+        self.assertIsNot(first.body, second.body)
+
+
+    def test_deserializeEmptyElements(self):
+        """ Tests that empty and missing elements of attachments and options
+        are decoded as None.
+        """
+        logging.debug("Testing the deserialization of empty elements.")
+        xmlIn = """<messages><message><id>1</id>
+        <options><count>2</count><option><name>Shifter</name><value/></option><option><name>Menu</name></option></options>
+        <attachments><count>1</count><attachment><filename>plot.png</filename><ID>3</ID><link></link></attachment></attachments>
+        </message></messages>"""
+        for lazy in (False, True):
+            message = Serializer().deserialize(xmlIn, lazy=lazy)[0]
+            self.assertEqual(message.options, [{'name': 'Shifter', 'value': None, 'options': []},
+                                               {'name': 'Menu', 'value': None, 'options': []}])
+            self.assertEqual(message.attachments, [('3', 'plot.png', None)])
+
+
     def test_serializeConfig(self):
         """ Tests the operation 'search messages'.
         """
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Benchmark of the message deserialization.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : serializerBenchmark.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Description   : Measures the messages deserialized per second from a document with
+#                 a list of messages, as returned by a search.
+#
+#                 Usage: python serializerBenchmark.py [messages] [repetitions]
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 17/Oct/2026: measure lazy messages reading a few fields.
+# 18/Oct/2026: use the helpers shared by the benchmarks.
+#--------------------------------------------------------------------------------------
+
+import sys
+from lxml import etree
+
+from elisa_client_api.core.serializer import Serializer
+from elisa_client_api.messageRead import MessageRead
+
+from benchmarkUtils import buildDocument, getBestTime
+
+
+def legacyDeserialize(xmlStr):
+    """ Deserialization by attribute name lookup, as done before the
+    table-driven dispatch, for comparison.
+    """
+    root = etree.fromstring(xmlStr, parser=etree.XMLParser(recover=True))
+    messages = list()
+    for node in root.findall('message'):
+        message = MessageRead()
+        for child in node:
+            getattr(message, message.getTag() + child.tag).deserialize(child)
+        messages.append(message)
+    return messages
+
+
+def measure(name, function, document, count, repetitions):
+    best = getBestTime(function, document, repetitions)
+    print('{0:20}: {1:10.0f} messages/s'.format(name, count / best))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    document = buildDocument(count)
+    print('{0} messages, {1} bytes, best of {2}'.format(count, len(document), repetitions))
+
+    serializer = Serializer()
+    measure('attribute lookup', legacyDeserialize, document, count, repetitions)
+    measure('deserialize', serializer.deserialize, document, count, repetitions)
+    measure('iterDeserialize', lambda doc: list(serializer.iterDeserialize([doc])), document, count, repetitions)
+    measure('lazy, 3 fields', lambda doc: [(message.id, message.date, message.subject)
+                                           for message in serializer.deserialize(doc, lazy=True)],
+            document, count, repetitions)
+
+
+if __name__ == '__main__':
+    main()
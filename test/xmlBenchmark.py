@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------
+# Title         : Benchmark of the XML engine.
+# Project       : ATLAS, TDAQ, ELisA
+#--------------------------------------------------------------------------------------
+# File          : xmlBenchmark.py
+# Author        : DUNE DAQ
+# Created       : 17/Oct/2026
+# Revision      : 0 $
+#--------------------------------------------------------------------------------------
+# Description   : Compares the lxml pipeline of the serializer (per-thread parsers,
+#                 compiled XPath) with the previous mix of xml.etree.ElementTree and
+#                 lxml on large payloads.
+#
+#                 Usage: python xmlBenchmark.py [items] [repetitions]
+#--------------------------------------------------------------------------------------
+# Modification history:
+# 17/Oct/2026: created.
+# 18/Oct/2026: read the same fields of the messages parsed with both engines.
+# 18/Oct/2026: use the helpers shared by the benchmarks.
+#--------------------------------------------------------------------------------------
+
+import sys
+import xml.etree.ElementTree as ET
+from lxml import etree
+
+from elisa_client_api.core.serializer import Serializer
+from elisa_client_api.messageInsert import MessageInsert
+
+from benchmarkUtils import buildDocument, getBestTime
+
+
+def buildSystemsAffected(count):
+    return ('<systems_affected>' + ''.join('<system_affected>System {0}</system_affected>'.format(i)
+                                           for i in range(count)) + '</systems_affected>').encode('utf-8')
+
+
+def buildTypeOptions(count):
+    inner = ('<options><option><name>Inner</name><type>MULTIPLEVALUE</type><comment>Choose</comment>'
+             '<possible_values>A,B,C</possible_values></option></options>')
+    return ('<options>' + ''.join('<option><name>Option {0}</name><type>SINGLEVALUE</type><comment>Choose</comment>'
+                                  '<possible_values>X,Y</possible_values>{1}</option>'.format(i, inner)
+                                  for i in range(count)) + '</options>').encode('utf-8')
+
+
+def buildMessage():
+    message = MessageInsert()
+    message.author = 'Raul Murillo'
+    message.subject = 'Benchmark'
+    message.body = 'Body of the message, long enough to be representative of a shift entry.'
+    message.type = 'Trigger'
+    message.systemsAffected = ['HLT', 'LVL1']
+    message.options = [{'name': 'Trigger_Area', 'value': 'Trigger Group', 'options': []}]
+    return message
+
+# ------------------------------------------------------------
+# - Previous implementation, parsing with xml.etree or with  -
+# - a new lxml parser per call                               -
+# ------------------------------------------------------------
+def legacyDeserialize(xmlStr):
+    root = ET.fromstring(xmlStr, parser=etree.XMLParser(recover=True))
+    return [(node.findtext('id'), node.findtext('date'), node.findtext('author'), node.findtext('subject'))
+            for node in root.findall('message')]
+
+
+def currentDeserialize(serializer, xmlStr):
+    return [(message.id, message.date, message.author, message.subject)
+            for message in serializer.deserialize(xmlStr, lazy=True)]
+
+
+def legacyDeserializeSystemsAffected(xmlStr):
+    return [child.text for child in ET.fromstring(xmlStr).findall('system_affected')]
+
+
+def legacyDeserializeMessageTypeOptions(xmlStr):
+    opts = list()
+    for optionNode in ET.fromstring(xmlStr).findall('option'):
+        listInnerOpts = list()
+        for innerOptionsNode in optionNode.findall('options'):
+            for innerOptionNode in innerOptionsNode.findall('option'):
+                listInnerOpts.append(dict((k, innerOptionNode.find(k).text if innerOptionNode.find(k) != None else "")
+                                          for k in ['name', 'type', 'comment', 'possible_values']))
+        optionVals = dict((k, optionNode.find(k).text if optionNode.find(k) != None else "")
+                          for k in ['name', 'type', 'comment', 'possible_values'])
+        optionVals['options'] = listInnerOpts if len(listInnerOpts) > 0 else ""
+        opts.append(optionVals)
+    return opts
+
+
+def legacySerialize(message):
+    # Same document as the message fields build, with xml.etree.
+    root = ET.Element('input_message')
+    for attrName in message.getFieldNames():
+        field = getattr(message, attrName)
+        name = field.name.decode('utf-8')
+        if not field.value or name == 'attachments':
+            continue
+        if name == 'systems_affected':
+            node = ET.SubElement(root, name)
+            ET.SubElement(node, 'count').text = str(len(field.value))
+            for system in field.value:
+                ET.SubElement(node, 'system_affected').text = system
+        elif name == 'options':
+            node = ET.SubElement(root, 'options')
+            for option in field.value:
+                optionNode = ET.SubElement(node, 'option')
+                ET.SubElement(optionNode, 'name').text = str(option['name'])
+                ET.SubElement(optionNode, 'value').text = str(option['value'])
+                optionsNode = ET.SubElement(optionNode, 'options')
+                ET.SubElement(optionsNode, 'count').text = str(len(option['options']))
+            ET.SubElement(node, 'count').text = str(len(field.value))
+        else:
+            ET.SubElement(root, name).text = str(field.value)
+    return ET.tostring(root)
+
+
+def compare(name, legacy, current, argument, repetitions):
+    before = getBestTime(legacy, argument, repetitions)
+    after = getBestTime(current, argument, repetitions)
+    print('{0:24}: {1:8.2f} ms -> {2:8.2f} ms ({3:.1f}x)'.format(name, before * 1000, after * 1000, before / after))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    serializer = Serializer()
+    print('{0} items, best of {1}'.format(count, repetitions))
+
+    compare('parse messages, 4 fields', legacyDeserialize, lambda doc: currentDeserialize(serializer, doc),
+            buildDocument(count), repetitions)
+    compare('systems affected', legacyDeserializeSystemsAffected, serializer.deserializeSystemsAffected,
+            buildSystemsAffected(count), repetitions)
+    compare('message type options', legacyDeserializeMessageTypeOptions, serializer.deserializeMessageTypeOptions,
+            buildTypeOptions(count), repetitions)
+    messages = [buildMessage() for i in range(count)]
+    compare('serialize messages', lambda items: [legacySerialize(message) for message in items],
+            lambda items: [serializer.serialize(message, 'input_message') for message in items],
+            messages, repetitions)
+
+
+if __name__ == '__main__':
+    main()